@@ -0,0 +1,528 @@
+# =================================================================
+#
+# Terms and Conditions of Use
+#
+# Unless otherwise noted, computer program source code of this
+# distribution # is covered under Crown Copyright, Government of
+# Canada, and is distributed under the MIT License.
+#
+# The Canada wordmark and related graphics associated with this
+# distribution are protected under trademark law and copyright law.
+# No permission is granted to use them outside the parameters of
+# the Government of Canada's corporate identity program. For
+# more information, see
+# http://www.tbs-sct.gc.ca/fip-pcim/index-eng.asp
+#
+# Copyright title to all 3rd party software distributed with this
+# software is held by the respective copyright holders as noted in
+# those files. Users are asked to read the 3rd Party Licenses
+# referenced with those assets.
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+
+# Seeded synthetic MCF corpus generator
+#
+# Usage: python3 corpus.py OUTPUT_DIR [--size small|medium|large|links]
+#                           [--records N] [--seed N]
+
+import copy
+from datetime import date, datetime, timezone
+import json
+import os
+import random
+
+import click
+import yaml
+
+# record parameters per corpus size
+SIZES = {
+    'small': {
+        'languages': 2,
+        'contacts': 2,
+        'distributions': 2,
+        'keyword_groups': 2,
+        'keywords': 5,
+        'facilities': 1,
+        'observations': 5,
+        'rows': 100
+    },
+    'medium': {
+        'languages': 3,
+        'contacts': 20,
+        'distributions': 50,
+        'keyword_groups': 10,
+        'keywords': 20,
+        'facilities': 5,
+        'observations': 50,
+        'rows': 5000
+    },
+    'large': {
+        'languages': 4,
+        'contacts': 100,
+        'distributions': 500,
+        'keyword_groups': 50,
+        'keywords': 50,
+        'facilities': 20,
+        'observations': 500,
+        'rows': 50000
+    },
+    # records with many (e.g. per-file download) distribution links
+    'links': {
+        'languages': 2,
+        'contacts': 2,
+        'distributions': 5000,
+        'keyword_groups': 2,
+        'keywords': 5,
+        'facilities': 1,
+        'observations': 5,
+        'rows': 100
+    }
+}
+
+LANGUAGES = ['en', 'fr', 'es', 'de']
+
+WORDS = [
+    'air', 'basin', 'climate', 'coastal', 'daily', 'data', 'drought',
+    'forecast', 'glacier', 'hydrometric', 'ice', 'lake', 'marine',
+    'model', 'monthly', 'network', 'ozone', 'precipitation', 'quality',
+    'radar', 'river', 'satellite', 'sea', 'snow', 'soil', 'station',
+    'surface', 'temperature', 'water', 'wind'
+]
+
+ROLES = ['pointOfContact', 'distributor', 'publisher', 'author',
+         'custodian', 'originator']
+
+LINK_TYPES = ['WWW:LINK', 'OGC:WMS', 'OGC:WFS', 'OGC:WCS', 'ESRI:REST']
+
+# read_mcf resolves base_mcf references at most two levels deep
+BASE_MCF_DEPTH_MAX = 2
+
+
+def get_text(rng: random.Random, words: int) -> str:
+    """
+    Generate a random phrase
+
+    :param rng: random number generator
+    :param words: number of words
+
+    :returns: `str` of phrase
+    """
+
+    return ' '.join(rng.choice(WORDS) for _ in range(words))
+
+
+def get_i18n(rng: random.Random, languages: list, words: int) -> dict:
+    """
+    Generate a random multilingual phrase
+
+    :param rng: random number generator
+    :param languages: `list` of language codes
+    :param words: number of words
+
+    :returns: `dict` of language code to phrase
+    """
+
+    text = get_text(rng, words)
+
+    return {language: f'{text} ({language})' for language in languages}
+
+
+def generate_mcf(seed: int = 0, languages: int = 2, contacts: int = 2,
+                 distributions: int = 2, keyword_groups: int = 2,
+                 keywords: int = 5, **kwargs) -> dict:
+    """
+    Generate a synthetic MCF
+
+    :param seed: random seed
+    :param languages: number of languages of multilingual fields
+    :param contacts: number of contacts
+    :param distributions: number of distributions
+    :param keyword_groups: number of keyword groups
+    :param keywords: number of keywords per keyword group and language
+
+    :returns: `dict` of MCF
+    """
+
+    rng = random.Random(seed)
+    languages_ = LANGUAGES[:languages]
+
+    minx = rng.uniform(-180, 170)
+    miny = rng.uniform(-90, 80)
+
+    mcf = {
+        'mcf': {
+            'version': 1.0
+        },
+        'metadata': {
+            'identifier': f'synthetic-{seed}',
+            'language': languages_[0],
+            'charset': 'utf8',
+            'hierarchylevel': 'dataset',
+            'datestamp': date(2024, 1, 1),
+            'dataseturi': f'https://example.org/dataset/{seed}'
+        },
+        'spatial': {
+            'datatype': 'vector',
+            'geomtype': 'point'
+        },
+        'identification': {
+            'language': languages_[0],
+            'charset': 'utf8',
+            'title': get_i18n(rng, languages_, 6),
+            'abstract': get_i18n(rng, languages_, 60),
+            'edition': '1.0',
+            'dates': {
+                'creation': datetime(2000, 1, 1, tzinfo=timezone.utc),
+                'publication': date(2001, 1, 1)
+            },
+            'keywords': {},
+            'topiccategory': ['climatologyMeteorologyAtmosphere'],
+            'extents': {
+                'spatial': [{
+                    'bbox': [round(minx, 3), round(miny, 3),
+                             round(minx + rng.uniform(1, 10), 3),
+                             round(miny + rng.uniform(1, 10), 3)],
+                    'crs': 4326
+                }],
+                'temporal': [{
+                    'begin': date(1950, 1, 1),
+                    'end': 'now',
+                    'resolution': 'P1D'
+                }]
+            },
+            'fees': 'None',
+            'accessconstraints': 'otherRestrictions',
+            'license': {
+                'name': 'CC BY 4.0',
+                'url': 'https://creativecommons.org/licenses/by/4.0'
+            },
+            'rights': get_i18n(rng, languages_, 8),
+            'url': f'https://example.org/dataset/{seed}',
+            'status': 'onGoing',
+            'maintenancefrequency': 'continual'
+        },
+        'acquisition': {
+            'platforms': [{
+                'identifier': 'LANDSAT_8',
+                'description': 'Landsat 8',
+                'instruments': [{
+                    'identifier': 'OLI_TIRS',
+                    'type': 'INS-NOBS'
+                }]
+            }]
+        },
+        'contact': {},
+        'distribution': {}
+    }
+
+    if len(languages_) > 1:
+        mcf['metadata']['language_alternate'] = languages_[1]
+
+    for i in range(keyword_groups):
+        mcf['identification']['keywords'][f'group{i}'] = {
+            'keywords': {
+                language: [f'{get_text(rng, 2)} ({language})'
+                           for _ in range(keywords)]
+                for language in languages_
+            },
+            'keywords_type': 'theme',
+            'vocabulary': {
+                'name': get_i18n(rng, languages_, 2),
+                'url': f'https://example.org/vocabulary/{i}'
+            }
+        }
+
+    for i in range(contacts):
+        role = ROLES[i] if i < len(ROLES) else f'contact{i}'
+        mcf['contact'][role] = {
+            'organization': f'Organization {i % 10}',
+            'url': f'https://example.org/organization/{i % 10}',
+            'individualname': f'Person {i}',
+            'positionname': get_text(rng, 2),
+            'phone': f'+01-123-456-{i:04d}',
+            'fax': f'+01-123-456-{i:04d}',
+            'address': f'{i} Main Street',
+            'city': 'Toronto',
+            'administrativearea': 'Ontario',
+            'postalcode': 'M3H 5T4',
+            'country': 'Canada',
+            'email': f'person{i}@example.org',
+            'hoursofservice': '0700h - 1500h EST',
+            'contactinstructions': 'email'
+        }
+
+    for i in range(distributions):
+        mcf['distribution'][f'dist{i}'] = {
+            'url': f'https://example.org/data/{seed}/{i}',
+            'type': LINK_TYPES[i % len(LINK_TYPES)],
+            'rel': 'item',
+            'name': get_i18n(rng, languages_, 2),
+            'description': get_i18n(rng, languages_, 10),
+            'format': rng.choice(['CSV', 'GeoJSON', 'NetCDF', 'GRIB2']),
+            'format_version': '1.0',
+            'function': 'download'
+        }
+
+    return mcf
+
+
+def generate_wigos_mcf(seed: int = 0, facilities: int = 1,
+                       observations: int = 5, **kwargs) -> dict:
+    """
+    Generate a synthetic WMO WIGOS MCF
+
+    :param seed: random seed
+    :param facilities: number of facilities
+    :param observations: number of observations per facility
+
+    :returns: `dict` of WMO WIGOS MCF
+    """
+
+    rng = random.Random(seed)
+
+    contact = {
+        'organization': 'Organization',
+        'url': 'https://example.org',
+        'individualname': 'Person',
+        'email': 'person@example.org',
+        'country': 'Canada'
+    }
+
+    mcf = {
+        'mcf': {
+            'version': 1.0
+        },
+        'metadata': {
+            'identifier': f'synthetic-wigos-{seed}',
+            'language': 'en',
+            'charset': 'utf8',
+            'datestamp': datetime(2024, 1, 1, tzinfo=timezone.utc)
+        },
+        'contact': {
+            'main': contact,
+            'facility': contact,
+            'record_owner': contact
+        },
+        'facility': {}
+    }
+
+    period = {'begin': date(1999, 11, 11), 'end': 'now'}
+
+    for i in range(facilities):
+        mcf['facility'][f'station{i}'] = {
+            'identifier': f'0-20000-0-{seed}{i:05d}',
+            'name': get_text(rng, 3),
+            'type': 'landFixed',
+            'geopositioning_method': 'GPS',
+            'url': f'https://example.org/facility/{i}',
+            'spatiotemporal': [{
+                'timeperiod': period,
+                'location': {
+                    'geomtype': 'point',
+                    'crs': 4326,
+                    'point': (f'{rng.uniform(-180, 180):.4f},'
+                              f'{rng.uniform(-90, 90):.4f},'
+                              f'{rng.randint(0, 3000)}')
+                }
+            }],
+            'date_established': date(1999, 11, 11),
+            'program_affiliation': [{
+                'program': 'GOS',
+                'reporting_status': [{
+                    'valid_period': period,
+                    'status': 'operational'
+                }]
+            }],
+            'territory': [{'name': 'CAN', 'valid_period': period}],
+            'wmo_region': 'northCentralAmericaCaribbean',
+            'climate_zone': [{
+                'name': 'snowFullyHumidCoolSummer',
+                'valid_period': period
+            }],
+            'surface_cover': [{
+                'name': 'rainfedCroplands',
+                'surface_cover_classification': 'globCover2009',
+                'valid_period': period
+            }],
+            'surface_roughness': [{'name': 'rough', 'valid_period': period}],
+            'topography_bathymetry': [{
+                'local_topography': 'flat',
+                'relative_elevation': 'inapplicable',
+                'topographic_context': 'plains',
+                'altitude_or_depth': 'middleAltitude',
+                'valid_period': period
+            }],
+            'observations': [{
+                'name': get_text(rng, 3),
+                'timeperiod': {
+                    'begin': date(2010, 1, 1),
+                    'end': date(2020, 1, 1)
+                },
+                'observedproperty': {
+                    'type': 'ObservedVariableAtmosphere',
+                    'name': rng.randint(200, 300)
+                },
+                'url': f'https://example.org/data/{i}/{j}'
+            } for j in range(observations)]
+        }
+
+    return mcf
+
+
+def generate_csv(seed: int = 0, rows: int = 100, **kwargs) -> str:
+    """
+    Generate synthetic CSV data (e.g. for CSVW import)
+
+    :param seed: random seed
+    :param rows: number of data rows
+
+    :returns: `str` of CSV data
+    """
+
+    rng = random.Random(seed)
+
+    lines = ['station,date,timestamp,count,temperature,comment']
+    for i in range(rows):
+        lines.append(f'{rng.choice(WORDS)},2024-01-{i % 28 + 1:02d},'
+                     f'2024-01-01T{i % 24:02d}:00:00Z,{rng.randint(0, 999)},'
+                     f'{rng.uniform(-40, 40):.2f},{get_text(rng, 3)}')
+
+    return '\n'.join(lines) + '\n'
+
+
+def generate_openaire(seed: int = 0, contacts: int = 2,
+                      distributions: int = 2, keyword_groups: int = 2,
+                      keywords: int = 5, **kwargs) -> str:
+    """
+    Generate a synthetic OpenAIRE API response of one research product
+    (e.g. for OpenAIRE import)
+
+    :param seed: random seed
+    :param contacts: number of authors
+    :param distributions: number of instances
+    :param keyword_groups: number of subject schemes
+    :param keywords: number of subjects per scheme
+
+    :returns: `str` of OpenAIRE API response
+    """
+
+    rng = random.Random(seed)
+
+    product = {
+        'id': f'synthetic____::{seed:032d}',
+        'type': 'dataset',
+        'mainTitle': get_text(rng, 6),
+        'descriptions': [get_text(rng, 60)],
+        'publicationDate': '2024-01-01',
+        'publisher': 'Publisher',
+        'version': '1',
+        'language': {'code': 'eng', 'label': 'English'},
+        'pids': [{'scheme': 'doi', 'value': f'10.5281/synthetic.{seed}'}],
+        'originalIds': [f'10.5281/synthetic.{seed}'],
+        'bestAccessRight': {'code': 'c_abf2', 'label': 'OPEN'},
+        'authors': [{
+            'fullName': f'Surname{i}, Name{i}',
+            'name': f'Name{i}',
+            'surname': f'Surname{i}',
+            'rank': i + 1
+        } for i in range(contacts)],
+        'subjects': [{
+            'subject': {
+                'scheme': f'scheme{i}',
+                'value': get_text(rng, 2)
+            }
+        } for i in range(keyword_groups) for _ in range(keywords)],
+        'instances': [{
+            'license': 'CC BY',
+            'type': 'Dataset',
+            'urls': [f'https://example.org/data/{seed}/{i}'],
+            'publicationDate': '2024-01-01'
+        } for i in range(distributions)]
+    }
+
+    return json.dumps({
+        'header': {'numFound': 1, 'page': 1, 'pageSize': 1},
+        'results': [product]
+    })
+
+
+def write_mcf_chain(directory: str, mcf: dict,
+                    depth: int = BASE_MCF_DEPTH_MAX) -> str:
+    """
+    Write an MCF to disk as a chain of `base_mcf` files, moving the
+    contacts and distributions into base MCFs
+
+    :param directory: output directory
+    :param mcf: `dict` of MCF
+    :param depth: number of base MCFs (at most `BASE_MCF_DEPTH_MAX`)
+
+    :returns: `str` of filepath of the child MCF
+    """
+
+    depth = min(depth, BASE_MCF_DEPTH_MAX)
+    identifier = mcf['metadata']['identifier']
+
+    documents = [copy.deepcopy(mcf)]
+    for section in ['distribution', 'contact'][:depth]:
+        documents.append({section: documents[0].pop(section)})
+
+    filenames = [f'{identifier}.yml'] + [
+        f'{identifier}.base{i}.yml' for i in range(1, len(documents))]
+
+    for i, document in enumerate(documents):
+        if i + 1 < len(documents):
+            document['base_mcf'] = filenames[i + 1]
+
+        with open(os.path.join(directory, filenames[i]), 'w',
+                  encoding='utf-8') as fh:
+            yaml.safe_dump(document, fh, allow_unicode=True, sort_keys=False)
+
+    return os.path.join(directory, filenames[0])
+
+
+@click.command()
+@click.argument('output-dir', type=click.Path(file_okay=False))
+@click.option('--size', type=click.Choice(list(SIZES)), default='small',
+              help='Size of records')
+@click.option('--records', type=int, default=10,
+              help='Number of records')
+@click.option('--seed', type=int, default=0, help='Random seed')
+@click.option('--depth', type=click.IntRange(0, BASE_MCF_DEPTH_MAX),
+              default=BASE_MCF_DEPTH_MAX,
+              help='Number of base_mcf files per record')
+def corpus(output_dir, size, records, seed, depth):
+    """generate a synthetic MCF corpus"""
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    for i in range(records):
+        mcf = generate_mcf(seed + i, **SIZES[size])
+        click.echo(write_mcf_chain(output_dir, mcf, depth))
+
+
+if __name__ == '__main__':
+    corpus()
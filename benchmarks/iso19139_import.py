@@ -0,0 +1,107 @@
+# =================================================================
+#
+# Terms and Conditions of Use
+#
+# Unless otherwise noted, computer program source code of this
+# distribution # is covered under Crown Copyright, Government of
+# Canada, and is distributed under the MIT License.
+#
+# The Canada wordmark and related graphics associated with this
+# distribution are protected under trademark law and copyright law.
+# No permission is granted to use them outside the parameters of
+# the Government of Canada's corporate identity program. For
+# more information, see
+# http://www.tbs-sct.gc.ca/fip-pcim/index-eng.asp
+#
+# Copyright title to all 3rd party software distributed with this
+# software is held by the respective copyright holders as noted in
+# those files. Users are asked to read the 3rd Party Licenses
+# referenced with those assets.
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+
+# ISO 19139 import engine benchmark
+#
+# Usage: python3 iso19139_import.py [--records N]
+
+import os
+import time
+
+import click
+
+from pygeometa.schemas.iso19139 import IMPORT_ENGINES, ISO19139OutputSchema
+
+THISDIR = os.path.dirname(os.path.realpath(__file__))
+TESTDATA = os.path.join(THISDIR, '..', 'tests')
+
+RECORDS = [
+    '707a02ac-9240-4a2d-afbd-395b69756534.xml',
+    'iso19139-no-bbox.xml',
+    'md-SMJP01RJTD-gmd.xml',
+    'x-wmo-md-int.wmo.wis.ISMD01EDZW.xml'
+]
+
+
+def benchmark(records: list, engine: str, count: int) -> float:
+    """
+    Import records repeatedly with a given engine
+
+    :param records: `list` of metadata strings
+    :param engine: import engine
+    :param count: number of records to import
+
+    :returns: `float` of records per second
+    """
+
+    schema = ISO19139OutputSchema()
+
+    start = time.perf_counter()
+    for i in range(count):
+        schema.import_(records[i % len(records)], engine=engine)
+    elapsed = time.perf_counter() - start
+
+    return count / elapsed
+
+
+@click.command()
+@click.option('--records', type=int, default=2000,
+              help='Number of records to import per engine')
+def iso19139_import(records):
+    """benchmark ISO 19139 import engines"""
+
+    metadata = []
+    for record in RECORDS:
+        with open(os.path.join(TESTDATA, record), encoding='utf-8') as fh:
+            metadata.append(fh.read())
+
+    for engine in IMPORT_ENGINES:
+        rate = benchmark(metadata, engine, records)
+        click.echo(f'{engine}: {rate:.1f} records/s')
+
+
+if __name__ == '__main__':
+    iso19139_import()
@@ -0,0 +1,304 @@
+# =================================================================
+#
+# Terms and Conditions of Use
+#
+# Unless otherwise noted, computer program source code of this
+# distribution # is covered under Crown Copyright, Government of
+# Canada, and is distributed under the MIT License.
+#
+# The Canada wordmark and related graphics associated with this
+# distribution are protected under trademark law and copyright law.
+# No permission is granted to use them outside the parameters of
+# the Government of Canada's corporate identity program. For
+# more information, see
+# http://www.tbs-sct.gc.ca/fip-pcim/index-eng.asp
+#
+# Copyright title to all 3rd party software distributed with this
+# software is held by the respective copyright holders as noted in
+# those files. Users are asked to read the 3rd Party Licenses
+# referenced with those assets.
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+
+# pygeometa benchmark suite
+#
+# Usage: python3 run.py suite [--size SIZE] [--case PATTERN]
+#                             [--output FILE] [--baseline FILE]
+#        python3 run.py corpus OUTPUT_DIR [--size SIZE] [--records N]
+#        python3 run.py iso19139-import [--records N]
+
+import copy
+import fnmatch
+import json
+import logging
+import platform
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Iterator
+
+import click
+
+from pygeometa.core import (prune_distribution_formats,
+                            prune_transfer_option, read_mcf, validate_mcf,
+                            VERSION)
+from pygeometa.helpers import json_dumps
+from pygeometa.profiling import get_size
+from pygeometa.schemas import get_supported_schemas, load_schema
+from pygeometa.schemas.iso19139 import IMPORT_ENGINES
+
+from corpus import (corpus, generate_csv, generate_mcf, generate_openaire,
+                    generate_wigos_mcf, SIZES, write_mcf_chain)
+from iso19139_import import iso19139_import
+
+# schemas not writing core MCFs (wmo-wigos is written from a WIGOS MCF),
+# and iso19139-hnap, whose template cannot render any MCF (its cited
+# responsible party refers to a contact outside of the contact loop)
+SCHEMAS_EXCLUDED = ['iso19139-hnap', 'openaire', 'wmo-wigos']
+
+# input generators of importers not importing their own output
+IMPORT_INPUTS = {
+    'csvw': generate_csv,
+    'openaire': generate_openaire
+}
+
+MIN_ROUNDS = 3
+
+
+def get_cases(size: str, seed: int, tmpdir: str) -> Iterator[tuple]:
+    """
+    Generate benchmark cases of a corpus size
+
+    :param size: corpus size (see `corpus.SIZES`)
+    :param seed: random seed
+    :param tmpdir: directory to write MCF files to
+
+    :returns: iterator of `tuple` of case name, function and argument
+    """
+
+    params = SIZES[size]
+    mcf = generate_mcf(seed, **params)
+
+    yield 'read_mcf', read_mcf, write_mcf_chain(tmpdir, mcf)
+    yield 'validate_mcf', validate_mcf, json.loads(json_dumps(mcf))
+
+    yield ('prune_distribution_formats', prune_distribution_formats,
+           mcf['distribution'])
+
+    transfer_options = {
+        f"{key}_{['eng', 'fra'][i % 2]}-CAN": value
+        for i, (key, value) in enumerate(mcf['distribution'].items())
+    }
+
+    def prune_transfer_option_(transfer_options):
+        return prune_transfer_option(transfer_options, 'eng; CAN')
+
+    yield 'prune_transfer_option', prune_transfer_option_, transfer_options
+
+    for schema in get_supported_schemas():
+        schema_object = load_schema(schema)
+
+        if schema in SCHEMAS_EXCLUDED:
+            continue
+
+        yield f'write[{schema}]', schema_object.write, copy.deepcopy(mcf)
+
+    wigos_mcf = generate_wigos_mcf(seed, **params)
+    yield 'write[wmo-wigos]', load_schema('wmo-wigos').write, wigos_mcf
+
+    for schema in get_supported_schemas():
+        schema_object = load_schema(schema)
+
+        if 'import_' not in type(schema_object).__dict__:
+            continue
+
+        if schema in IMPORT_INPUTS:
+            metadata = IMPORT_INPUTS[schema](seed, **params)
+        else:
+            try:
+                metadata = schema_object.write(copy.deepcopy(mcf))
+            except Exception:
+                continue
+
+        if schema == 'iso19139':
+            for engine in IMPORT_ENGINES:
+                def import_(metadata, engine=engine):
+                    return schema_object.import_(metadata, engine=engine)
+
+                yield f'import[{schema}:{engine}]', import_, metadata
+        else:
+            yield f'import[{schema}]', schema_object.import_, metadata
+
+
+def measure(func: Callable, arg, min_time: float) -> dict:
+    """
+    Measure throughput and peak memory of a function
+
+    :param func: function to benchmark
+    :param arg: function argument
+    :param min_time: minimum time in seconds to run the function for
+
+    :returns: `dict` of calls per second (`rate`), mean time in
+              milliseconds (`mean`), peak traced memory in KiB (`peak`)
+              and output size in bytes (`bytes`)
+    """
+
+    func(arg)
+
+    count = 0
+    start = time.perf_counter()
+    while True:
+        result = func(arg)
+        count += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time and count >= MIN_ROUNDS:
+            break
+
+    tracemalloc.start()
+    try:
+        func(arg)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'rate': count / elapsed,
+        'mean': elapsed / count * 1000,
+        'peak': peak / 1024,
+        'bytes': get_size(result)
+    }
+
+
+def compare(result: dict, baseline: dict, tolerance: float) -> tuple:
+    """
+    Compare a benchmark result to its baseline
+
+    :param result: `dict` of benchmark result (see `measure`)
+    :param baseline: `dict` of baseline result
+    :param tolerance: tolerated relative slowdown or memory increase
+
+    :returns: `tuple` of relative rate change, relative peak memory
+              change and whether either is a regression
+    """
+
+    rate = result['rate'] / baseline['rate'] - 1
+    peak = result['peak'] / baseline['peak'] - 1 if baseline['peak'] else 0
+
+    return rate, peak, rate < -tolerance or peak > tolerance
+
+
+@click.command()
+@click.option('--size', '-s', 'sizes', multiple=True,
+              type=click.Choice(list(SIZES)),
+              help='Corpus size(s) (default: all)')
+@click.option('--case', '-c', 'cases', multiple=True,
+              help='Case name pattern(s) (e.g. "write[iso*")')
+@click.option('--seed', type=int, default=0, help='Random seed')
+@click.option('--min-time', type=float, default=0.5,
+              help='Minimum time in seconds to run each case for')
+@click.option('--output', '-o', type=click.Path(dir_okay=False),
+              help='File to write results to (JSON), e.g. a new baseline')
+@click.option('--baseline', '-b', type=click.Path(exists=True,
+                                                  dir_okay=False),
+              help='Results file (JSON) to compare results to')
+@click.option('--tolerance', type=float, default=0.2,
+              help='Tolerated relative slowdown or memory increase '
+                   'against the baseline')
+@click.pass_context
+def suite(ctx, sizes, cases, seed, min_time, output, baseline, tolerance):
+    """benchmark reading, validating, writing and importing metadata"""
+
+    logging.getLogger('pygeometa').setLevel(logging.ERROR)
+
+    baseline_results = {}
+    if baseline is not None:
+        with open(baseline, encoding='utf-8') as fh:
+            baseline_results = json.load(fh)['results']
+
+    results = {}
+    regressions = 0
+
+    for size in sizes or SIZES:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name, func, arg in get_cases(size, seed, tmpdir):
+                if cases and not any(fnmatch.fnmatchcase(name, pattern)
+                                     for pattern in cases):
+                    continue
+
+                key = f'{size}/{name}'
+
+                try:
+                    result = measure(func, arg, min_time)
+                except NotImplementedError:
+                    continue
+                except Exception as err:
+                    click.echo(f'{key:40} error: {type(err).__name__}: {err}')
+                    continue
+
+                results[key] = result
+
+                line = (f"{key:40} {result['rate']:10.1f}/s "
+                        f"{result['mean']:10.3f} ms "
+                        f"{result['peak']:10.1f} KiB")
+
+                if key in baseline_results:
+                    rate, peak, regression = compare(
+                        result, baseline_results[key], tolerance)
+                    line += f' rate {rate:+7.1%} peak {peak:+7.1%}'
+                    if regression:
+                        line += ' REGRESSION'
+                        regressions += 1
+
+                click.echo(line)
+
+    if output is not None:
+        with open(output, 'w', encoding='utf-8') as fh:
+            json.dump({
+                'pygeometa': VERSION,
+                'python': platform.python_version(),
+                'seed': seed,
+                'results': results
+            }, fh, indent=4)
+
+    if regressions:
+        click.echo(f'{regressions} regression(s) beyond {tolerance:.0%}')
+        ctx.exit(1)
+
+
+@click.group()
+def cli():
+    """pygeometa benchmarks"""
+
+    pass
+
+
+cli.add_command(suite)
+cli.add_command(corpus)
+cli.add_command(iso19139_import)
+
+if __name__ == '__main__':
+    cli()
@@ -46,7 +46,7 @@
 
 import click
 
-from pygeometa.core import (generate, import_, info, schemas,
+from pygeometa.core import (generate, import_, info, schemas, serve,
                             transform, validate)
 from pygeometa.util import get_package_version
 
@@ -72,3 +72,4 @@ metadata.add_command(schemas)
 metadata.add_command(transform)
 metadata.add_command(validate)
 cli.add_command(metadata)
+cli.add_command(serve)
@@ -0,0 +1,952 @@
+# =================================================================
+#
+# Terms and Conditions of Use
+#
+# Unless otherwise noted, computer program source code of this
+# distribution # is covered under Crown Copyright, Government of
+# Canada, and is distributed under the MIT License.
+#
+# The Canada wordmark and related graphics associated with this
+# distribution are protected under trademark law and copyright law.
+# No permission is granted to use them outside the parameters of
+# the Government of Canada's corporate identity program. For
+# more information, see
+# http://www.tbs-sct.gc.ca/fip-pcim/index-eng.asp
+#
+# Copyright title to all 3rd party software distributed with this
+# software is held by the respective copyright holders as noted in
+# those files. Users are asked to read the 3rd Party Licenses
+# referenced with those assets.
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import glob
+import gzip
+import hashlib
+import inspect
+import io
+import json
+import logging
+import os
+import pathlib
+import posixpath
+import string
+import tarfile
+import zipfile
+from typing import IO, Iterable, Iterator, Union
+
+from pygeometa import profiling
+from pygeometa.core import (get_abspath, get_safe_basename,
+                            get_template_environment, import_metadata,
+                            read_mcf, render_j2_template, SCHEMAS, VERSION,
+                            yaml_load)
+from pygeometa.helpers import (bounded_imap, get_json_options,
+                               get_now_snapshot, json_dumps,
+                               set_json_options, set_now_snapshot)
+from pygeometa.schemas import load_schema
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_OUTPUT_TEMPLATE = '{outdir}/{identifier}.{schema}.{ext}'
+
+MCF_EXTENSIONS = ['.yml', '.yaml']
+
+MANIFEST_VERSION = '2'
+
+ARCHIVE_INDEX = 'index.json'
+
+# per-process generation state, set up once by init_worker
+_WORKER = {}
+
+
+def expand_inputs(inputs: Iterable[str]) -> Iterator[pathlib.Path]:
+    """
+    Expand batch inputs into MCF filepaths
+
+    Inputs can be MCF filepaths, directories (searched recursively for
+    .yml/.yaml files), glob patterns (`**` matches recursively) or
+    `@filelist` files listing one input per line.  Each MCF is yielded
+    once, in input order.
+
+    :param inputs: iterable of inputs
+
+    :returns: iterator of `pathlib.Path` of MCF filepaths
+    """
+
+    seen = set()
+
+    def expand(input_: str) -> Iterator[pathlib.Path]:
+        if input_.startswith('@'):
+            LOGGER.debug(f'Reading inputs from {input_[1:]}')
+            with open(input_[1:], encoding='utf-8') as fh:
+                for line in fh:
+                    line = line.strip()
+                    if line and not line.startswith('#'):
+                        yield from expand(line)
+        elif os.path.isdir(input_):
+            LOGGER.debug(f'Searching directory {input_}')
+            for path in sorted(pathlib.Path(input_).rglob('*')):
+                if path.suffix in MCF_EXTENSIONS and path.is_file():
+                    yield path
+        elif glob.has_magic(input_):
+            LOGGER.debug(f'Expanding pattern {input_}')
+            for path in sorted(glob.iglob(input_, recursive=True)):
+                if os.path.isfile(path):
+                    yield pathlib.Path(path)
+        else:
+            yield pathlib.Path(input_)
+
+    for input_ in inputs:
+        for path in expand(input_):
+            key = path.resolve()
+            if key not in seen:
+                seen.add(key)
+                yield path
+
+
+def get_output_path(output_template: str, mcf: dict, mcf_path: pathlib.Path,
+                    schema: str, extension: str,
+                    outdir: Union[pathlib.Path, str] = '.') -> pathlib.Path:
+    """
+    Derive the output filepath of a generated MCF
+
+    The output template is a format string with the fields `outdir`,
+    `identifier` (MCF identifier, made safe for filenames), `stem` (MCF
+    filename without extension), `schema` and `ext` (schema output
+    format).
+
+    :param output_template: output filepath template
+    :param mcf: dict of MCF data
+    :param mcf_path: `pathlib.Path` of MCF filepath
+    :param schema: schema name
+    :param extension: output file extension
+    :param outdir: output directory
+
+    :returns: `pathlib.Path` of output filepath
+    """
+
+    identifier = mcf.get('metadata', {}).get('identifier')
+
+    return pathlib.Path(output_template.format(
+        outdir=outdir,
+        identifier=get_safe_basename(identifier, mcf_path.stem),
+        stem=mcf_path.stem,
+        schema=schema,
+        ext=extension
+    ))
+
+
+def get_file_hash(filepath: Union[pathlib.Path, str]) -> str:
+    """
+    Get the content hash of a file
+
+    :param filepath: filepath
+
+    :returns: `str` of SHA-256 hexadecimal digest
+    """
+
+    with open(filepath, 'rb') as fh:
+        return hashlib.file_digest(fh, 'sha256').hexdigest()
+
+
+def get_mcf_dependencies(mcf_path: pathlib.Path) -> list:
+    """
+    Get the files an MCF is built from, i.e. the MCF itself and its
+    `base_mcf` ancestors as resolved by `pygeometa.core.read_mcf`
+
+    :param mcf_path: `pathlib.Path` of MCF filepath
+
+    :returns: `list` of `pathlib.Path` of MCF filepaths
+    """
+
+    def find_base_mcfs(dict_: dict, recursive: bool) -> Iterator[str]:
+        for key, value in dict_.items():
+            if isinstance(value, dict):
+                if recursive:
+                    yield from find_base_mcfs(value, recursive)
+            elif key == 'base_mcf':
+                yield value
+
+    dependencies = [mcf_path.resolve()]
+
+    with mcf_path.open(encoding='utf-8') as fh:
+        mcf_dict = yaml_load(fh)
+
+    for base_mcf in find_base_mcfs(mcf_dict, True):
+        base_path = get_abspath(mcf_path, base_mcf).resolve()
+        dependencies.append(base_path)
+
+        with base_path.open(encoding='utf-8') as fh:
+            base_mcf_dict = yaml_load(fh)
+
+        # read_mcf resolves grandparents relative to the MCF itself
+        for base_mcf2 in find_base_mcfs(base_mcf_dict, False):
+            dependencies.append(get_abspath(mcf_path, base_mcf2).resolve())
+
+    return list(dict.fromkeys(dependencies))
+
+
+def get_schema_hash(schema: str = None, schema_local: str = None) -> str:
+    """
+    Get the content hash of everything a schema renders with: its
+    templates (including common templates) and its Python source
+
+    :param schema: schema name
+    :param schema_local: directory of locally defined schema templates
+
+    :returns: `str` of SHA-256 hexadecimal digest
+    """
+
+    filepaths = set(SCHEMAS.joinpath('common').glob('*.j2'))
+
+    if schema is not None:
+        schema_object = load_schema(schema)
+        if schema_object.template_dir is not None:
+            template_dir = pathlib.Path(schema_object.template_dir)
+            filepaths.update(template_dir.rglob('*.j2'))
+        for class_ in type(schema_object).__mro__[:-1]:
+            filepaths.add(pathlib.Path(inspect.getsourcefile(class_)))
+    else:
+        filepaths.update(p for p in pathlib.Path(schema_local).rglob('*')
+                         if p.is_file())
+
+    digest = hashlib.sha256()
+    for filepath in sorted(filepaths):
+        digest.update(f'{filepath}\0{get_file_hash(filepath)}\0'.encode())
+
+    return digest.hexdigest()
+
+
+def load_manifest(filepath: Union[pathlib.Path, str]) -> dict:
+    """
+    Load a batch generation manifest
+
+    :param filepath: filepath of manifest
+
+    :returns: `dict` of manifest (empty if none exists or unreadable)
+    """
+
+    try:
+        with open(filepath, encoding='utf-8') as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        LOGGER.debug(f'No manifest at {filepath}')
+    except (OSError, ValueError) as err:
+        LOGGER.warning(f'Ignoring unreadable manifest {filepath}: {err}')
+
+    return {}
+
+
+def write_manifest(filepath: Union[pathlib.Path, str],
+                   manifest: dict) -> None:
+    """
+    Write a batch generation manifest atomically
+
+    :param filepath: filepath of manifest
+    :param manifest: `dict` of manifest
+
+    :returns: `None`
+    """
+
+    filepath = pathlib.Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_filepath = filepath.with_name(f'.{filepath.name}.tmp')
+    with tmp_filepath.open('w', encoding='utf-8') as fh:
+        json.dump(manifest, fh, indent=1, sort_keys=True)
+
+    os.replace(tmp_filepath, filepath)
+
+
+def is_up_to_date(entry: dict) -> bool:
+    """
+    Check whether a manifest record is up to date, i.e. its output
+    is still the one it recorded and none of its dependencies changed
+
+    :param entry: `dict` of manifest record
+
+    :returns: `bool` of whether the record is up to date
+    """
+
+    if entry is None:
+        return False
+
+    try:
+        if get_file_hash(entry['output']) != entry['output_hash']:
+            return False
+        return all(get_file_hash(filepath) == hash_
+                   for filepath, hash_ in entry['dependencies'].items())
+    except (OSError, KeyError, TypeError):
+        return False
+
+
+def write_if_changed(filepath: pathlib.Path, content: str) -> bool:
+    """
+    Write content to a file, leaving the file untouched if its bytes
+    would not change
+
+    :param filepath: `pathlib.Path` of filepath
+    :param content: `str` of content
+
+    :returns: `bool` of whether the file was written
+    """
+
+    data = content.encode('utf-8')
+
+    try:
+        if filepath.stat().st_size == len(data):
+            if filepath.read_bytes() == data:
+                LOGGER.debug(f'{filepath} unchanged')
+                return False
+    except FileNotFoundError:
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    LOGGER.debug(f'Writing {filepath}')
+    filepath.write_bytes(data)
+
+    return True
+
+
+class ArchiveWriter:
+    """
+    Deterministic zip/tar archive writer
+
+    Entries are written from memory in the order they are added, with
+    fixed timestamps, ownership and permissions, so that the same
+    entries always produce the same archive bytes.
+    """
+
+    TAR_MODES = {
+        '.tar': 'w',
+        '.tar.bz2': 'w:bz2',
+        '.tar.xz': 'w:xz'
+    }
+
+    def __init__(self, filepath: Union[pathlib.Path, str]):
+        """
+        Initialize object
+
+        :param filepath: filepath of archive; the format is derived from
+                         its extension (.zip, .tar, .tar.gz/.tgz, .tar.bz2
+                         or .tar.xz)
+
+        :returns: pygeometa.batch.ArchiveWriter
+        """
+
+        self.filepath = pathlib.Path(filepath)
+        self.entries = set()
+        self._fh = None
+        self._gzip = None
+        self._archive = None
+
+        name = self.filepath.name.lower()
+
+        if name.endswith('.zip'):
+            self.format = 'zip'
+        elif name.endswith(('.tar.gz', '.tgz')):
+            self.format = 'tar.gz'
+        else:
+            self.format = next((ext[1:] for ext in self.TAR_MODES
+                                if name.endswith(ext)), None)
+
+        if self.format is None:
+            msg = f'Unsupported archive format: {self.filepath.name}'
+            LOGGER.error(msg)
+            raise ValueError(msg)
+
+    def __enter__(self):
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = self.filepath.open('wb')
+
+        if self.format == 'zip':
+            self._archive = zipfile.ZipFile(self._fh, 'w')
+        elif self.format == 'tar.gz':
+            self._gzip = gzip.GzipFile(filename='', mode='wb',
+                                       fileobj=self._fh, mtime=0)
+            self._archive = tarfile.open(fileobj=self._gzip, mode='w')
+        else:
+            self._archive = tarfile.open(
+                fileobj=self._fh, mode=self.TAR_MODES[f'.{self.format}'])
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add(self, name: str, content: Union[bytes, str]) -> None:
+        """
+        Add an entry to the archive
+
+        :param name: entry name
+        :param content: `bytes` or `str` (encoded as UTF-8) of entry
+
+        :returns: `None`
+        """
+
+        if name in self.entries:
+            raise ValueError(f'Duplicate archive entry {name}')
+
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+
+        LOGGER.debug(f'Adding {name} to {self.filepath}')
+
+        if self.format == 'zip':
+            info = zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0))
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            self._archive.writestr(info, content)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            info.mode = 0o644
+            self._archive.addfile(info, io.BytesIO(content))
+
+        self.entries.add(name)
+
+    def close(self) -> None:
+        """
+        Close the archive
+
+        :returns: `None`
+        """
+
+        for fh in [self._archive, self._gzip, self._fh]:
+            if fh is not None:
+                fh.close()
+
+        self._fh = self._gzip = self._archive = None
+
+
+def get_archive_entry_name(filepath: Union[pathlib.Path, str]) -> str:
+    """
+    Derive an archive entry name from an output filepath
+
+    :param filepath: output filepath
+
+    :returns: `str` of archive entry name
+    """
+
+    name = posixpath.normpath(pathlib.PurePath(filepath).as_posix())
+    name = name.lstrip('/')
+
+    if name in ['', '.'] or name.split('/')[0] == '..':
+        raise ValueError(f'Invalid archive entry name {filepath}')
+
+    return name
+
+
+def get_process_options() -> dict:
+    """
+    Get the options of the current process to set up in worker processes
+
+    :returns: `dict` of whether profiling is enabled (`profile`), JSON
+              serialization defaults (`json`) and date-time snapshot
+              (`now`)
+    """
+
+    return {
+        'profile': profiling.is_enabled(),
+        'json': get_json_options(),
+        'now': get_now_snapshot()
+    }
+
+
+def init_process(options: dict) -> None:
+    """
+    Initialize a worker process with the options of its parent process
+
+    :param options: `dict` of parent process options
+                    (see `get_process_options`)
+
+    :returns: `None`
+    """
+
+    profiling.init_worker(options['profile'])
+    set_json_options(**options['json'])
+    set_now_snapshot(options['now'])
+
+
+def get_output_format(schema: str = None, schema_object=None,
+                      schema_local: str = None) -> tuple:
+    """
+    Get the schema name and file extension of generated outputs
+
+    :param schema: schema name
+    :param schema_object: schema object (loaded from `schema` if not given)
+    :param schema_local: directory of locally defined schema templates
+
+    :returns: `tuple` of schema name and output file extension
+    """
+
+    if schema is not None:
+        schema_object = schema_object or load_schema(schema)
+        return schema, schema_object.outputformat
+
+    return os.path.basename(os.path.normpath(schema_local)), 'xml'
+
+
+def init_worker(schema: str = None, schema_local: str = None,
+                options: dict = None) -> None:
+    """
+    Initialize generation state of a worker process
+
+    Schemas are loaded and templates compiled once per process.
+
+    :param schema: schema name
+    :param schema_local: directory of locally defined schema templates
+    :param options: `dict` of parent process options (see
+                    `get_process_options`, `None` if running in the
+                    parent process)
+
+    :returns: `None`
+    """
+
+    if options is not None:
+        init_process(options)
+
+    if schema is not None:
+        schema_object = load_schema(schema)
+        template_dir = schema_object.template_dir
+    else:
+        schema_object = None
+        template_dir = schema_local
+
+    _WORKER['schema'], _WORKER['extension'] = get_output_format(
+        schema, schema_object, schema_local)
+    _WORKER['schema_object'] = schema_object
+
+    _WORKER['schema_local'] = schema_local
+
+    if template_dir is not None:
+        env = get_template_environment(template_dir)
+        try:
+            env.get_template('main.j2')
+        except Exception as err:
+            LOGGER.debug(f'No template to compile: {err}')
+
+
+def generate_file(task: dict) -> dict:
+    """
+    Generate metadata of a single MCF in a worker process
+
+    Failures are reported in the result rather than raised.
+
+    :param task: `dict` of MCF filepath (`mcf`), output filepath
+                 template (`output_template`), output directory
+                 (`outdir`), output filepath (`output`, if derived
+                 beforehand), whether to record dependencies
+                 (`incremental`), the MCF's previous manifest record
+                 (`previous`, if up to date) and whether to return the
+                 content for an archive rather than writing it
+                 (`archive`)
+
+    :returns: `dict` of MCF filepath, output filepath (or archive entry
+              name), status (generated, unchanged, skipped or failed),
+              error (if any), dependency and output hashes (if
+              incremental) and identifier and content (if archived)
+    """
+
+    mcf_path = task['mcf']
+
+    result = {
+        'mcf': str(mcf_path),
+        'output': None,
+        'status': 'failed',
+        'error': None
+    }
+
+    if task.get('incremental'):
+        previous = task.get('previous')
+        if previous is not None:
+            LOGGER.debug(f'{mcf_path} up to date')
+            result['output'] = previous['output']
+            result['status'] = 'skipped'
+            result['dependencies'] = previous['dependencies']
+            result['output_hash'] = previous['output_hash']
+            return result
+
+    try:
+        if task.get('incremental'):
+            result['dependencies'] = {
+                str(filepath): get_file_hash(filepath)
+                for filepath in get_mcf_dependencies(mcf_path)
+            }
+
+        mcf_dict = read_mcf(mcf_path)
+
+        if _WORKER['schema_object'] is not None:
+            content = _WORKER['schema_object'].write(mcf_dict)
+        else:
+            content = render_j2_template(
+                mcf_dict, template_dir=_WORKER['schema_local'])
+
+        output_path = task.get('output') or get_output_path(
+            task['output_template'], mcf_dict, mcf_path, _WORKER['schema'],
+            _WORKER['extension'], task['outdir'])
+
+        if task.get('archive'):
+            result['output'] = get_archive_entry_name(output_path)
+            result['identifier'] = mcf_dict['metadata'].get(
+                'identifier', mcf_path.stem)
+            result['content'] = content
+            result['status'] = 'generated'
+            return result
+
+        if write_if_changed(output_path, content):
+            result['status'] = 'generated'
+        else:
+            result['status'] = 'unchanged'
+
+        result['output'] = str(output_path)
+
+        if task.get('incremental'):
+            result['output_hash'] = hashlib.sha256(
+                content.encode('utf-8')).hexdigest()
+    except Exception as err:
+        LOGGER.debug(f'Failed to generate {mcf_path}: {err}')
+        result['error'] = f'{type(err).__name__}: {err}'
+        result.pop('dependencies', None)
+
+    return result
+
+
+def write_archive(archive: ArchiveWriter, results: Iterator[dict],
+                  archive_index: bool = False) -> Iterator[dict]:
+    """
+    Write the content of results into an archive
+
+    :param archive: `ArchiveWriter` object
+    :param results: iterator of `dict` results with `output` (entry
+                    name), `identifier` and `content` of successful results
+    :param archive_index: whether to add an index of identifiers to
+                          entry names (`index.json`) to the archive
+
+    :returns: iterator of `dict` results, without content
+    """
+
+    index = {}
+
+    for result in results:
+        content = result.pop('content', None)
+
+        if content is not None:
+            try:
+                archive.add(result['output'], content)
+                index[str(result['identifier'])] = result['output']
+            except ValueError as err:
+                result['status'] = 'failed'
+                result['error'] = f'{type(err).__name__}: {err}'
+                result['output'] = None
+
+        yield result
+
+    if archive_index:
+        archive.add(ARCHIVE_INDEX, json.dumps(index, indent=1,
+                                              ensure_ascii=False))
+
+
+def generate_batch(inputs: Iterable[str], schema: str = None,
+                   schema_local: str = None,
+                   output_template: str = DEFAULT_OUTPUT_TEMPLATE,
+                   outdir: Union[pathlib.Path, str] = '.',
+                   jobs: int = 1,
+                   manifest: Union[pathlib.Path, str] = None,
+                   output_archive: Union[pathlib.Path, str] = None,
+                   archive_index: bool = False) -> Iterator[dict]:
+    """
+    Generate metadata of many MCFs
+
+    Outputs whose content is unchanged are not rewritten.  If a manifest
+    is given, generation is incremental: an MCF is only rendered again
+    if it, one of its `base_mcf` ancestors, the schema or the pygeometa
+    version changed since the manifest was written (at the end of the
+    batch).
+
+    If an output archive is given, outputs are streamed from the workers
+    into the archive in input order instead of being written to disk,
+    with the output filepath (relative to the output directory) as entry
+    name.
+
+    Output filepaths are derived before any MCF is generated; MCFs
+    that would generate the same output as an earlier MCF are written
+    with a `-2`, `-3`, etc. suffix instead.
+
+    :param inputs: iterable of inputs (see `expand_inputs`)
+    :param schema: schema name
+    :param schema_local: directory of locally defined schema templates
+    :param output_template: output filepath template
+                            (see `get_output_path`)
+    :param outdir: output directory
+    :param jobs: number of worker processes
+    :param manifest: filepath of incremental generation manifest
+    :param output_archive: filepath of output archive
+                           (see `ArchiveWriter`)
+    :param archive_index: whether to add an index of identifiers to
+                          entry names (`index.json`) to the archive
+
+    :returns: iterator of `dict` results (see `generate_file`), in
+              input order
+    """
+
+    if schema is None and schema_local is None:
+        raise ValueError('schema or schema_local required')
+
+    if None not in [manifest, output_archive]:
+        raise ValueError('manifest and output_archive are mutually exclusive')
+
+    records = {}
+    previous_records = {}
+
+    if manifest is not None:
+        header = {
+            'manifest_version': MANIFEST_VERSION,
+            'pygeometa_version': VERSION,
+            'schema': schema or str(schema_local),
+            'schema_hash': get_schema_hash(schema, schema_local),
+            'output_template': output_template,
+            'outdir': str(outdir)
+        }
+
+        previous_manifest = load_manifest(manifest)
+        if previous_manifest.get('header') == header:
+            previous_records = previous_manifest.get('records', {})
+        elif previous_manifest:
+            LOGGER.info('Manifest outdated; regenerating all records')
+
+    def get_key(output: pathlib.Path) -> str:
+        return os.path.normcase(os.path.abspath(output))
+
+    def get_tasks() -> list:
+        tasks = []
+        outputs = set()
+
+        schema_name, extension = get_output_format(
+            schema, schema_local=schema_local)
+        fields = [field for _, field, _, _ in
+                  string.Formatter().parse(output_template)]
+
+        for mcf_path in expand_inputs(inputs):
+            task = {
+                'mcf': mcf_path,
+                'output_template': output_template,
+                'outdir': outdir,
+                'output': None,
+                'incremental': manifest is not None,
+                'previous': None,
+                'archive': output_archive is not None
+            }
+
+            previous = previous_records.get(str(mcf_path.resolve()))
+            if is_up_to_date(previous):
+                task['previous'] = previous
+                task['output'] = pathlib.Path(previous['output'])
+            else:
+                mcf_dict = {}
+                if 'identifier' in fields:
+                    try:
+                        mcf_dict = read_mcf(mcf_path)
+                    except Exception as err:
+                        # reported by the worker
+                        LOGGER.debug(f'Cannot read {mcf_path}: {err}')
+                        tasks.append(task)
+                        continue
+                task['output'] = get_output_path(
+                    output_template, mcf_dict, mcf_path, schema_name,
+                    extension, outdir)
+
+            output, suffix = os.path.splitext(task['output'])
+            count = 2
+            while get_key(task['output']) in outputs:
+                task['output'] = pathlib.Path(f'{output}-{count}{suffix}')
+                count += 1
+            if count > 2:
+                LOGGER.warning(f'{mcf_path} shares its output with '
+                               f'another MCF; writing {task["output"]}')
+                task['previous'] = None
+
+            outputs.add(get_key(task['output']))
+            tasks.append(task)
+
+        return tasks
+
+    def record(results: Iterator[dict]) -> Iterator[dict]:
+        for result in results:
+            profiling.emit_worker_records(result)
+            if 'dependencies' in result:
+                key = str(pathlib.Path(result['mcf']).resolve())
+                records[key] = {
+                    'output': result['output'],
+                    'output_hash': result['output_hash'],
+                    'dependencies': result['dependencies']
+                }
+            yield result
+
+    def run() -> Iterator[dict]:
+        if jobs == 1:
+            init_worker(schema, schema_local)
+            yield from record(map(generate_file, tasks))
+            return
+
+        LOGGER.debug(f'Generating with {jobs} workers')
+        initargs = (schema, schema_local, get_process_options())
+        with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker,
+                                 initargs=initargs) as executor:
+            func = functools.partial(profiling.run_worker_task, generate_file)
+            yield from record(bounded_imap(executor, func, tasks))
+
+    # output filepaths are made unique before any generation starts
+    tasks = get_tasks()
+
+    if output_archive is not None:
+        with ArchiveWriter(output_archive) as archive:
+            yield from write_archive(archive, run(), archive_index)
+    else:
+        yield from run()
+
+    if manifest is not None:
+        LOGGER.debug(f'Writing manifest {manifest}')
+        write_manifest(manifest, {'header': header, 'records': records})
+
+
+def transform_record(task: tuple) -> dict:
+    """
+    Transform a single NDJSON record in a worker process
+
+    A record is either a JSON string of metadata content (e.g. XML) or
+    a JSON object/array of metadata content (e.g. an OpenAIRE record).
+    Failures are reported in the result rather than raised.
+
+    :param task: `tuple` of line number, input schema, output schema,
+                 NDJSON line and whether to return the content for an
+                 archive rather than as an NDJSON line
+
+    :returns: `dict` of line number, output NDJSON line (or archive
+              entry name, identifier and content) if successful, and
+              error and error type if failed
+    """
+
+    line_number, input_schema, output_schema, line, archive = task
+
+    result = {
+        'line': line_number,
+        'output': None,
+        'error': None
+    }
+
+    try:
+        record = json.loads(line)
+        if not isinstance(record, str):
+            record = json.dumps(record)
+
+        mcf = import_metadata(input_schema, record, raise_errors=True)
+
+        LOGGER.debug(f'Processing line {line_number} into {output_schema}')
+        schema_object = load_schema(output_schema)
+
+        if archive:
+            content = schema_object.write(mcf)
+            default = f'record-{line_number}'
+            identifier = mcf.get('metadata', {}).get('identifier') or default
+            basename = get_safe_basename(identifier, default)
+            result['output'] = (f'{basename}.{output_schema}.'
+                                f'{schema_object.outputformat}')
+            result['identifier'] = identifier
+            result['content'] = content
+            return result
+
+        if schema_object.outputformat == 'json':
+            # embed JSON records as objects, serialized once
+            content = schema_object.write(mcf, stringify=False)
+        else:
+            content = schema_object.write(mcf)
+
+        result['output'] = json_dumps(content, compact=True)
+    except Exception as err:
+        LOGGER.debug(f'Failed to transform line {line_number}: {err}')
+        result['error'] = str(err)
+        result['type'] = type(err).__name__
+
+    return result
+
+
+def transform_ndjson(fh: IO, input_schema: str, output_schema: str,
+                     jobs: int = 1, ordered: bool = True,
+                     output_archive: Union[pathlib.Path, str] = None,
+                     archive_index: bool = False) -> Iterator[dict]:
+    """
+    Transform a stream of newline-delimited JSON (NDJSON) records
+
+    Records are read lazily and at most a bounded number are in flight,
+    so memory use is independent of the number of records.  Blank lines
+    are skipped.
+
+    If an output archive is given, outputs are streamed from the workers
+    into the archive in input order, as `{identifier}.{schema}.{ext}`
+    entries.
+
+    :param fh: text file-like object of NDJSON records
+               (see `transform_record`)
+    :param input_schema: input schema (or autodetect)
+    :param output_schema: output schema
+    :param jobs: number of worker processes
+    :param ordered: whether to yield results in input order (default)
+                    or in completion order
+    :param output_archive: filepath of output archive
+                           (see `ArchiveWriter`)
+    :param archive_index: whether to add an index of identifiers to
+                          entry names (`index.json`) to the archive
+
+    :returns: iterator of `dict` results (see `transform_record`)
+    """
+
+    tasks = ((line_number, input_schema, output_schema, line,
+              output_archive is not None)
+             for line_number, line in enumerate(fh, start=1)
+             if line.strip())
+
+    def run(ordered: bool) -> Iterator[dict]:
+        if jobs == 1:
+            yield from map(transform_record, tasks)
+            return
+
+        LOGGER.debug(f'Transforming with {jobs} workers')
+        with ProcessPoolExecutor(max_workers=jobs,
+                                 initializer=init_process,
+                                 initargs=(get_process_options(),)
+                                 ) as executor:
+            func = functools.partial(profiling.run_worker_task,
+                                     transform_record)
+            results = bounded_imap(executor, func, tasks, ordered=ordered)
+            yield from map(profiling.emit_worker_records, results)
+
+    if output_archive is not None:
+        with ArchiveWriter(output_archive) as archive:
+            yield from write_archive(archive, run(True), archive_index)
+    else:
+        yield from run(ordered)
@@ -0,0 +1,424 @@
+# =================================================================
+#
+# Terms and Conditions of Use
+#
+# Unless otherwise noted, computer program source code of this
+# distribution # is covered under Crown Copyright, Government of
+# Canada, and is distributed under the MIT License.
+#
+# The Canada wordmark and related graphics associated with this
+# distribution are protected under trademark law and copyright law.
+# No permission is granted to use them outside the parameters of
+# the Government of Canada's corporate identity program. For
+# more information, see
+# http://www.tbs-sct.gc.ca/fip-pcim/index-eng.asp
+#
+# Copyright title to all 3rd party software distributed with this
+# software is held by the respective copyright holders as noted in
+# those files. Users are asked to read the 3rd Party Licenses
+# referenced with those assets.
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+from collections import OrderedDict
+import copy
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import threading
+import time
+from typing import Any, Callable, Union
+
+from pygeometa.core import VERSION
+from pygeometa.helpers import json_serial
+
+LOGGER = logging.getLogger(__name__)
+
+# caches shared by all users of the same configuration
+_CACHES = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_cache_key(*parts: Any) -> str:
+    """
+    Derive a canonical cache key from JSON serializable parts and the
+    pygeometa version
+
+    :param parts: parts of the key (e.g. input document and schemas)
+
+    :returns: `str` of SHA-256 hexadecimal digest
+    """
+
+    canonical = json.dumps([VERSION, *parts], sort_keys=True,
+                           separators=(',', ':'), default=str)
+
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class MemoryStorage:
+    """
+    In-memory LRU cache storage
+
+    Entries are copied on the way in and out, so callers never share
+    mutable values with the cache.
+    """
+
+    def __init__(self):
+        """
+        Initialize object
+
+        :returns: pygeometa.cache.MemoryStorage
+        """
+
+        self.entries = OrderedDict()
+
+    def get(self, key: str) -> Union[dict, None]:
+        """
+        Get an entry, marking it as most recently used
+
+        :param key: cache key
+
+        :returns: `dict` of entry (`created` timestamp and `value`) or
+                  `None` if not found
+        """
+
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        self.entries.move_to_end(key)
+
+        return copy.deepcopy(entry)
+
+    def set(self, key: str, entry: dict, maxsize: int) -> int:
+        """
+        Set an entry, evicting least recently used entries beyond
+        `maxsize`
+
+        :param key: cache key
+        :param entry: `dict` of entry (`created` timestamp and `value`)
+        :param maxsize: maximum number of entries
+
+        :returns: `int` of number of evicted entries
+        """
+
+        self.entries[key] = copy.deepcopy(entry)
+        self.entries.move_to_end(key)
+
+        evicted = 0
+        while len(self.entries) > maxsize:
+            self.entries.popitem(last=False)
+            evicted += 1
+
+        return evicted
+
+    def delete(self, key: str) -> None:
+        """
+        Delete an entry
+
+        :param key: cache key
+
+        :returns: `None`
+        """
+
+        self.entries.pop(key, None)
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class DiskStorage:
+    """
+    On-disk LRU cache storage
+
+    Entries are stored as one JSON file per key; file modification times
+    track recency of use.
+    """
+
+    def __init__(self, path: Union[pathlib.Path, str]):
+        """
+        Initialize object
+
+        :param path: directory of cache entries
+
+        :returns: pygeometa.cache.DiskStorage
+        """
+
+        self.path = pathlib.Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._last_used = 0
+
+    def _filepath(self, key: str) -> pathlib.Path:
+        return self.path / f'{key}.json'
+
+    def _touch(self, filepath: pathlib.Path) -> None:
+        # file systems may stamp with a coarse clock, so keep successive
+        # uses strictly ordered
+        self._last_used = max(time.time_ns(), self._last_used + 1)
+        os.utime(filepath, ns=(self._last_used, self._last_used))
+
+    def get(self, key: str) -> Union[dict, None]:
+        """
+        Get an entry, marking it as most recently used
+
+        :param key: cache key
+
+        :returns: `dict` of entry (`created` timestamp and `value`) or
+                  `None` if not found
+        """
+
+        filepath = self._filepath(key)
+
+        try:
+            with filepath.open(encoding='utf-8') as fh:
+                entry = json.load(fh)
+            self._touch(filepath)
+        except (OSError, ValueError):
+            return None
+
+        return entry
+
+    def set(self, key: str, entry: dict, maxsize: int) -> int:
+        """
+        Set an entry, evicting least recently used entries beyond
+        `maxsize`
+
+        :param key: cache key
+        :param entry: `dict` of entry (`created` timestamp and `value`)
+        :param maxsize: maximum number of entries
+
+        :returns: `int` of number of evicted entries
+        """
+
+        filepath = self._filepath(key)
+        tmp_filepath = filepath.with_name(f'.{filepath.name}.{os.getpid()}')
+
+        # a failed cache write must not fail the request
+        try:
+            with tmp_filepath.open('w', encoding='utf-8') as fh:
+                json.dump(entry, fh, default=json_serial)
+            os.replace(tmp_filepath, filepath)
+            self._touch(filepath)
+        except (OSError, TypeError, ValueError) as err:
+            LOGGER.warning(f'Cannot write cache entry {key}: {err}')
+        finally:
+            try:
+                tmp_filepath.unlink()
+            except OSError:
+                pass
+
+        filepaths = list(self.path.glob('*.json'))
+        if len(filepaths) <= maxsize:
+            return 0
+
+        def mtime(filepath: pathlib.Path) -> int:
+            try:
+                return filepath.stat().st_mtime_ns
+            except OSError:
+                return 0
+
+        evicted = 0
+        for filepath_ in sorted(filepaths, key=mtime)[:-maxsize]:
+            try:
+                filepath_.unlink()
+                evicted += 1
+            except OSError:
+                pass
+
+        return evicted
+
+    def delete(self, key: str) -> None:
+        """
+        Delete an entry
+
+        :param key: cache key
+
+        :returns: `None`
+        """
+
+        try:
+            self._filepath(key).unlink()
+        except OSError:
+            pass
+
+    def __len__(self):
+        return len(list(self.path.glob('*.json')))
+
+
+class ResponseCache:
+    """Size-bounded LRU response cache with optional TTL"""
+
+    def __init__(self, maxsize: int = 128, ttl: float = None,
+                 storage: Union[MemoryStorage, DiskStorage] = None):
+        """
+        Initialize object
+
+        :param maxsize: maximum number of entries
+        :param ttl: time to live of entries in seconds (default: no
+                    expiry)
+        :param storage: cache storage (default: `MemoryStorage`)
+
+        :returns: pygeometa.cache.ResponseCache
+        """
+
+        if storage is None:
+            storage = MemoryStorage()
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.storage = storage
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        """
+        Get a cached value
+
+        :param key: cache key
+
+        :returns: cached value, or `None` if not cached or expired
+        """
+
+        with self._lock:
+            entry = self.storage.get(key)
+
+            if entry is not None and self.ttl is not None:
+                if time.time() - entry['created'] >= self.ttl:
+                    LOGGER.debug(f'Cache entry {key} expired')
+                    self.storage.delete(key)
+                    entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return entry['value']
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Cache a value
+
+        :param key: cache key
+        :param value: value to cache (JSON serializable for disk storage)
+
+        :returns: `None`
+        """
+
+        entry = {
+            'created': time.time(),
+            'value': value
+        }
+
+        with self._lock:
+            self.evictions += self.storage.set(key, entry, self.maxsize)
+
+    def get_or_set(self, key: str, func: Callable[[], Any]) -> Any:
+        """
+        Get a cached value, computing and caching it on a miss
+
+        Exceptions of `func` are raised and not cached.
+
+        :param key: cache key
+        :param func: function computing the value
+
+        :returns: cached or computed value
+        """
+
+        value = self.get(key)
+
+        if value is None:
+            value = func()
+            self.set(key, value)
+
+        LOGGER.debug(f'Cache statistics: {self.stats()}')
+
+        return value
+
+    def stats(self) -> dict:
+        """
+        Get cache statistics
+
+        :returns: `dict` of hits, misses, evictions, size and maxsize
+        """
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self.storage),
+            'maxsize': self.maxsize
+        }
+
+
+def get_cache(config: Union[bool, dict] = None
+              ) -> Union[ResponseCache, None]:
+    """
+    Get the response cache of a configuration, shared by all callers
+    with the same configuration
+
+    :param config: `dict` of cache configuration: `maxsize` (default
+                   128), `ttl` in seconds (default: no expiry) and `path`
+                   of a directory for on-disk storage (default:
+                   in-memory), or `True` for an in-memory cache with
+                   default settings
+
+    :returns: `ResponseCache` or `None` if no configuration is given
+    """
+
+    if config is True:
+        config = {'maxsize': 128}
+
+    if not config:
+        return None
+
+    if not isinstance(config, dict):
+        msg = f'Invalid cache configuration: {config!r}'
+        LOGGER.error(msg)
+        raise ValueError(msg)
+
+    unknown = set(config) - {'maxsize', 'ttl', 'path'}
+    if unknown:
+        msg = f'Unknown cache configuration options: {sorted(unknown)}'
+        LOGGER.error(msg)
+        raise ValueError(msg)
+
+    key = json.dumps(config, sort_keys=True, default=str)
+
+    with _CACHES_LOCK:
+        if key not in _CACHES:
+            LOGGER.debug(f'Setting up response cache {config}')
+            storage = None
+            if config.get('path') is not None:
+                storage = DiskStorage(config['path'])
+            _CACHES[key] = ResponseCache(config.get('maxsize', 128),
+                                         config.get('ttl'), storage)
+
+        return _CACHES[key]
@@ -45,13 +45,44 @@
 # =================================================================
 
 import logging
+import pathlib
 import sys
 
 import click
 
+from pygeometa import profiling
+from pygeometa.helpers import (JSON_BACKENDS, NOW_SCOPES, now_snapshot,
+                               set_json_options)
+
 ARGUMENT_MCF = click.argument('mcf')
 ARGUMENT_METADATA_FILE = click.argument('metadata-file', type=click.File())
 
+OPTION_ARCHIVE_INDEX = click.option(
+    '--archive-index',
+    is_flag=True,
+    help='Add an index of identifiers to entry names (index.json) to the '
+         'output archive')
+
+OPTION_OUTPUT_ARCHIVE = click.option(
+    '--output-archive',
+    type=click.Path(dir_okay=False, path_type=pathlib.Path),
+    help='Archive (.zip, .tar, .tar.gz, .tgz, .tar.bz2, .tar.xz) to write '
+         'outputs to')
+
+OPTION_JOBS = click.option(
+    '--jobs',
+    '-j',
+    type=click.IntRange(min=1),
+    default=1,
+    help='Number of parallel worker processes')
+
+OPTION_SOCKET = click.option(
+    '--socket',
+    type=click.Path(dir_okay=False),
+    envvar='PYGEOMETA_SOCKET',
+    help='Unix socket of a pygeometa server to forward processing to, '
+         'if running')
+
 OPTION_OUTPUT = click.option(
     '--output',
     '-o',
@@ -74,6 +105,66 @@ def OPTION_VERBOSITY(f):
                         callback=callback)(f)
 
 
+def OPTION_JSON(f):
+    def format_callback(ctx, param, value):
+        if value is not None:
+            set_json_options(compact=value == 'compact')
+
+    def backend_callback(ctx, param, value):
+        if value is not None:
+            try:
+                set_json_options(backend=value)
+            except RuntimeError as err:
+                raise click.BadParameter(str(err))
+
+    f = click.option('--json-format', type=click.Choice(['pretty', 'compact']),
+                     help='Formatting of JSON output (default: pretty)',
+                     expose_value=False, callback=format_callback)(f)
+
+    return click.option('--json-backend', type=click.Choice(JSON_BACKENDS),
+                        help='JSON serialization backend: json (standard '
+                             'library, default), orjson (requires orjson) '
+                             'or auto (orjson if installed)',
+                        expose_value=False, callback=backend_callback)(f)
+
+
+def OPTION_NOW_SCOPE(f):
+    def callback(ctx, param, value):
+        if value == 'batch':
+            ctx.with_resource(now_snapshot())
+
+    return click.option('--now-scope', type=click.Choice(NOW_SCOPES),
+                        help='Scope of a single current date-time for '
+                             '$date$-style keywords and missing dates: each '
+                             'record (render, default) or all records of a '
+                             'batch (batch)',
+                        expose_value=False, callback=callback)(f)
+
+
+def OPTION_PROFILE(f):
+    def callback(ctx, param, value):
+        if value is not None:
+            profiler = profiling.Profiler()
+            profiling.add_hook(profiler)
+
+            def report():
+                profiling.remove_hook(profiler)
+                if value == 'jsonl':
+                    profiler.write_jsonl(sys.stderr)
+                else:
+                    profiler.write_summary(sys.stderr)
+
+            ctx.call_on_close(report)
+
+    return click.option('--profile',
+                        type=click.Choice(['summary', 'jsonl']),
+                        help='Report time and bytes per processing stage '
+                             '(read_mcf, validate_mcf, write, etc.) to '
+                             'stderr, as a summary table or JSON lines',
+                        expose_value=False,
+                        callback=callback)(f)
+
+
 def cli_callbacks(f):
     f = OPTION_VERBOSITY(f)
     return f
@@ -45,26 +45,34 @@
 # =================================================================
 
 from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 from importlib.metadata import version, PackageNotFoundError
 import datetime
+import functools
 import json
 import logging
 import os
 import pathlib
 import re
+import signal
+import sys
 import traceback
 from typing import IO, Union
 from xml.dom import minidom
 
 import click
+from click.core import ParameterSource
 from jinja2 import Environment, FileSystemLoader
 from jinja2.exceptions import TemplateNotFound
-from jsonschema import validate as jsonschema_validate
-from jsonschema.exceptions import ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 import yaml
 
 from pygeometa import cli_options
-from pygeometa.helpers import json_dumps
+from pygeometa.profiling import profiled, stage
+from pygeometa.helpers import (bounded_imap, get_hashable, get_now,
+                               get_now_snapshot, json_dumps, now_scoped)
 from pygeometa.schemas import get_supported_schemas, load_schema
 
 LOGGER = logging.getLogger(__name__)
@@ -78,6 +86,18 @@ except PackageNotFoundError:
 
 VERSION = package_version
 
+NIL_REASONS = ['missing', 'withheld', 'inapplicable', 'unknown', 'template']
+
+# schemas preloaded by warm_up
+_WARMED_SCHEMAS = set()
+
+# svn Date keyword patterns
+RE_SVN_YEAR = re.compile(r'\$Date: (?P<year>\d{4})')
+RE_SVN_DATETIME = re.compile(
+    r'\$Date: (?P<date>\d{4}-\d{2}-\d{2}) (?P<time>\d{2}:\d{2}:\d{2})')
+RE_SVN_YEAR_EMBEDDED = re.compile(
+    r'(?P<start>.*)\$Date: (?P<year>\d{4}).*\$(?P<end>.*)')
+
 
 def get_charstring(option: Union[str, dict], language: str,
                    language_alternate: str = None) -> list:
@@ -120,23 +140,52 @@ def normalize_datestring(datestring: str, format_: str = 'default') -> str:
     """
     groks date string into ISO8601
 
+    Magic keywords are expanded from the date-time snapshot of the current
+    render (see `pygeometa.helpers.now_snapshot`); other strings are
+    memoized.
+
     :param datestring: date in string representation
     :format_: datetring format ('year' or default [full])
 
     :returns: string of properly formatted datestring
     """
 
-    today_and_now = datetime.datetime.now(datetime.timezone.utc)
+    if isinstance(datestring, str):
+        if datestring == '$date$':  # $date$ magic keyword
+            return get_now().strftime('%Y-%m-%d')
+        elif datestring == '$datetime$':  # $datetime$ magic keyword
+            return get_now().strftime('%Y-%m-%dT%H:%M:%SZ')
+        elif datestring == '$year$':  # $year$ magic keyword
+            return get_now().strftime('%Y')
+        elif '$year$' in datestring:  # $year$ magic keyword embedded
+            return datestring.replace('$year$', get_now().strftime('%Y'))
+        return _normalize_datestring(datestring, format_)
+    elif not isinstance(datestring, (datetime.date, int)):
+        raise RuntimeError(f'Invalid datestring: {datestring}')
+
+    # not memoized: equal date-times may normalize differently (e.g. the
+    # same instant in different time zones)
+    return _normalize_datestring.__wrapped__(datestring, format_)
+
 
-    re1 = r'\$Date: (?P<year>\d{4})'
-    re2 = r'\$Date: (?P<date>\d{4}-\d{2}-\d{2}) (?P<time>\d{2}:\d{2}:\d{2})'
-    re3 = r'(?P<start>.*)\$Date: (?P<year>\d{4}).*\$(?P<end>.*)'
+@functools.lru_cache(maxsize=4096)
+def _normalize_datestring(datestring: str, format_: str = 'default') -> str:
+    """
+    groks date string (other than magic keywords) into ISO8601
+
+    :param datestring: date in string representation
+    :format_: datetring format ('year' or default [full])
+
+    :returns: string of properly formatted datestring
+    """
 
     try:
         if isinstance(datestring, datetime.date):
             if datestring.year < 1900:
                 datestring2 = '{0.day:02d}.{0.month:02d}.{0.year:4d}'.format(
                     datestring)
+            elif not isinstance(datestring, datetime.datetime):
+                return datestring.isoformat()
             else:
                 datestring2 = datestring.strftime('%Y-%m-%dT%H:%M:%SZ')
             if datestring2.endswith('T00:00:00Z'):
@@ -144,24 +193,16 @@ def normalize_datestring(datestring: str, format_: str = 'default') -> str:
             return datestring2
         elif isinstance(datestring, int) and len(str(datestring)) == 4:  # year
             return str(datestring)
-        if datestring == '$date$':  # $date$ magic keyword
-            return today_and_now.strftime('%Y-%m-%d')
-        elif datestring == '$datetime$':  # $datetime$ magic keyword
-            return today_and_now.strftime('%Y-%m-%dT%H:%M:%SZ')
-        elif datestring == '$year$':  # $year$ magic keyword
-            return today_and_now.strftime('%Y')
-        elif '$year$' in datestring:  # $year$ magic keyword embedded
-            return datestring.replace('$year$', today_and_now.strftime('%Y'))
-        elif datestring.startswith('$Date'):  # svn Date keyword
+        if datestring.startswith('$Date'):  # svn Date keyword
             if format_ == 'year':
-                mo = re.match(re1, datestring)
+                mo = RE_SVN_YEAR.match(datestring)
                 return mo.group('year')
             else:  # default
-                mo = re.match(re2, datestring)
+                mo = RE_SVN_DATETIME.match(datestring)
                 return f"{mo.group('date')}T{mo.group('time')}"
         elif '$Date' in datestring:  # svn Date keyword embedded
             if format_ == 'year':
-                mo = re.match(re3, datestring)
+                mo = RE_SVN_YEAR_EMBEDDED.match(datestring)
                 return f"{mo.group('start')}{mo.group('year')}{mo.group('end')}"  # noqa
     except (AttributeError, TypeError):
         raise RuntimeError(f'Invalid datestring: {datestring}')
@@ -178,26 +219,17 @@ def prune_distribution_formats(formats: dict) -> list:
     :returns: unique distribution formats list
     """
 
-    counter = 0
-    formats_ = []
-    unique_formats = []
-
-    for k1, v1 in formats.items():
-        row = {}
-        for k2, v2 in v1.items():
-            if k2.startswith('format'):
-                row[k2] = v2
-        formats_.append(row)
+    unique_formats = {}
 
-    num_elements = len(formats)
+    for value in formats.values():
+        row = {k: v for k, v in value.items() if k.startswith('format')}
+        try:
+            key = frozenset(row.items())
+        except TypeError:  # multilingual formats
+            key = get_hashable(row)
+        unique_formats.setdefault(key, row)
 
-    for f in range(0, len(formats_)):
-        counter += 1
-        if formats_[f] not in unique_formats:
-            unique_formats.append(formats_[f])
-        if num_elements == counter:
-            break
-    return unique_formats
+    return list(unique_formats.values())
 
 
 def prune_transfer_option(formats: dict, language: str) -> list:
@@ -210,21 +242,15 @@ def prune_transfer_option(formats: dict, language: str) -> list:
     :returns: unique transfer options list
     """
 
-    unique_transfer = []
-    nil_reasons = ['missing',
-                   'withheld',
-                   'inapplicable',
-                   'unknown',
-                   'template']
+    if language in NIL_REASONS:
+        return list(formats.values())
+
+    language_key = language.split(';')[0]
 
-    for k, v in formats.items():
-        if language.split(";")[0] in k and language not in nil_reasons:
-            unique_transfer.append(v)
-        elif language in nil_reasons:
-            unique_transfer.append(v)
-    return unique_transfer
+    return [v for k, v in formats.items() if language_key in k]
 
 
+@profiled('read_mcf')
 def read_mcf(mcf: Union[dict, str]) -> dict:
     """
     returns dict of YAML file from filepath, string or dict
@@ -309,7 +335,8 @@ def read_mcf(mcf: Union[dict, str]) -> dict:
 
     LOGGER.debug('recursively parsing dict')
 
-    mcf_dict = __parse_mcf_dict_recursive(mcf_dict)
+    with stage('merge_mcf'):
+        mcf_dict = __parse_mcf_dict_recursive(mcf_dict)
 
     LOGGER.debug(f'Fully parsed MCF: {mcf_dict}')
 
@@ -330,18 +357,74 @@ def read_mcf(mcf: Union[dict, str]) -> dict:
     return mcf_dict
 
 
-def import_metadata(schema: str, metadata: str) -> dict:
+def get_safe_basename(value: str, default: str) -> str:
+    """
+    derive a safe file basename from an arbitrary value
+
+    :param value: value (e.g. identifier) to derive basename from
+    :param default: fallback basename if no value is available
+
+    :returns: `str` of file basename
+    """
+
+    if value in [None, '']:
+        return default
+
+    basename = re.sub(r'[^A-Za-z0-9._-]+', '_', str(value))
+
+    return basename.strip('._') or default
+
+
+def get_mcf_filename(mcf: dict, default: str) -> str:
+    """
+    derive a safe MCF filename from an MCF identifier
+
+    :param mcf: dict of MCF data
+    :param default: fallback basename if no identifier is available
+
+    :returns: `str` of MCF filename
+    """
+
+    identifier = mcf.get('metadata', {}).get('identifier')
+
+    return f'{get_safe_basename(identifier, default)}.yml'
+
+
+def write_mcf(mcf_and_filename: tuple) -> pathlib.Path:
+    """
+    write an MCF to disk
+
+    :param mcf_and_filename: `tuple` of dict of MCF data and
+                             `pathlib.Path` filepath of MCF
+
+    :returns: `pathlib.Path` of MCF written
+    """
+
+    mcf, filename = mcf_and_filename
+
+    LOGGER.debug(f'Writing {filename}')
+    with filename.open('w', encoding='utf-8') as fh:
+        yaml.dump(mcf, fh, indent=4)
+
+    return filename
+
+
+def import_metadata(schema: str, metadata: str,
+                    raise_errors: bool = False) -> dict:
     """
     Import metadata
 
     :param schema: schema / format
     :metadata: metadata string
+    :param raise_errors: whether to raise an exception with the reason
+                         of a failed import instead of returning `None`
 
     :returns: MCF object
     """
 
     content = None
     error_message = None
+    error_trace = None
 
     if schema == 'autodetect':
         schemas = get_supported_schemas()
@@ -371,38 +454,46 @@ def import_metadata(schema: str, metadata: str) -> dict:
             error_message = f'Import failed: {err}'
             error_trace = traceback.format_exc()
 
-    if error_message is not None:
+    if content is None and error_message is not None:
         LOGGER.warning(error_message)
         LOGGER.debug(error_trace)
 
+    if content is None and raise_errors:
+        raise RuntimeError(error_message or 'No supported schema found')
+
     return content
 
 
 def transform_metadata(input_schema: str, output_schema: str,
-                       metadata: str) -> str:
+                       metadata: str, raise_errors: bool = False) -> str:
     """
     Transform metadata
 
     :param input_schema: input schema / format
     :param output_schema: output schema / format
     :metadata: metadata string
+    :param raise_errors: whether to raise an exception with the reason
+                         of a failed transform instead of returning `None`
 
     :returns: transformed metadata or `None`
     """
 
     try:
-        content = import_metadata(input_schema, metadata)
+        content = import_metadata(input_schema, metadata, raise_errors)
 
         LOGGER.info(f'Processing into {output_schema}')
         schema_object_output = load_schema(output_schema)
         content = schema_object_output.write(content)
     except Exception as err:
         LOGGER.debug(err)
+        if raise_errors:
+            raise
         return None
 
     return content
 
 
+@profiled('pretty_print')
 def pretty_print(xml: str) -> str:
     """
     clean up indentation and spacing
@@ -417,23 +508,19 @@ def pretty_print(xml: str) -> str:
     return '\n'.join([val for val in val.toprettyxml(indent=' '*2).split('\n') if val.strip()])  # noqa
 
 
-def render_j2_template(mcf: dict, template_dir: str = None) -> str:
+@functools.lru_cache(maxsize=32)
+def get_template_environment(template_dir: str) -> Environment:
     """
-    convenience function to render Jinja2 template given
-    an mcf file, string, or dict
+    convenience function to get a Jinja2 template environment
+
+    Environments are cached per template directory, so that templates
+    are loaded and compiled once per process.
 
-    :param mcf: dict of MCF data
     :param template_dir: directory of schema templates
 
-    :returns: str of metadata output
+    :returns: `jinja2.Environment` object
     """
 
-    LOGGER.debug('Evaluating template directory')
-    if template_dir is None:
-        msg = 'template_dir or schema_local required'
-        LOGGER.error(msg)
-        raise RuntimeError(msg)
-
     LOGGER.debug(f'Setting up template environment {template_dir}')
     env = Environment(loader=FileSystemLoader([template_dir, SCHEMAS]))
 
@@ -449,6 +536,30 @@ def render_j2_template(mcf: dict, template_dir: str = None) -> str:
     env.globals.update(prune_distribution_formats=prune_distribution_formats)
     env.globals.update(prune_transfer_option=prune_transfer_option)
 
+    return env
+
+
+@profiled('render_j2_template')
+@now_scoped
+def render_j2_template(mcf: dict, template_dir: str = None) -> str:
+    """
+    convenience function to render Jinja2 template given
+    an mcf file, string, or dict
+
+    :param mcf: dict of MCF data
+    :param template_dir: directory of schema templates
+
+    :returns: str of metadata output
+    """
+
+    LOGGER.debug('Evaluating template directory')
+    if template_dir is None:
+        msg = 'template_dir or schema_local required'
+        LOGGER.error(msg)
+        raise RuntimeError(msg)
+
+    env = get_template_environment(template_dir)
+
     try:
         LOGGER.debug('Loading template')
         template = env.get_template('main.j2')
@@ -463,26 +574,79 @@ def render_j2_template(mcf: dict, template_dir: str = None) -> str:
     return pretty_print(xml)
 
 
-def validate_mcf(instance_dict: dict) -> bool:
+@functools.lru_cache(maxsize=1)
+def get_mcf_validator() -> Validator:
     """
-    Validate an MCF document against the MCF schema
+    Get a validator of the MCF schema
 
-    :param instance_dict: dict of MCF instance
+    The MCF schema is loaded and checked once per process.
 
-    :returns: `bool` of validation
+    :returns: `jsonschema.protocols.Validator` object
     """
 
     schema_file = SCHEMAS / 'mcf' / 'core.yaml'
 
+    LOGGER.debug(f'Loading MCF schema {schema_file}')
     with schema_file.open() as fh2:
         schema_dict = yaml_load(fh2)
 
-        try:
-            jsonschema_validate(instance_dict, schema_dict)
-        except ValidationError as err:
-            raise MCFValidationError(repr(err))
+    validator_class = validator_for(schema_dict)
+    validator_class.check_schema(schema_dict)
+
+    return validator_class(schema_dict)
+
+
+def warm_up(schemas: list = None, validator: bool = True) -> None:
+    """
+    Preload schemas, compile their templates and build the MCF validator,
+    so that the first request of a long-running process is as fast as
+    subsequent ones
+
+    Each schema is only warmed up once per process.
+
+    :param schemas: `list` of schema names (default: all schemas)
+    :param validator: whether to build the MCF validator
+
+    :returns: `None`
+    """
+
+    if schemas is None:
+        schemas = get_supported_schemas()
 
-        return True
+    for schema in schemas:
+        if schema in _WARMED_SCHEMAS:
+            continue
+
+        LOGGER.debug(f'Warming up {schema}')
+        schema_object = load_schema(schema)
+
+        template_dir = schema_object.template_dir
+        if template_dir is not None and os.path.exists(
+                os.path.join(template_dir, 'main.j2')):
+            get_template_environment(template_dir).get_template('main.j2')
+
+        _WARMED_SCHEMAS.add(schema)
+
+    if validator:
+        get_mcf_validator()
+
+
+@profiled('validate_mcf')
+def validate_mcf(instance_dict: dict) -> bool:
+    """
+    Validate an MCF document against the MCF schema
+
+    :param instance_dict: dict of MCF instance
+
+    :returns: `bool` of validation
+    """
+
+    error = best_match(get_mcf_validator().iter_errors(instance_dict))
+
+    if error is not None:
+        raise MCFValidationError(repr(error))
+
+    return True
 
 
 def get_abspath(mcf, filepath):
@@ -513,6 +677,29 @@ def get_typed_value(value) -> Union[float, int, str]:
     return value2
 
 
+# support environment variables in config
+# https://stackoverflow.com/a/55301129
+ENV_VAR_MATCHER = re.compile(r'.*\$\{([^}^{]+)\}.*')
+
+
+def _env_var_constructor(loader, node):
+    env_var = ENV_VAR_MATCHER.match(node.value).group(1)
+    if env_var not in os.environ:
+        msg = f'Undefined environment variable {env_var} in config'
+        raise EnvironmentError(msg)
+    return get_typed_value(os.path.expandvars(node.value))
+
+
+# use the libyaml parser if available
+class EnvVarLoader(getattr(yaml, 'CSafeLoader', yaml.SafeLoader)):
+    pass
+
+
+EnvVarLoader.add_implicit_resolver('!path', ENV_VAR_MATCHER, None)
+EnvVarLoader.add_constructor('!path', _env_var_constructor)
+
+
+@profiled('yaml_load')
 def yaml_load(obj: Union[IO, str]) -> dict:
     """
     serializes a YAML files into a pyyaml object
@@ -522,23 +709,6 @@ def yaml_load(obj: Union[IO, str]) -> dict:
     :returns: `dict` representation of YAML
     """
 
-    # support environment variables in config
-    # https://stackoverflow.com/a/55301129
-    path_matcher = re.compile(r'.*\$\{([^}^{]+)\}.*')
-
-    def path_constructor(loader, node):
-        env_var = path_matcher.match(node.value).group(1)
-        if env_var not in os.environ:
-            msg = f'Undefined environment variable {env_var} in config'
-            raise EnvironmentError(msg)
-        return get_typed_value(os.path.expandvars(node.value))
-
-    class EnvVarLoader(yaml.SafeLoader):
-        pass
-
-    EnvVarLoader.add_implicit_resolver('!path', path_matcher, None)
-    EnvVarLoader.add_constructor('!path', path_constructor)
-
     return yaml.load(obj, Loader=EnvVarLoader)
 
 
@@ -552,18 +722,105 @@ class MCFValidationError(Exception):
     pass
 
 
+def forward_request(socket_path: str, request: dict) -> Union[dict, None]:
+    """
+    Forward a CLI request to a running pygeometa server
+
+    The active date-time snapshot (see `--now-scope`) is forwarded with
+    the request.  JSON serialization and profiling options apply to the
+    server process as a whole, so cannot be combined with forwarding.
+
+    :param socket_path: filepath of Unix socket
+    :param request: `dict` of request
+                    (see `pygeometa.server.handle_request`)
+
+    :returns: `dict` of response, or `None` if no server is reachable
+    """
+
+    from pygeometa.server import send_request
+
+    ctx = click.get_current_context()
+    options = [f"--{name.replace('_', '-')}"
+               for name in ['json_format', 'json_backend', 'profile']
+               if ctx.get_parameter_source(name) not in
+               [None, ParameterSource.DEFAULT]]
+    if options:
+        raise click.UsageError(
+            f"{', '.join(options)} cannot be used with --socket")
+
+    now = get_now_snapshot()
+    if now is not None:
+        request = {**request, 'now': now.isoformat()}
+
+    try:
+        response = send_request(socket_path, request)
+    except (OSError, ValueError) as err:
+        LOGGER.debug(f'Server not reachable ({err}); processing locally')
+        return None
+
+    if response['status'] != 'ok':
+        raise click.ClickException(response['error'])
+
+    return response
+
+
 @click.command('import')
 @click.pass_context
 @cli_options.ARGUMENT_METADATA_FILE
 @cli_options.OPTION_OUTPUT
 @cli_options.OPTION_VERBOSITY
+@cli_options.OPTION_PROFILE
 @click.option('-s', '--schema', required=True,
               type=click.Choice(get_supported_schemas(include_autodetect=True)),  # noqa
               default='autodetect',
               help='Metadata schema')
-def import_(ctx, metadata_file, schema, output, verbosity):
+@click.option('--output-dir', '-d',
+              type=click.Path(file_okay=False, path_type=pathlib.Path),
+              help='Directory to write one MCF per imported record')
+@cli_options.OPTION_JOBS
+def import_(ctx, metadata_file, schema, output, output_dir, jobs, verbosity):
     """import metadata"""
 
+    if output_dir is not None:
+        if schema == 'autodetect':
+            raise click.UsageError('--output-dir requires --schema')
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        schema_object = load_schema(schema)
+
+        def mcfs():
+            # records sharing an identifier get a numbered suffix rather
+            # than overwriting each other
+            filenames = set()
+            for count, content in enumerate(
+                    schema_object.import_iter(metadata_file), start=1):
+                filename = get_mcf_filename(content, f'record-{count}')
+                stem, suffix = filename[:-4], 2
+                while filename in filenames:
+                    filename = f'{stem}-{suffix}.yml'
+                    suffix += 1
+                if suffix > 2:
+                    LOGGER.warning(f'Duplicate record {stem}; writing '
+                                   f'{filename}')
+                filenames.add(filename)
+                yield content, output_dir / filename
+
+        count = 0
+        try:
+            if jobs == 1:
+                for count, mcf_and_filename in enumerate(mcfs(), 1):
+                    write_mcf(mcf_and_filename)
+            else:
+                LOGGER.debug(f'Writing MCFs with {jobs} workers')
+                with ProcessPoolExecutor(max_workers=jobs) as executor:
+                    results = bounded_imap(executor, write_mcf, mcfs())
+                    count = sum(1 for _ in results)
+        except NotImplementedError:
+            raise click.ClickException(f'Import not supported for {schema}')
+
+        click.echo(f'Imported {count} record(s) into {output_dir}')
+        return
+
     try:
         content = import_metadata(schema, metadata_file.read())
         if output is None:
@@ -577,7 +834,7 @@ def import_(ctx, metadata_file, schema, output, verbosity):
 
 @click.command()
 @click.pass_context
-@cli_options.ARGUMENT_MCF
+@click.argument('mcf', nargs=-1, required=True)
 @cli_options.OPTION_OUTPUT
 @click.option('--schema',
               type=click.Choice(get_supported_schemas()),
@@ -586,8 +843,27 @@ def import_(ctx, metadata_file, schema, output, verbosity):
               type=click.Path(exists=True, resolve_path=True,
                               dir_okay=True, file_okay=False),
               help='Locally defined metadata schema')
+@click.option('--output-dir', '-d',
+              type=click.Path(file_okay=False, path_type=pathlib.Path),
+              help='Directory to write batch outputs to')
+@click.option('--output-template',
+              help='Batch output filepath template with fields {outdir}, '
+                   '{identifier}, {stem}, {schema} and {ext} '
+                   '(default: {outdir}/{identifier}.{schema}.{ext})')
+@click.option('--manifest',
+              type=click.Path(dir_okay=False, path_type=pathlib.Path),
+              help='Manifest file for incremental batch generation')
+@cli_options.OPTION_OUTPUT_ARCHIVE
+@cli_options.OPTION_ARCHIVE_INDEX
+@cli_options.OPTION_JOBS
+@cli_options.OPTION_SOCKET
 @cli_options.OPTION_VERBOSITY
-def generate(ctx, mcf, schema, schema_local, output, verbosity):
+@cli_options.OPTION_PROFILE
+@cli_options.OPTION_JSON
+@cli_options.OPTION_NOW_SCOPE
+def generate(ctx, mcf, schema, schema_local, output, output_dir,
+             output_template, manifest, output_archive, archive_index, jobs,
+             socket, verbosity):
     """generate metadata"""
 
     if schema is None and schema_local is None:
@@ -595,13 +871,63 @@ def generate(ctx, mcf, schema, schema_local, output, verbosity):
     elif None not in [schema, schema_local]:
         raise click.UsageError('schema / schema_local are mutually exclusive')
 
-    mcf_dict = read_mcf(mcf)
-
-    if schema is not None:
+    if [output_dir, output_template, output_archive] != [None] * 3:
+        from pygeometa.batch import DEFAULT_OUTPUT_TEMPLATE, generate_batch
+
+        if output is not None:
+            raise click.UsageError(
+                'output / output-dir / output-template / output-archive are mutually exclusive')  # noqa
+        if None not in [manifest, output_archive]:
+            raise click.UsageError(
+                'manifest / output-archive are mutually exclusive')
+
+        statuses = dict.fromkeys(
+            ['generated', 'unchanged', 'skipped', 'failed'], 0)
+        results = generate_batch(
+            mcf, schema=schema, schema_local=schema_local,
+            output_template=output_template or DEFAULT_OUTPUT_TEMPLATE,
+            outdir=output_dir or '.', jobs=jobs, manifest=manifest,
+            output_archive=output_archive, archive_index=archive_index)
+
+        for result in results:
+            statuses[result['status']] += 1
+            if result['error'] is not None:
+                click.echo(f"{result['mcf']}: {result['error']}", err=True)
+            else:
+                LOGGER.info(f"{result['output']}: {result['status']}")
+
+        summary = ', '.join(f'{v} {k}' for k, v in statuses.items())
+        click.echo(f'Processed {sum(statuses.values())} record(s): {summary}')
+        if statuses['failed']:
+            ctx.exit(1)
+        return
+
+    if manifest is not None:
+        raise click.UsageError('--manifest requires batch generation')
+
+    if len(mcf) > 1:
+        raise click.UsageError('Multiple MCFs require --output-dir, --output-template or --output-archive')  # noqa
+
+    mcf = mcf[0]
+
+    response = None
+    if socket is not None:
+        response = forward_request(socket, {
+            'action': 'generate',
+            'mcf': os.path.abspath(mcf) if os.path.exists(mcf) else mcf,
+            'schema': schema,
+            'schema_local': schema_local
+        })
+
+    if response is not None:
+        content = response['result']
+    elif schema is not None:
         LOGGER.info(f'Processing {mcf} into {schema}')
+        mcf_dict = read_mcf(mcf)
         schema_object = load_schema(schema)
         content = schema_object.write(mcf_dict)
     else:
+        mcf_dict = read_mcf(mcf)
         content = render_j2_template(mcf_dict, template_dir=schema_local)
 
     if output is None:
@@ -644,14 +970,24 @@ def schemas(ctx, verbosity):
 @click.command()
 @click.pass_context
 @cli_options.ARGUMENT_MCF
+@cli_options.OPTION_SOCKET
 @cli_options.OPTION_VERBOSITY
-def validate(ctx, mcf, verbosity):
+@cli_options.OPTION_PROFILE
+def validate(ctx, mcf, socket, verbosity):
     """validate MCF Document"""
 
     click.echo(f'Validating {mcf}')
 
-    instance = json.loads(json_dumps(read_mcf(mcf)))
-    validate_mcf(instance)
+    response = None
+    if socket is not None:
+        response = forward_request(socket, {
+            'action': 'validate',
+            'mcf': os.path.abspath(mcf) if os.path.exists(mcf) else mcf
+        })
+
+    if response is None:
+        instance = json.loads(json_dumps(read_mcf(mcf)))
+        validate_mcf(instance)
 
     click.echo('Valid MCF document')
 
@@ -661,6 +997,9 @@ def validate(ctx, mcf, verbosity):
 @cli_options.ARGUMENT_METADATA_FILE
 @cli_options.OPTION_OUTPUT
 @cli_options.OPTION_VERBOSITY
+@cli_options.OPTION_PROFILE
+@cli_options.OPTION_JSON
+@cli_options.OPTION_NOW_SCOPE
 @click.option('--input-schema', required=True,
               type=click.Choice(get_supported_schemas(include_autodetect=True)),  # noqa
               default='autodetect',
@@ -668,12 +1007,79 @@ def validate(ctx, mcf, verbosity):
 @click.option('--output-schema', required=True,
               type=click.Choice(get_supported_schemas()),
               help='Metadata schema of input file')
+@click.option('--input-format', type=click.Choice(['text', 'ndjson']),
+              default='text',
+              help='Input format: a single metadata document (default) or '
+                   'newline-delimited JSON records')
+@click.option('--output-format', type=click.Choice(['text', 'ndjson']),
+              default='text',
+              help='Output format: a single metadata document (default) or '
+                   'newline-delimited JSON records')
+@click.option('--unordered', is_flag=True,
+              help='Write NDJSON records as they complete rather than in '
+                   'input order')
+@click.option('--error-output', type=click.File('w', encoding='utf-8'),
+              help='File to write NDJSON record errors to (default: stderr)')
+@cli_options.OPTION_OUTPUT_ARCHIVE
+@cli_options.OPTION_ARCHIVE_INDEX
+@cli_options.OPTION_JOBS
+@cli_options.OPTION_SOCKET
 def transform(ctx, metadata_file, input_schema, output_schema, output,
-              verbosity):
+              input_format, output_format, unordered, error_output,
+              output_archive, archive_index, jobs, socket, verbosity):
     """transform metadata"""
 
-    content = transform_metadata(input_schema, output_schema,
-                                 metadata_file.read())
+    if output_archive is not None and input_format != 'ndjson':
+        raise click.UsageError('--output-archive requires ndjson input')
+
+    if 'ndjson' in [input_format, output_format]:
+        from pygeometa.batch import transform_ndjson
+
+        if input_format != output_format and output_archive is None:
+            raise click.UsageError(
+                '--input-format and --output-format must both be ndjson')
+
+        if output is None:
+            output = click.get_text_stream('stdout')
+        if error_output is None:
+            error_output = click.get_text_stream('stderr')
+
+        failed = 0
+        results = transform_ndjson(metadata_file, input_schema,
+                                   output_schema, jobs, not unordered,
+                                   output_archive, archive_index)
+
+        for result in results:
+            if result['error'] is None:
+                if output_archive is None:
+                    output.write(f"{result['output']}\n")
+            else:
+                failed += 1
+                result.pop('output')
+                error_output.write(json.dumps(result) + '\n')
+
+        output.flush()
+
+        if failed:
+            LOGGER.warning(f'{failed} record(s) failed')
+            ctx.exit(1)
+        return
+
+    metadata = metadata_file.read()
+
+    response = None
+    if socket is not None:
+        response = forward_request(socket, {
+            'action': 'transform',
+            'metadata': metadata,
+            'input_schema': input_schema,
+            'output_schema': output_schema
+        })
+
+    if response is not None:
+        content = response['result']
+    else:
+        content = transform_metadata(input_schema, output_schema, metadata)
 
     if content is None:
         raise click.ClickException('No supported input schema detected/found')
@@ -682,3 +1088,25 @@ def transform(ctx, metadata_file, input_schema, output_schema, output,
         click.echo(content)
     else:
         output.write(content)
+
+
+@click.command()
+@click.pass_context
+@click.option('--socket', required=True, type=click.Path(dir_okay=False),
+              help='Unix socket to listen on')
+@cli_options.OPTION_VERBOSITY
+def serve(ctx, socket, verbosity):
+    """serve metadata processing over a Unix socket"""
+
+    from pygeometa.server import serve as serve_
+
+    signal.signal(signal.SIGTERM, lambda *args: sys.exit(0))
+
+    click.echo(f'Serving on {socket}')
+
+    try:
+        serve_(socket)
+    except KeyboardInterrupt:
+        pass
+    except RuntimeError as err:
+        raise click.ClickException(err)
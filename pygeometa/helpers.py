@@ -44,28 +44,220 @@
 # =================================================================
 
 import base64
-from datetime import date, datetime, time
+import codecs
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import Executor, FIRST_COMPLETED, wait
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime, time, timezone
 from decimal import Decimal
+import functools
 import json
 import logging
 from pathlib import Path
-from typing import Any
+import re
+from typing import Any, Callable, IO, Iterable, Iterator, Union
+
+from pygeometa.profiling import profiled
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 LOGGER = logging.getLogger(__name__)
 
+JSON_BACKENDS = ['json', 'orjson', 'auto']
+
+# process-wide JSON serialization defaults (see set_json_options)
+_JSON_OPTIONS = {
+    'backend': 'json',
+    'compact': False
+}
+
+DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+# tokens of JSON values relevant to finding their end: whole strings,
+# brackets, and the opening quote of a string not yet read completely;
+# and delimiters ending a number or literal (see json_iter)
+JSON_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]|"', re.DOTALL)
+JSON_SCALAR_END = re.compile(r'[\s,\]}]')
+
+NOW_SCOPES = ['render', 'batch']
+
+# date-time snapshot of the current render or batch (see now_snapshot)
+_NOW = ContextVar('now', default=None)
+
 THISDIR = Path(__file__).resolve().parent
 
 
-def json_dumps(obj) -> str:
+def get_json_options() -> dict:
+    """
+    Get the process-wide JSON serialization defaults
+
+    :returns: `dict` of JSON backend (`backend`) and whether to
+              serialize compactly (`compact`)
+    """
+
+    return dict(_JSON_OPTIONS)
+
+
+def set_json_options(backend: str = None, compact: bool = None) -> None:
+    """
+    Set the process-wide JSON serialization defaults, used by all JSON
+    output schemas
+
+    :param backend: JSON backend: `json` (standard library, default),
+                    `orjson` (requires orjson) or `auto` (orjson if
+                    installed, else `json`)
+    :param compact: whether to serialize without indentation and
+                    whitespace (default is indented)
+
+    :returns: `None`
+    """
+
+    if backend is not None:
+        get_json_backend(backend)
+        _JSON_OPTIONS['backend'] = backend
+    if compact is not None:
+        _JSON_OPTIONS['compact'] = compact
+
+
+def get_json_backend(backend: str = None) -> str:
+    """
+    Resolve a JSON backend
+
+    :param backend: JSON backend (see `set_json_options`, default is
+                    the process-wide default)
+
+    :returns: `str` of JSON backend (`json` or `orjson`)
+    """
+
+    if backend is None:
+        backend = _JSON_OPTIONS['backend']
+
+    if backend == 'auto':
+        return 'json' if orjson is None else 'orjson'
+    elif backend == 'orjson' and orjson is None:
+        msg = 'orjson JSON backend requested but orjson is not installed'
+        LOGGER.error(msg)
+        raise RuntimeError(msg)
+    elif backend not in JSON_BACKENDS:
+        msg = f'Invalid JSON backend {backend}'
+        LOGGER.error(msg)
+        raise ValueError(msg)
+
+    return backend
+
+
+def json_encode(obj, compact: bool = None, backend: str = None) -> bytes:
+    """
+    Helper function to dump dict to UTF-8 encoded JSON
+
+    The orjson backend serializes datetimes natively and indents with
+    2 (rather than 4) spaces.
+
+    :param obj: `dict` of JSON
+    :param compact: whether to serialize without indentation and
+                    whitespace (default is the process-wide default)
+    :param backend: JSON backend (see `set_json_options`, default is the
+                    process-wide default)
+
+    :returns: `bytes` of JSON
+    """
+
+    if compact is None:
+        compact = _JSON_OPTIONS['compact']
+
+    if get_json_backend(backend) == 'orjson':
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=json_serial, option=option)
+
+    return _json_dumps(obj, compact).encode('utf-8')
+
+
+@profiled('json_dumps')
+def json_dumps(obj, compact: bool = None, backend: str = None) -> str:
     """
     Helper function to dump dict to JSON string
 
     :param obj: `dict` of JSON
+    :param compact: whether to serialize without indentation and
+                    whitespace (default is the process-wide default)
+    :param backend: JSON backend (see `set_json_options`, default is the
+                    process-wide default)
 
     :returns: `str` of JSON
     """
 
-    return json.dumps(obj, default=json_serial, indent=4, ensure_ascii=False)
+    if compact is None:
+        compact = _JSON_OPTIONS['compact']
+
+    if get_json_backend(backend) == 'orjson':
+        return json_encode(obj, compact, 'orjson').decode('utf-8')
+
+    return _json_dumps(obj, compact)
+
+
+def json_dump(obj, fh: IO, compact: bool = None, backend: str = None) -> None:
+    """
+    Helper function to dump dict as UTF-8 encoded JSON to a binary file,
+    without building an intermediate string with the standard library
+    backend
+
+    :param obj: `dict` of JSON
+    :param fh: binary file-like object
+    :param compact: whether to serialize without indentation and
+                    whitespace (default is the process-wide default)
+    :param backend: JSON backend (see `set_json_options`, default is the
+                    process-wide default)
+
+    :returns: `None`
+    """
+
+    if compact is None:
+        compact = _JSON_OPTIONS['compact']
+
+    if get_json_backend(backend) == 'orjson':
+        fh.write(json_encode(obj, compact, 'orjson'))
+        return
+
+    json.dump(obj, codecs.getwriter('utf-8')(fh), default=json_serial,
+              ensure_ascii=False, **_get_json_format(compact))
+
+
+def _get_json_format(compact: bool) -> dict:
+    """
+    Get standard library JSON formatting arguments
+
+    :param compact: whether to serialize without indentation and
+                    whitespace
+
+    :returns: `dict` of `json.dumps` keyword arguments
+    """
+
+    if compact:
+        return {'separators': (',', ':')}
+
+    return {'indent': 4}
+
+
+def _json_dumps(obj, compact: bool) -> str:
+    """
+    Dump dict to JSON string with the standard library backend
+
+    :param obj: `dict` of JSON
+    :param compact: whether to serialize without indentation and
+                    whitespace
+
+    :returns: `str` of JSON
+    """
+
+    return json.dumps(obj, default=json_serial, ensure_ascii=False,
+                      **_get_json_format(compact))
 
 
 def json_serial(obj) -> Any:
@@ -86,15 +278,101 @@ def json_serial(obj) -> Any:
             return obj.decode('utf-8')
         except UnicodeDecodeError:
             LOGGER.debug('Returning as base64 encoded JSON object')
-            return base64.b64encode(obj)
+            return base64.b64encode(obj).decode('ascii')
     elif isinstance(obj, Decimal):
         return float(obj)
+    elif isinstance(obj, Mapping):  # e.g. pygeometa.model objects
+        return dict(obj)
 
     msg = f'{obj} type {type(obj)} not serializable'
     LOGGER.error(msg)
     raise TypeError(msg)
 
 
+def get_now() -> datetime:
+    """
+    Helper function to get the current date-time, which is the same
+    throughout a render or batch if a snapshot is active
+
+    :returns: `datetime.datetime` of current UTC date-time
+    """
+
+    now = _NOW.get()
+
+    if now is None:
+        now = datetime.now(timezone.utc)
+
+    return now
+
+
+def get_now_snapshot() -> Union[datetime, None]:
+    """
+    Helper function to get the active date-time snapshot
+
+    :returns: `datetime.datetime` of snapshot, or `None` if none is active
+    """
+
+    return _NOW.get()
+
+
+def set_now_snapshot(now: Union[datetime, None]) -> None:
+    """
+    Helper function to set the date-time snapshot of the current context
+    (e.g. of a worker process to that of its parent process)
+
+    :param now: `datetime.datetime` of snapshot, or `None` to unset
+
+    :returns: `None`
+    """
+
+    _NOW.set(now)
+
+
+@contextmanager
+def now_snapshot(now: datetime = None) -> Iterator[datetime]:
+    """
+    Context manager to capture a single current date-time for all dates
+    derived within its block
+
+    Snapshots nest: an inner snapshot (e.g. of a render) keeps the
+    date-time of the outermost one (e.g. of a batch).
+
+    :param now: `datetime.datetime` of snapshot (default is now)
+
+    :returns: iterator of `datetime.datetime` of snapshot
+    """
+
+    current = _NOW.get()
+
+    if current is not None:
+        yield current
+        return
+
+    token = _NOW.set(now or datetime.now(timezone.utc))
+    try:
+        yield _NOW.get()
+    finally:
+        _NOW.reset(token)
+
+
+def now_scoped(func: Callable) -> Callable:
+    """
+    Decorator to run a function (e.g. a render) within a date-time
+    snapshot
+
+    :param func: function to decorate
+
+    :returns: decorated function
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with now_snapshot():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
 def generate_datetime(date_value: str) -> str:
     """
     Helper function to derive RFC3339 date from MCF date type
@@ -104,37 +382,278 @@ def generate_datetime(date_value: str) -> str:
     :returns: `str` of date-time value
     """
 
-    value = None
-
     if isinstance(date_value, str) and date_value != 'None':
-        if len(date_value) == 10:  # YYYY-MM-DD
-            format_ = '%Y-%m-%d'
-        elif len(date_value) == 7:  # YYYY-MM
-            format_ = '%Y-%m'
-        elif len(date_value) == 4:  # YYYY
-            format_ = '%Y'
-        elif len(date_value) == 19:  # YYYY-MM-DDTHH:MM:SS
-            msg = 'YYYY-MM-DDTHH:MM:SS with no timezone; converting to UTC'
-            LOGGER.debug(msg)
-            format_ = '%Y-%m-%dT%H:%M:%S'
-
-        LOGGER.debug('date type found; expanding to date-time')
-        value = datetime.strptime(date_value, format_).strftime('%Y-%m-%dT%H:%M:%SZ')  # noqa
+        return _parse_datestring(date_value)
 
     elif isinstance(date_value, int) and len(str(date_value)) == 4:
-        date_value2 = str(date_value)
         LOGGER.debug('date type found; expanding to date-time')
-        format_ = '%Y'
-        value = datetime.strptime(date_value2, format_).strftime('%Y-%m-%dT%H:%M:%SZ')  # noqa
+        return f'{date_value}-01-01T00:00:00Z'
 
     elif isinstance(date_value, (date, datetime)):
-        value = date_value.strftime('%Y-%m-%dT%H:%M:%SZ')
+        return date_value.strftime(DATETIME_FORMAT)
 
     elif date_value in [None, 'None']:
-        value = datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ')
+        return get_now().strftime(DATETIME_FORMAT)
 
     else:
         msg = f'Unknown date string: {date_value}'
         raise RuntimeError(msg)
 
+
+@functools.lru_cache(maxsize=4096)
+def _parse_datestring(date_value: str) -> str:
+    """
+    Helper function to derive RFC3339 date-time from an ISO 8601 date
+    string (YYYY, YYYY-MM, YYYY-MM-DD or date-time), with date-times
+    converted to UTC
+
+    :param date_value: `str` of date value
+
+    :returns: `str` of date-time value
+    """
+
+    try:
+        if len(date_value) == 4:  # YYYY
+            value = datetime(int(date_value), 1, 1)
+        elif len(date_value) == 7:  # YYYY-MM
+            value = datetime.fromisoformat(f'{date_value}-01')
+        else:
+            value = datetime.fromisoformat(date_value)
+    except ValueError:
+        msg = f'Unknown date string: {date_value}'
+        raise RuntimeError(msg)
+
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+
+    return value.strftime(DATETIME_FORMAT)
+
+
+def get_hashable(value: Any) -> Any:
+    """
+    Helper function to derive a hashable key from a (nested) value,
+    such that equal values have equal keys
+
+    :param value: value (e.g. `dict` of MCF contact)
+
+    :returns: hashable representation of value
+    """
+
+    if isinstance(value, Mapping):
+        return frozenset((k, get_hashable(v)) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        return tuple(get_hashable(v) for v in value)
+    elif isinstance(value, set):
+        return frozenset(get_hashable(v) for v in value)
+
     return value
+
+
+def group_contacts(contacts: dict) -> list:
+    """
+    Helper function to group identical MCF contacts, in a single pass
+
+    :param contacts: `dict` of MCF contacts (role to contact)
+
+    :returns: `list` of `dict` of contact (`contact`) and the roles it
+              is defined for (`roles`), in first occurrence order
+    """
+
+    groups = {}
+
+    for role, contact in contacts.items():
+        key = get_hashable(contact)
+        if key in groups:
+            LOGGER.debug('Found matching contact; adding role')
+            groups[key]['roles'].append(role)
+        else:
+            LOGGER.debug('Adding contact')
+            groups[key] = {
+                'contact': contact,
+                'roles': [role]
+            }
+
+    return list(groups.values())
+
+
+def json_iter(fh: IO, key: str = 'results',
+              chunk_size: int = 65536) -> Iterator[Any]:
+    """
+    Helper function to incrementally parse JSON records from a file-like
+    object with bounded memory
+
+    Records are yielded from a top-level array, from the `key` array of
+    a top-level object (any other members are skipped), or as the
+    top-level object itself if it has no `key` array.  Multiple
+    top-level values (e.g. JSON Lines) are supported.
+
+    :param fh: file-like object (text or binary) of JSON content
+    :param key: name of member holding the array of records
+    :param chunk_size: number of bytes/characters per read
+
+    :returns: iterator of parsed JSON records
+    """
+
+    decoder = json.JSONDecoder()
+    utf8_decoder = codecs.getincrementaldecoder('utf-8')()
+    state = {'buffer': '', 'pos': 0, 'eof': False}
+
+    # progress of scanning for the end of the value at `pos`, so that
+    # each token is scanned once however many reads a value spans
+    scan = {'pos': 0, 'depth': 0}
+
+    def fill(size: int = chunk_size) -> bool:
+        if state['eof']:
+            return False
+
+        data = fh.read(size)
+        if not data:
+            state['eof'] = True
+            return False
+
+        if isinstance(data, bytes):
+            data = utf8_decoder.decode(data)
+
+        scan['pos'] -= state['pos']
+        state['buffer'] = state['buffer'][state['pos']:] + data
+        state['pos'] = 0
+        return True
+
+    def peek() -> str:
+        while True:
+            buffer, pos = state['buffer'], state['pos']
+            while pos < len(buffer) and buffer[pos] in ' \t\n\r':
+                pos += 1
+            state['pos'] = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not fill():
+                return ''
+
+    def consume(expected: str) -> None:
+        if peek() != expected:
+            msg = f'Expected {expected!r} at position {state["pos"]}'
+            raise ValueError(msg)
+        state['pos'] += 1
+
+    def is_complete() -> bool:
+        # scan on from where the previous read left off
+        buffer = state['buffer']
+
+        if buffer[state['pos']] not in '{["':
+            match = JSON_SCALAR_END.search(buffer, scan['pos'])
+            scan['pos'] = len(buffer)
+            return match is not None
+
+        for match in JSON_TOKEN.finditer(buffer, scan['pos']):
+            token = match.group()
+            if token == '"':  # string continues in the next read
+                scan['pos'] = match.start()
+                return False
+            if token in '{[':
+                scan['depth'] += 1
+            elif token in '}]':
+                scan['depth'] -= 1
+            if scan['depth'] == 0:
+                return True
+
+        scan['pos'] = len(buffer)
+        return False
+
+    def decode() -> Any:
+        if peek():
+            scan.update(pos=state['pos'], depth=0)
+            # values spanning many reads grow the reads geometrically, so
+            # that the buffer is copied a bounded number of times
+            while not is_complete() and fill(
+                    max(chunk_size, len(state['buffer']) - state['pos'])):
+                pass
+
+        value, state['pos'] = decoder.raw_decode(state['buffer'],
+                                                 state['pos'])
+        return value
+
+    def iter_array() -> Iterator[Any]:
+        consume('[')
+        if peek() == ']':
+            consume(']')
+            return
+        while True:
+            yield decode()
+            if peek() == ',':
+                consume(',')
+            else:
+                consume(']')
+                return
+
+    while peek():
+        if peek() == '[':
+            yield from iter_array()
+            continue
+        elif peek() != '{':
+            yield decode()
+            continue
+
+        consume('{')
+        members = {}
+        found = False
+
+        while peek() != '}':
+            name = decode()
+            consume(':')
+            if name == key and peek() == '[':
+                LOGGER.debug(f'Streaming records from {key}')
+                found = True
+                yield from iter_array()
+            elif found:
+                decode()
+            else:
+                members[name] = decode()
+            if peek() == ',':
+                consume(',')
+
+        consume('}')
+
+        if not found:
+            yield members
+
+
+def bounded_imap(executor: Executor, func: Callable, iterable: Iterable,
+                 max_pending: int = None, ordered: bool = True) -> Iterator:
+    """
+    Helper function to map a function over an iterable in an executor,
+    keeping at most `max_pending` tasks in flight so that memory stays
+    bounded regardless of the length of the iterable
+
+    :param executor: `concurrent.futures.Executor` object
+    :param func: function to apply to each item
+    :param iterable: iterable of items
+    :param max_pending: maximum number of submitted, unconsumed tasks
+                        (default is twice the number of workers)
+    :param ordered: whether to yield results in input order (default)
+                    or in completion order
+
+    :returns: iterator of results
+    """
+
+    if max_pending is None:
+        max_pending = 2 * getattr(executor, '_max_workers', 1)
+
+    pending = deque()
+
+    def drain() -> Iterator:
+        if ordered:
+            yield pending.popleft().result()
+        else:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.remove(future)
+                yield future.result()
+
+    for item in iterable:
+        pending.append(executor.submit(func, item))
+        if len(pending) >= max_pending:
+            yield from drain()
+
+    while pending:
+        yield from drain()
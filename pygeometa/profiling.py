@@ -0,0 +1,416 @@
+# =================================================================
+#
+# Terms and Conditions of Use
+#
+# Unless otherwise noted, computer program source code of this
+# distribution # is covered under Crown Copyright, Government of
+# Canada, and is distributed under the MIT License.
+#
+# The Canada wordmark and related graphics associated with this
+# distribution are protected under trademark law and copyright law.
+# No permission is granted to use them outside the parameters of
+# the Government of Canada's corporate identity program. For
+# more information, see
+# http://www.tbs-sct.gc.ca/fip-pcim/index-eng.asp
+#
+# Copyright title to all 3rd party software distributed with this
+# software is held by the respective copyright holders as noted in
+# those files. Users are asked to read the 3rd Party Licenses
+# referenced with those assets.
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+
+from collections import defaultdict
+import contextvars
+import functools
+import json
+import logging
+import time
+from typing import Any, Callable, IO
+
+LOGGER = logging.getLogger(__name__)
+
+# callables receiving each stage record; profiling is disabled when empty
+_HOOKS = []
+
+# names of the stages being timed in the current context
+_ACTIVE = contextvars.ContextVar('pygeometa_profiling_active',
+                                 default=frozenset())
+
+# records of a worker process, returned to the parent with each result
+_WORKER_RECORDS = []
+
+
+def add_hook(hook: Callable[[dict], Any]) -> None:
+    """
+    Register a callable to receive stage records, enabling profiling
+
+    A stage record is a `dict` of stage name (`stage`), wall time
+    (`wall`) and CPU time (`cpu`) in seconds, size in bytes of the
+    stage's `str`/`bytes` output (`bytes`, else `None`), error type if
+    the stage failed (`error`, else `None`) and stage specific
+    information (e.g. `schema`).
+
+    :param hook: callable taking a stage record
+
+    :returns: `None`
+    """
+
+    _HOOKS.append(hook)
+
+
+def remove_hook(hook: Callable[[dict], Any]) -> None:
+    """
+    Unregister a stage record callable
+
+    :param hook: callable previously registered with `add_hook`
+
+    :returns: `None`
+    """
+
+    _HOOKS.remove(hook)
+
+
+def is_enabled() -> bool:
+    """
+    Whether profiling is enabled (i.e. any hooks are registered)
+
+    :returns: `bool` of whether profiling is enabled
+    """
+
+    return bool(_HOOKS)
+
+
+def emit(record: dict) -> None:
+    """
+    Send a stage record to all registered hooks
+
+    :param record: `dict` of stage record
+
+    :returns: `None`
+    """
+
+    for hook in list(_HOOKS):
+        hook(record)
+
+
+def get_size(value: Any) -> Any:
+    """
+    Get the size in bytes of a stage output
+
+    :param value: stage output
+
+    :returns: `int` of UTF-8 encoded size for `str` and `bytes` values,
+              else `None`
+    """
+
+    if isinstance(value, bytes):
+        return len(value)
+    elif isinstance(value, str):
+        return len(value.encode('utf-8'))
+
+    return None
+
+
+class Stage:
+    """Timer of a processing stage, used as a context manager"""
+
+    def __init__(self, name: str, **info):
+        """
+        Initialize object
+
+        Nested stages of the same name are accounted to the outermost
+        stage (e.g. a schema's `write` calling its parent's `write`).
+
+        :param name: stage name
+        :param info: stage specific information added to the record
+
+        :returns: pygeometa.profiling.Stage
+        """
+
+        self.name = name
+        self.info = info
+        self.bytes = None
+        self._token = None
+
+    def __enter__(self):
+        active = _ACTIVE.get()
+        if self.name not in active:
+            self._token = _ACTIVE.set(active | {self.name})
+            self._wall = time.perf_counter()
+            self._cpu = time.thread_time()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._token is None:
+            return False
+
+        wall = time.perf_counter() - self._wall
+        cpu = time.thread_time() - self._cpu
+        _ACTIVE.reset(self._token)
+        self._token = None
+
+        emit({
+            'stage': self.name,
+            'wall': wall,
+            'cpu': cpu,
+            'bytes': self.bytes,
+            'error': exc_type.__name__ if exc_type is not None else None,
+            **self.info
+        })
+
+        return False
+
+
+class _NullStage:
+    """Stage used when profiling is disabled"""
+
+    bytes = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def __setattr__(self, name, value):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+def stage(name: str, **info) -> Stage:
+    """
+    Time a processing stage, if profiling is enabled
+
+    The size of the stage's output can be recorded by setting the
+    stage's `bytes` attribute.
+
+    :param name: stage name
+    :param info: stage specific information added to the record
+
+    :returns: context manager of `Stage` (no-op if disabled)
+    """
+
+    if not _HOOKS:
+        return _NULL_STAGE
+
+    return Stage(name, **info)
+
+
+def profiled(name: str, method: bool = False) -> Callable:
+    """
+    Decorator timing each call of a function as a stage, recording the
+    size of its return value
+
+    :param name: stage name
+    :param method: whether the function is a schema method, whose
+                   record gets the schema name (`schema`)
+
+    :returns: decorator
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _HOOKS:
+                return func(*args, **kwargs)
+
+            info = {'schema': args[0].name} if method else {}
+
+            with Stage(name, **info) as stage_:
+                result = func(*args, **kwargs)
+                stage_.bytes = get_size(result)
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def init_worker(enabled: bool) -> None:
+    """
+    Initialize profiling of a worker process
+
+    Hooks inherited from the parent process are dropped; if enabled,
+    records are collected and returned with each task result
+    (see `run_worker_task`).
+
+    :param enabled: whether profiling is enabled in the parent process
+
+    :returns: `None`
+    """
+
+    _HOOKS.clear()
+    _WORKER_RECORDS.clear()
+
+    if enabled:
+        add_hook(_WORKER_RECORDS.append)
+
+
+def run_worker_task(func: Callable[[Any], dict], task: Any) -> dict:
+    """
+    Run a task in a worker process, adding the stage records of the
+    task to its `dict` result (`profile`), if any
+
+    :param func: task function returning a `dict`
+    :param task: task argument
+
+    :returns: `dict` of task result
+    """
+
+    result = func(task)
+
+    if _WORKER_RECORDS:
+        result['profile'] = _WORKER_RECORDS[:]
+        _WORKER_RECORDS.clear()
+
+    return result
+
+
+def emit_worker_records(result: dict) -> dict:
+    """
+    Send the stage records returned by a worker process with a task
+    result to the hooks of the parent process
+
+    :param result: `dict` of task result (see `run_worker_task`)
+
+    :returns: `dict` of task result without stage records
+    """
+
+    for record in result.pop('profile', ()):
+        emit(record)
+
+    return result
+
+
+class Profiler:
+    """Collector of stage records, with JSON lines and summary reports"""
+
+    def __init__(self):
+        """
+        Initialize object
+
+        :returns: pygeometa.profiling.Profiler
+        """
+
+        self.records = []
+
+    def __call__(self, record: dict) -> None:
+        self.records.append(record)
+
+    def __enter__(self):
+        add_hook(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        remove_hook(self)
+        return False
+
+    def summary(self) -> list:
+        """
+        Aggregate stage records by stage (and schema)
+
+        Times of a stage include those of its nested stages (e.g.
+        `render_j2_template` includes `pretty_print`).
+
+        :returns: `list` of `dict` of stage (`stage`, suffixed with
+                  `[schema]` if any), number of calls (`calls`), total
+                  and mean wall time (`wall`, `wall_mean`), total CPU
+                  time (`cpu`), total bytes (`bytes`, `None` if the
+                  stage has no `str`/`bytes` output) and number of
+                  errors (`errors`), in first call order
+        """
+
+        stages = defaultdict(lambda: {'calls': 0, 'wall': 0.0, 'cpu': 0.0,
+                                      'bytes': None, 'errors': 0})
+
+        for record in self.records:
+            name = record['stage']
+            if record.get('schema') is not None:
+                name = f"{name}[{record['schema']}]"
+
+            stage_ = stages[name]
+            stage_['calls'] += 1
+            stage_['wall'] += record['wall']
+            stage_['cpu'] += record['cpu']
+            if record['bytes'] is not None:
+                stage_['bytes'] = (stage_['bytes'] or 0) + record['bytes']
+            if record['error'] is not None:
+                stage_['errors'] += 1
+
+        return [{
+            'stage': name,
+            'calls': values['calls'],
+            'wall': values['wall'],
+            'wall_mean': values['wall'] / values['calls'],
+            'cpu': values['cpu'],
+            'bytes': values['bytes'],
+            'errors': values['errors']
+        } for name, values in stages.items()]
+
+    def write_jsonl(self, fh: IO) -> None:
+        """
+        Write stage records as JSON lines
+
+        :param fh: text file-like object
+
+        :returns: `None`
+        """
+
+        for record in self.records:
+            fh.write(json.dumps(record) + '\n')
+
+    def write_summary(self, fh: IO) -> None:
+        """
+        Write stage summary as a table
+
+        :param fh: text file-like object
+
+        :returns: `None`
+        """
+
+        rows = [(stage_['stage'], str(stage_['calls']),
+                 f"{stage_['wall']:.4f}", f"{stage_['wall_mean'] * 1000:.3f}",
+                 f"{stage_['cpu']:.4f}",
+                 '-' if stage_['bytes'] is None else str(stage_['bytes']),
+                 str(stage_['errors']))
+                for stage_ in self.summary()]
+
+        header = ('stage', 'calls', 'wall (s)', 'mean (ms)', 'cpu (s)',
+                  'bytes', 'errors')
+
+        widths = [max(len(row[i]) for row in [header, *rows])
+                  for i in range(len(header))]
+
+        for row in [header, *rows]:
+            cells = [row[0].ljust(widths[0])]
+            cells.extend(cell.rjust(width)
+                         for cell, width in zip(row[1:], widths[1:]))
+            fh.write('  '.join(cells) + '\n')
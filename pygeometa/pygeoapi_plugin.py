@@ -70,16 +70,39 @@
 #     type: process
 #     processor:
 #         name: pygeometa.pygeoapi_plugin.PygeometaMetadataValidateProcessor
+#         # optional: build the MCF validator when the processor is created
+#         warm_up: true
 #
 # pygeometa-metadata-generate:
 #     type: process
 #     processor:
 #         name: pygeometa.pygeoapi_plugin.PygeometaMetadataGenerateProcessor
+#         # optional: number of threads rendering batch (mcfs/schemas)
+#         # requests (default: 4); threads overlap I/O such as reading
+#         # base MCFs, while rendering itself is bound by the GIL
+#         max_workers: 4
+#         # optional: response cache (see below)
+#         cache:
+#             maxsize: 128
+#         # optional: preload schemas, templates and the MCF validator
+#         # when the processor is created (true for all schemas, or a list
+#         # of schemas)
+#         warm_up:
+#             - iso19139
+#             - oarec-record
 #
 # pygeometa-metadata-transform:
 #     type: process
 #     processor:
 #         name: pygeometa.pygeoapi_plugin.PygeometaMetadataTransformProcessor
+#         # optional: response cache of identical requests (true for an
+#         # in-memory cache with default settings)
+#         cache:
+#             maxsize: 128  # maximum number of responses (default: 128)
+#             ttl: 3600  # time to live in seconds (default: no expiry)
+#             path: /tmp/pygeometa-cache  # on-disk (default: in-memory)
+#         # optional: preload schemas (see above)
+#         warm_up: true
 #
 #
 # 3. (re)start pygeoapi
@@ -100,9 +123,13 @@
 # provide a developer-friendly interface to test and run requests
 #
 
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
 import logging
 
-from pygeometa.core import read_mcf, validate_mcf
+from pygeometa.cache import get_cache, get_cache_key
+from pygeometa.core import read_mcf, validate_mcf, warm_up
+from pygeometa.helpers import bounded_imap
 from pygeometa.schemas import get_supported_schemas, load_schema
 from pygeometa.util import get_package_version
 
@@ -149,6 +176,42 @@ INPUT_SCHEMA = {
     'keywords': ['metadata', 'schema']
 }
 
+INPUT_MCFS = {
+    'title': 'Metadata control files (MCFs)',
+    'description': 'pygeometa metadata control files (MCFs) as JSON, '
+                   'for batch generation (instead of mcf)',
+    'schema': {
+        'type': 'array',
+        'items': {
+            'type': 'object',
+            'contentMediaType': 'application/json'
+        }
+    },
+    'minOccurs': 0,
+    'maxOccurs': 1,
+    'metadata': None,
+    'keywords': ['metadata control file', 'mcf']
+}
+
+INPUT_SCHEMAS = {
+    'title': 'Metadata schemas',
+    'description': 'Metadata schemas, for batch generation (instead of '
+                   'schema)',
+    'schema': {
+        'type': 'array',
+        'items': {
+            'type': 'string',
+            'enum': list(get_supported_schemas())
+        }
+    },
+    'minOccurs': 0,
+    'maxOccurs': 1,
+    'metadata': None,
+    'keywords': ['metadata', 'schema']
+}
+
+DEFAULT_MAX_WORKERS = 4
+
 
 PROCESS_METADATA_SCHEMAS = {
     'version': get_package_version(),
@@ -276,14 +339,20 @@ PROCESS_METADATA_GENERATE = {
         'href': 'https://geopython.github.io/pygeometa/pygeoapi-plugin',
         'hreflang': 'en-US'
     }],
+    'jobControlOptions': ['sync-execute', 'async-execute'],
+    'outputTransmission': ['value'],
     'inputs': {
-        'mcf': INPUT_MCF,
-        'schema': INPUT_SCHEMA
+        'mcf': {**INPUT_MCF, 'minOccurs': 0},
+        'mcfs': INPUT_MCFS,
+        'schema': {**INPUT_SCHEMA, 'minOccurs': 0},
+        'schemas': INPUT_SCHEMAS
     },
     'outputs': {
         'result': {
             'title': 'Generated metadata',
-            'description': 'Generated metadata',
+            'description': 'Generated metadata, or for batch requests a '
+                           'map of MCF identifiers to schemas to generated '
+                           'metadata (or errors)',
             'schema': {
                 'type': 'object',
                 'contentMediaType': 'application/json'
@@ -341,6 +410,75 @@ PROCESS_METADATA_TRANSFORM = {
 }
 
 
+def generate_metadata(instance: dict, schema: str) -> tuple:
+    """
+    Generate metadata of an MCF
+
+    :param instance: `dict` of MCF
+    :param schema: schema name
+
+    :returns: `tuple` of mimetype and generated metadata (`dict` for JSON
+              schemas, else `str`)
+    """
+
+    schema_object = load_schema(schema)
+
+    if schema_object.outputformat == 'json':
+        return 'application/json', schema_object.write(instance,
+                                                       stringify=False)
+
+    return 'application/xml', schema_object.write(instance, stringify=True)
+
+
+def cached(cache, key_parts: list, func) -> tuple:
+    """
+    Get a processor response from a cache, computing it on a miss
+
+    :param cache: `pygeometa.cache.ResponseCache` or `None` (no caching)
+    :param key_parts: `list` of request parts identifying the response
+    :param func: function computing the response tuple
+
+    :returns: `tuple` of mimetype and response
+    """
+
+    if cache is None:
+        return func()
+
+    mimetype, response = cache.get_or_set(get_cache_key(*key_parts), func)
+    LOGGER.info(f'Response cache statistics: {cache.stats()}')
+
+    return mimetype, response
+
+
+def warm_up_processor(processor_def: dict, schemas: bool = True,
+                      validator: bool = True) -> None:
+    """
+    Warm up a processor at construction time if configured (`warm_up`
+    processor option), so that the first request is not penalized by
+    loading schemas, compiling templates or building the validator
+
+    :param processor_def: processor definition
+    :param schemas: whether the processor uses schemas
+    :param validator: whether the processor uses the MCF validator
+
+    :returns: `None`
+    """
+
+    config = processor_def.get('warm_up', False)
+
+    if not config:
+        return
+
+    if not schemas:
+        schemas_ = []
+    elif isinstance(config, list):
+        schemas_ = config
+    else:
+        schemas_ = None
+
+    warm_up(schemas_, validator=validator)
+
+
 class PygeometaMetadataSchemasProcessor(BaseProcessor):
     """pygeometa metadata schemas example"""
 
@@ -384,6 +522,8 @@ class PygeometaMetadataImportProcessor(BaseProcessor):
 
         super().__init__(processor_def, PROCESS_METADATA_IMPORT)
 
+        warm_up_processor(processor_def, validator=False)
+
     def execute(self, data, outputs=None):
 
         response = None
@@ -433,6 +573,8 @@ class PygeometaMetadataValidateProcessor(BaseProcessor):
 
         super().__init__(processor_def, PROCESS_METADATA_VALIDATE)
 
+        warm_up_processor(processor_def, schemas=False)
+
     def execute(self, data, outputs=None):
 
         response = None
@@ -477,12 +619,23 @@ class PygeometaMetadataGenerateProcessor(BaseProcessor):
 
         super().__init__(processor_def, PROCESS_METADATA_GENERATE)
 
+        self.max_workers = processor_def.get('max_workers',
+                                             DEFAULT_MAX_WORKERS)
+        self.cache = get_cache(processor_def.get('cache'))
+
+        warm_up_processor(processor_def)
+
     def execute(self, data, outputs=None):
 
-        response = None
-        mimetype = 'application/json'
         mcf = data.get('mcf')
         schema = data.get('schema')
+        mcfs = data.get('mcfs')
+        schemas = data.get('schemas')
+
+        if mcfs is not None or schemas is not None:
+            return self.execute_batch(
+                mcfs if mcfs is not None else [mcf],
+                schemas if schemas is not None else [schema])
 
         if None in [mcf, schema]:
             msg = 'Missing input MCF or schema'
@@ -491,22 +644,93 @@ class PygeometaMetadataGenerateProcessor(BaseProcessor):
 
         try:
             LOGGER.debug('Generating metadata')
-            instance = read_mcf(mcf)
-            schema_object = load_schema(schema)
-
-            if schema_object.outputformat == 'json':
-                stringify = False
-            else:
-                mimetype = 'application/xml'
-                stringify = True
-
-            response = schema_object.write(instance, stringify=stringify)
-
+            mimetype, response = cached(
+                self.cache, ['generate', mcf, schema],
+                lambda: generate_metadata(read_mcf(mcf), schema))
         except Exception as err:
+            mimetype = 'application/json'
             response = f'Generation error: {err}'
 
         return mimetype, response
 
+    def execute_batch(self, mcfs: list, schemas: list) -> tuple:
+        """
+        Generate metadata of many MCFs into many schemas
+
+        MCFs are rendered by a bounded thread pool of `max_workers`
+        threads.  Threads only overlap I/O (e.g. reading base MCFs), as
+        rendering holds the GIL; the server is expected to scale across
+        processes.  Each task runs in a copy of the caller's context, so
+        context variables such as the date-time snapshot of
+        `pygeometa.helpers.now_snapshot` apply to all MCFs.
+
+        :param mcfs: `list` of MCF objects
+        :param schemas: `list` of schema names
+
+        :returns: `tuple` of mimetype and `dict` of MCF identifiers to
+                  schemas to generated metadata (or errors)
+        """
+
+        if not isinstance(mcfs, list) or None in mcfs or not mcfs:
+            msg = 'Missing or invalid input MCFs'
+            LOGGER.error(msg)
+            raise ProcessorExecuteError(msg)
+
+        if not isinstance(schemas, list) or not schemas:
+            msg = 'Missing or invalid input schemas'
+            LOGGER.error(msg)
+            raise ProcessorExecuteError(msg)
+
+        unsupported = set(schemas) - set(get_supported_schemas())
+        if unsupported:
+            msg = f'Unsupported schemas: {sorted(unsupported)}'
+            LOGGER.error(msg)
+            raise ProcessorExecuteError(msg)
+
+        def generate(mcf: dict) -> tuple:
+            try:
+                instance = read_mcf(mcf)
+                identifier = instance['metadata']['identifier']
+            except Exception as err:
+                return None, {'error': f'Invalid MCF: {err}'}
+
+            results = {}
+            for schema in schemas:
+                try:
+                    mimetype, value = generate_metadata(instance, schema)
+                    results[schema] = {
+                        'mimetype': mimetype,
+                        'value': value
+                    }
+                except Exception as err:
+                    results[schema] = {'error': f'Generation error: {err}'}
+
+            return identifier, results
+
+        # threads start from an empty context; a context can only be
+        # entered by one thread at a time, so copy it per task
+        context = contextvars.copy_context()
+
+        def run(mcf: dict) -> tuple:
+            return context.copy().run(generate, mcf)
+
+        LOGGER.debug(f'Generating {len(mcfs)} MCFs into {schemas}')
+        response = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = bounded_imap(executor, run, mcfs)
+            for count, (identifier, result) in enumerate(results):
+                key = None if identifier is None else str(identifier)
+                if key is None or key in response:
+                    # invalid MCFs and duplicate identifiers, without
+                    # clashing with identifiers or keys already used
+                    key, suffix = f'mcf-{count}', 2
+                    while key in response:
+                        key = f'mcf-{count}-{suffix}'
+                        suffix += 1
+                response[key] = result
+
+        return 'application/json', response
+
     def __repr__(self):
         return '<PygeometaMetadataGenerateProcessor>'
 
@@ -525,11 +749,12 @@ class PygeometaMetadataTransformProcessor(BaseProcessor):
 
         super().__init__(processor_def, PROCESS_METADATA_TRANSFORM)
 
+        self.cache = get_cache(processor_def.get('cache'))
+
+        warm_up_processor(processor_def)
+
     def execute(self, data, outputs=None):
 
-        content = None
-        response = None
-        mimetype = 'application/json'
         metadata = data.get('metadata')
         input_schema = data.get('input-schema')
         output_schema = data.get('output-schema')
@@ -539,6 +764,24 @@ class PygeometaMetadataTransformProcessor(BaseProcessor):
             LOGGER.error(msg)
             raise ProcessorExecuteError(msg)
 
+        return cached(
+            self.cache, ['transform', metadata, input_schema, output_schema],
+            lambda: self.transform(metadata, input_schema, output_schema))
+
+    def transform(self, metadata: str, input_schema: str,
+                  output_schema: str) -> tuple:
+        """
+        Transform metadata
+
+        :param metadata: `str` of metadata
+        :param input_schema: input schema name
+        :param output_schema: output schema name
+
+        :returns: `tuple` of mimetype and transformed metadata
+        """
+
+        mimetype = 'application/json'
+
         try:
             LOGGER.info(f'Importing {metadata} into {input_schema}')
             schema_object_input = load_schema(input_schema)
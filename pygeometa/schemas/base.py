@@ -44,9 +44,11 @@
 # =================================================================
 
 import os
-from typing import Union
+from typing import IO, Iterator, Union
 
 from pygeometa import core
+from pygeometa.helpers import now_scoped
+from pygeometa.profiling import profiled
 
 TEMPLATES = os.path.dirname(os.path.realpath(__file__))
 
@@ -71,6 +73,21 @@ class BaseOutputSchema:
         self.outputformat = outputformat
         self.template_dir = template_dir
 
+    def __init_subclass__(cls, **kwargs):
+        """
+        Time the `write` and `import_` methods of schemas as profiling
+        stages, and run `write` within a date-time snapshot
+        """
+
+        super().__init_subclass__(**kwargs)
+
+        if 'write' in cls.__dict__:
+            cls.write = profiled('write', method=True)(now_scoped(cls.write))
+        if 'import_' in cls.__dict__:
+            cls.import_ = profiled('import', method=True)(cls.import_)
+
+    @profiled('write', method=True)
+    @now_scoped
     def write(self, mcf: dict, stringify: str = True) -> Union[dict, str]:
         """
         Write outputschema to string buffer
@@ -98,5 +115,16 @@ class BaseOutputSchema:
 
         raise NotImplementedError()
 
+    def import_iter(self, fh: IO) -> Iterator[dict]:
+        """
+        Import one or more metadata records into MCF
+
+        :param fh: file-like object of metadata content
+
+        :returns: iterator of `dict` of MCF content
+        """
+
+        yield self.import_(fh.read())
+
     def __repr__(self):
         return f'<{self.name.upper()}OutputSchema> {self.name}'
@@ -43,17 +43,43 @@
 #
 # =================================================================
 
-import os
+from collections import Counter
 import csv
-from io import StringIO
-from typing import Union
+from io import StringIO, TextIOWrapper
+from itertools import islice
+import logging
+import os
+import re
+from typing import IO, Iterator, Union
 
-from pygeometa.core import get_charstring, get_typed_value
+from pygeometa.core import get_charstring
 from pygeometa.helpers import json_dumps
 from pygeometa.schemas.base import BaseOutputSchema
 
 THISDIR = os.path.dirname(os.path.realpath(__file__))
 
+LOGGER = logging.getLogger(__name__)
+
+# leading zeros denote codes (e.g. station identifiers, postal codes),
+# not numbers
+INTEGER_RE = re.compile(r'[+-]?(?:0|[1-9][0-9]*)')
+NUMBER_RE = re.compile(
+    r'[+-]?(?:(?:0|[1-9][0-9]*)(?:\.[0-9]*)?|\.[0-9]+)(?:[eE][+-]?[0-9]+)?')
+DATE_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+DATETIME_RE = re.compile(
+    r'[0-9]{4}-[0-9]{2}-[0-9]{2}[T ][0-9]{2}:[0-9]{2}(?::[0-9]{2}(?:\.[0-9]+)?)?'  # noqa
+    r'(?:Z|[+-][0-9]{2}:?[0-9]{2})?')
+
+# value checks in order of precedence
+VALUE_TYPES = [
+    ('integer', INTEGER_RE.fullmatch),
+    ('number', NUMBER_RE.fullmatch),
+    ('date', DATE_RE.fullmatch),
+    ('datetime', DATETIME_RE.fullmatch)
+]
+
+CHUNK_SIZE = 10000
+
 
 class CSVWOutputSchema(BaseOutputSchema):
     """CSVS output schema"""
@@ -112,24 +138,170 @@ class CSVWOutputSchema(BaseOutputSchema):
 
         return csvw
 
-    def import_(self, metadata: str) -> dict:
+    def import_(self, metadata: str, sample_rows: int = None,
+                sample_bytes: int = None) -> dict:
+        """
+        Import CSV data into MCF attributes
+
+        :param metadata: string of CSV content
+        :param sample_rows: maximum number of data rows to infer types
+                            from (default is all rows)
+        :param sample_bytes: maximum number of characters to infer types
+                             from (default is all content)
+
+        :returns: `dict` of MCF content
+        """
+
+        with StringIO(metadata) as fh:
+            return next(self.import_iter(fh, sample_rows, sample_bytes))
+
+    def import_iter(self, fh: IO, sample_rows: int = None,
+                    sample_bytes: int = None) -> Iterator[dict]:
+        """
+        Import CSV data into MCF attributes, streaming from a file
+
+        :param fh: file-like object (text or binary) of CSV content
+        :param sample_rows: maximum number of data rows to infer types
+                            from (default is all rows)
+        :param sample_bytes: maximum number of characters to infer types
+                             from (default is all content)
+
+        :returns: iterator of `dict` of MCF content
+        """
 
         mcf = {
-            'identification'
+            'identification': {},
             'content_info': {
                 'attributes': []
             }
         }
 
-        with StringIO(metadata) as fh:
-            reader = csv.DictReader(fh)
-            next(reader)
-            test_row = next(reader)
+        wrapper = None
+        if isinstance(fh.read(0), bytes):
+            fh = wrapper = TextIOWrapper(fh, encoding='utf-8-sig', newline='')
+
+        try:
+            types = infer_types(fh, sample_rows, sample_bytes)
+        finally:
+            # the wrapper would close the caller's file when collected
+            if wrapper is not None:
+                wrapper.detach()
+
+        for name, counts in types:
+            mcf['content_info']['attributes'].append({
+                'name': name,
+                'type': promote_type(counts)
+            })
+
+        yield mcf
+
+
+def infer_types(fh: IO, sample_rows: int = None, sample_bytes: int = None,
+                chunk_size: int = CHUNK_SIZE) -> list:
+    """
+    Count the value types of each column of CSV data
+
+    Rows are read in chunks of `chunk_size` so that memory stays bounded
+    regardless of input size.  Each chunk is transposed into columns and
+    every column is classified in a single pass.  Empty values are not
+    counted.
+
+    :param fh: text file-like object of CSV content
+    :param sample_rows: maximum number of data rows to read
+                        (default is all rows)
+    :param sample_bytes: maximum number of characters to read
+                         (default is all content)
+    :param chunk_size: number of rows per chunk
+
+    :returns: `list` of (column name, `collections.Counter` of types)
+    """
+
+    read = {'bytes': 0}
+
+    def lines() -> Iterator[str]:
+        for line in fh:
+            read['bytes'] += len(line)
+            yield line
+
+    reader = csv.reader(lines())
+
+    header = next(reader, [])
+
+    # guard against markup (e.g. XML, JSON) parsing as single column CSV
+    if not header or header[0].lstrip()[:1] in ['<', '{', '[']:
+        raise ValueError('No CSV header found')
+
+    counts = [Counter() for _ in header]
+    rows_read = 0
+
+    while True:
+        size = chunk_size
+        if sample_rows is not None:
+            size = min(size, sample_rows - rows_read)
+
+        chunk = []
+        for row in islice(reader, size):
+            chunk.append(row)
+            if sample_bytes is not None and read['bytes'] >= sample_bytes:
+                break
+
+        if not chunk:
+            break
+
+        rows_read += len(chunk)
+        LOGGER.debug(f'Inferring types from {rows_read} rows')
+
+        # pad short rows; values of surplus columns are ignored
+        width = len(header)
+        chunk = [row + [''] * (width - len(row)) for row in chunk]
+
+        for counter, column in zip(counts, zip(*chunk)):
+            counter.update(map(get_value_type, filter(None, column)))
+
+        if ((sample_rows is not None and rows_read >= sample_rows) or
+                (sample_bytes is not None and read['bytes'] >= sample_bytes)):
+            LOGGER.debug('Sample budget reached')
+            break
+
+    return list(zip(header, counts))
+
+
+def get_value_type(value: str) -> str:
+    """
+    Derive MCF attribute type of a data value
+
+    :param value: data value
+
+    :returns: `str` of MCF attribute type
+    """
+
+    for type_, match in VALUE_TYPES:
+        if match(value) is not None:
+            return type_
+
+    return 'string'
+
+
+def promote_type(counts: Counter) -> str:
+    """
+    Derive the MCF attribute type of a column from its value type counts
+
+    :param counts: `collections.Counter` of value types
+
+    :returns: `str` of MCF attribute type
+    """
+
+    types = set(counts)
 
-            for key, value in test_row.items():
-                mcf['content_info']['attributes'].append({
-                    'name': key,
-                    'type': type(get_typed_value(value)).__name__
-                })
+    if not types:
+        return 'string'
+    elif types <= {'integer'}:
+        return 'integer'
+    elif types <= {'integer', 'number'}:
+        return 'number'
+    elif types <= {'date'}:
+        return 'date'
+    elif types <= {'date', 'datetime'}:
+        return 'datetime'
 
-        return mcf
+    return 'string'
@@ -43,14 +43,103 @@
 #
 # =================================================================
 
+from datetime import date, datetime
+import itertools
+import logging
 import os
-from typing import Union
+from typing import IO, Iterable, Iterator, Union
 
-from pygeometa.helpers import json_dumps
+from pygeometa.core import read_mcf
+from pygeometa.helpers import json_dumps, json_encode
 from pygeometa.schemas.base import BaseOutputSchema
 
 THISDIR = os.path.dirname(os.path.realpath(__file__))
 
+LOGGER = logging.getLogger(__name__)
+
+CONTEXT = {
+    # namespaces
+    "adms": "http://www.w3.org/ns/adms#",
+    "dcat": "http://www.w3.org/ns/dcat#",
+    "dct": "http://purl.org/dc/terms/",
+    "foaf": "http://xmlns.com/foaf/0.1/",
+    "gsp": "http://www.opengis.net/ont/geosparql#",
+    "locn": "http://www.w3.org/ns/locn#",
+    "owl": "http://www.w3.org/2002/07/owl#",
+    "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
+    "schema": "http://schema.org/",
+    "skos": "http://www.w3.org/2004/02/skos/core#",
+    "time": "http://www.w3.org/2006/time",
+    "vcard": "http://www.w3.org/2006/vcard/ns#",
+    "xsd": "http://www.w3.org/2001/XMLSchema#",
+    # mcf-property to dcat mappings
+    "topiccategory": "dcat:theme",
+    "language": "dct:language",
+    # todo: support any range of languages from source
+    "title": "dct:title",
+    "title_en": {"@id": "dct:title", "@language": "en"},
+    "title_fr": {"@id": "dct:title", "@language": "fr"},
+    "abstract_en": {"@id": "dct:description", "@language": "en"},
+    "abstract_fr": {"@id": "dct:description", "@language": "fr"},
+    "distribution": "dcat:distribution",
+    "url": "dcat:accessURL",
+    "name": "dct:title",
+    "name_en": {"@id": "dct:title", "@language": "en"},
+    "name_fr": {"@id": "dct:title", "@language": "fr"},
+    "description": "dct:description",
+    "description_en": {"@id": "dct:description",
+                       "@language": "en"},
+    "description_fr": {"@id": "dct:description",
+                       "@language": "fr"},
+    "keywords": "dct:keyword",
+    "keywords_en": {"@id": "dct:keyword", "@language": "en"},
+    "keywords_fr": {"@id": "dct:keyword", "@language": "fr"},
+    "dataseturi": {"@type": "@id", "@id": "@id"},
+    "contact": "dcat:contactPoint",
+    "spatial": "dct:spatial",
+    "temporal": "dct:temporal",
+    "creation": "dct:issued",
+    "modified": "dct:modified",
+    "maintenancefrequency": "dct:accrualPeriodicity",
+    "type": "dcat:mediaType",
+    "size": "dcat:byteSize",
+    "status": "adms:status",
+    "organization": "vcard:hasOrganizationName",
+    "individualname": "vcard:fn",
+    "phone": "vcard:hasTelephone",
+    "address": "vcard:street-address",
+    "city": "vcard:locality",
+    "postalcode": "vcard:postal-code",
+    "country": "vcard:country-name",
+    "email": "vcard:hasEmail",
+    "accessconstraints": "dct:accessRights",
+    "rights": "dct:rights",
+    "rights_en": {"@id": "dct:rights", "@language": "en"},
+    "rights_fr": {"@id": "dct:rights", "@language": "fr"},
+    "bbox": "dcat:bbox",
+    "begin": "dcat:startDate",
+    "end": "dcat:endDate"
+}
+
+RDF_FORMATS = ['json-ld', 'ntriples']
+
+# MCF sections not mapped (yet)
+SKIPPED_SECTIONS = frozenset(['mcf', 'content_info', 'acquisition'])
+# MCF sections unnested into the dataset
+UNNESTED_SECTIONS = frozenset(['metadata', 'identification'])
+# MCF sections transformed from a set of keys to an array
+ARRAY_SECTIONS = frozenset(['distributor', 'contact'])
+# dataset keyword terms, by MCF keyword language
+KEYWORD_TERMS = frozenset(['keywords', 'keywords_en', 'keywords_fr'])
+
+RDF_TYPE = f"{CONTEXT['rdf']}type"
+XSD = CONTEXT['xsd']
+
+# characters not allowed in N-Triples IRIs, percent-encoded
+IRI_ESCAPES = {codepoint: f'%{codepoint:02X}'
+               for codepoint in [*range(0x21), *map(ord, '<>"{}|^`\\')]}
+
 
 class DCATOutputSchema(BaseOutputSchema):
     """dcat output schema"""
@@ -76,71 +165,27 @@ class DCATOutputSchema(BaseOutputSchema):
         :returns: `dict` or `str` of MCF as a DCAT representation
         """
 
+        # the context is only copied if handed to the caller
+        dcat = {
+            '@context': get_context() if not stringify else CONTEXT,
+            **self.generate_dataset(mcf)
+        }
+
+        if stringify:
+            return json_dumps(dcat)
+
+        return dcat
+
+    def generate_dataset(self, mcf: dict) -> dict:
+        """
+        Generate a DCAT dataset, without JSON-LD context
+
+        :param mcf: dict of MCF content model
+
+        :returns: `dict` of MCF as a DCAT dataset
+        """
+
         dcat = {
-            "@context": {
-                # namespaces
-                "adms": "http://www.w3.org/ns/adms#",
-                "dcat": "http://www.w3.org/ns/dcat#",
-                "dct": "http://purl.org/dc/terms/",
-                "foaf": "http://xmlns.com/foaf/0.1/",
-                "gsp": "http://www.opengis.net/ont/geosparql#",
-                "locn": "http://www.w3.org/ns/locn#",
-                "owl": "http://www.w3.org/2002/07/owl#",
-                "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
-                "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
-                "schema": "http://schema.org/",
-                "skos": "http://www.w3.org/2004/02/skos/core#",
-                "time": "http://www.w3.org/2006/time",
-                "vcard": "http://www.w3.org/2006/vcard/ns#",
-                "xsd": "http://www.w3.org/2001/XMLSchema#",
-                # mcf-property to dcat mappings
-                "topiccategory": "dcat:theme",
-                "language": "dct:language",
-                # todo: support any range of languages from source
-                "title": "dct:title",
-                "title_en": {"@id": "dct:title", "@language": "en"},
-                "title_fr": {"@id": "dct:title", "@language": "fr"},
-                "abstract_en": {"@id": "dct:description", "@language": "en"},
-                "abstract_fr": {"@id": "dct:description", "@language": "fr"},
-                "distribution": "dcat:distribution",
-                "url": "dcat:accessURL",
-                "name": "dct:title",
-                "name_en": {"@id": "dct:title", "@language": "en"},
-                "name_fr": {"@id": "dct:title", "@language": "fr"},
-                "description": "dct:description",
-                "description_en": {"@id": "dct:description",
-                                   "@language": "en"},
-                "description_fr": {"@id": "dct:description",
-                                   "@language": "fr"},
-                "keywords": "dct:keyword",
-                "keywords_en": {"@id": "dct:keyword", "@language": "en"},
-                "keywords_fr": {"@id": "dct:keyword", "@language": "fr"},
-                "dataseturi": {"@type": "@id", "@id": "@id"},
-                "contact": "dcat:contactPoint",
-                "spatial": "dct:spatial",
-                "temporal": "dct:temporal",
-                "creation": "dct:issued",
-                "modified": "dct:modified",
-                "maintenancefrequency": "dct:accrualPeriodicity",
-                "type": "dcat:mediaType",
-                "size": "dcat:byteSize",
-                "status": "adms:status",
-                "organization": "vcard:hasOrganizationName",
-                "individualname": "vcard:fn",
-                "phone": "vcard:hasTelephone",
-                "address": "vcard:street-address",
-                "city": "vcard:locality",
-                "postalcode": "vcard:postal-code",
-                "country": "vcard:country-name",
-                "email": "vcard:hasEmail",
-                "accessconstraints": "dct:accessRights",
-                "rights": "dct:rights",
-                "rights_en": {"@id": "dct:rights", "@language": "en"},
-                "rights_fr": {"@id": "dct:rights", "@language": "fr"},
-                "bbox": "dcat:bbox",
-                "begin": "dcat:startDate",
-                "end": "dcat:endDate"
-            },
             "@type": "dcat:Dataset",
             "keywords": [],
             "keywords_en": [],
@@ -152,10 +197,10 @@ class DCATOutputSchema(BaseOutputSchema):
         # prepare mcf for json-ld
         for key, value in mcf.items():
             # do nothing for these items (yet)
-            if (key in ['mcf', 'content_info', 'acquisition']):
-                None
+            if key in SKIPPED_SECTIONS:
+                continue
             # unnest these items
-            elif (key in ['metadata', 'identification']):
+            elif key in UNNESTED_SECTIONS:
                 for k, v in value.items():
                     if (k == 'extents'):
                         for k1, v1 in v.items():
@@ -163,23 +208,21 @@ class DCATOutputSchema(BaseOutputSchema):
                             if (k1 == 'spatial'):
                                 dcat["spatial"] = []
                                 for k2 in v1:
-                                    k2['@type'] = 'dct:Location'
+                                    k2 = {**k2, '@type': 'dct:Location'}
                                     dcat["spatial"].append(k2)
                             # assign dct:PeriodOftime type
                             elif (k1 == 'temporal'):
                                 dcat['temporal'] = []
                                 for k3 in v1:
-                                    k3['@type'] = 'dct:PeriodOfTime'
+                                    k3 = {**k3, '@type': 'dct:PeriodOfTime'}
                                     dcat["temporal"].append(k3)
                     # unnest keywords
                     elif (k == 'keywords'):
                         for k4, v4 in v.items():
                             for k5, v5 in v4.items():
-                                if (k5 != 'keywords_type'):
-                                    for kw in v5:
-                                        # assumes a key for language exists
-                                        if k5 in dcat:
-                                            dcat[k5].append(kw)
+                                # assumes a key for language exists
+                                if k5 in KEYWORD_TERMS:
+                                    dcat[k5].extend(v5)
                     elif (k in ['identifier']):
                         # mint a url from identifier if non exists on mcf
                         if (not mcf['metadata']['dataseturi']):
@@ -191,8 +234,10 @@ class DCATOutputSchema(BaseOutputSchema):
                     else:
                         dcat[k] = v
             # transform set of keys to array
-            elif (key in ['distributor', 'contact']):
+            elif key in ARRAY_SECTIONS:
                 for k, v in value.items():
+                    if not isinstance(v, str):
+                        v = dict(v)
                     # add id (if url exists)
                     if (not isinstance(v, str) and v['url']):
                         v['@id'] = v['url']
@@ -206,7 +251,273 @@ class DCATOutputSchema(BaseOutputSchema):
             else:
                 dcat[key] = value
 
-        if stringify:
-            return json_dumps(dcat)
-
         return dcat
+
+    def write_catalog(self, mcfs: Iterable, fh: IO,
+                      catalog_uri: str = None, title: str = None,
+                      description: str = None,
+                      rdf_format: str = 'json-ld') -> dict:
+        """
+        Write many MCFs as a DCAT catalog, streamed to a binary file handle
+
+        The JSON-LD context is written once for the catalog, and datasets
+        are written one at a time as they are generated, so that memory
+        use is independent of the number of datasets.  N-Triples output
+        (which is also valid Turtle) is written one triple per line.
+        Records failing to generate are logged and skipped.
+
+        :param mcfs: iterable of MCFs (`dict`, or filepath or string of
+                     MCF data)
+        :param fh: binary file-like object
+        :param catalog_uri: URI of the catalog (default is a blank node)
+        :param title: title of the catalog
+        :param description: description of the catalog
+        :param rdf_format: output format (`json-ld` or `ntriples`)
+
+        :returns: `dict` of number of datasets written (`numberReturned`)
+                  and number of records failed (`numberFailed`)
+        """
+
+        if rdf_format not in RDF_FORMATS:
+            msg = f'Invalid RDF format: {rdf_format}'
+            LOGGER.error(msg)
+            raise ValueError(msg)
+
+        catalog = {'@type': 'dcat:Catalog'}
+        if catalog_uri is not None:
+            catalog['@id'] = catalog_uri
+        if title is not None:
+            catalog['title'] = title
+        if description is not None:
+            catalog['description'] = description
+
+        returned = 0
+        failed = 0
+
+        if rdf_format == 'json-ld':
+            catalog = {'@context': CONTEXT, **catalog}
+            fh.write(json_encode(catalog, compact=True)[:-1])
+            fh.write(b',"dcat:dataset":[')
+        else:
+            emitter = NTriplesEmitter()
+            catalog_node = emitter.get_subject(catalog)
+            fh.writelines(emitter.emit(catalog, catalog_node))
+
+        for mcf in mcfs:
+            try:
+                if not isinstance(mcf, dict):
+                    mcf = read_mcf(mcf)
+                dataset = self.generate_dataset(mcf)
+            except Exception as err:
+                LOGGER.warning(f'Skipping record: {err}')
+                failed += 1
+                continue
+
+            if rdf_format == 'json-ld':
+                fh.write(b',\n' if returned else b'\n')
+                fh.write(json_encode(dataset, compact=True))
+            else:
+                dataset_node = emitter.get_subject(dataset)
+                fh.write(emitter.format_triple(
+                    catalog_node, _expand_iri('dcat:dataset'),
+                    dataset_node))
+                fh.writelines(emitter.emit(dataset, dataset_node))
+
+            returned += 1
+
+        if rdf_format == 'json-ld':
+            fh.write(b'\n]}')
+
+        return {
+            'numberReturned': returned,
+            'numberFailed': failed
+        }
+
+
+def get_context() -> dict:
+    """
+    Get a copy of the DCAT JSON-LD context, which callers may modify
+
+    :returns: `dict` of JSON-LD context
+    """
+
+    return {key: dict(value) if isinstance(value, dict) else value
+            for key, value in CONTEXT.items()}
+
+
+def _expand_iri(value: str) -> str:
+    """
+    Helper function to expand a compact IRI of the DCAT JSON-LD context
+
+    :param value: `str` of compact IRI (e.g. `dcat:Dataset`)
+
+    :returns: `str` of IRI
+    """
+
+    prefix, _, local = value.partition(':')
+
+    if prefix in NAMESPACES:
+        return NAMESPACES[prefix] + local
+
+    return value
+
+
+def _get_terms(context: dict) -> dict:
+    """
+    Helper function to expand the terms of a JSON-LD context
+
+    :param context: `dict` of JSON-LD context
+
+    :returns: `dict` of term to `tuple` of property IRI (`None` for an
+              `@id` alias) and language
+    """
+
+    terms = {}
+
+    for key, value in context.items():
+        if key in NAMESPACES:
+            continue
+        if isinstance(value, str):
+            terms[key] = (_expand_iri(value), None)
+        elif value.get('@id') == '@id':
+            terms[key] = (None, None)
+        else:
+            terms[key] = (_expand_iri(value['@id']), value.get('@language'))
+
+    return terms
+
+
+NAMESPACES = {key: value for key, value in CONTEXT.items()
+              if isinstance(value, str) and value.endswith(('#', '/'))}
+
+TERMS = _get_terms(CONTEXT)
+
+
+class NTriplesEmitter:
+    """Minimal emitter of DCAT JSON-LD node objects as N-Triples"""
+
+    def __init__(self, blank_nodes: Iterator[int] = None):
+        """
+        Initialize object
+
+        :param blank_nodes: iterator of blank node numbers, shared across
+                            the output document
+
+        :returns: pygeometa.schemas.dcat.NTriplesEmitter
+        """
+
+        self.blank_nodes = blank_nodes or itertools.count()
+
+    def get_subject(self, node: dict) -> str:
+        """
+        Derive the N-Triples subject of a node object
+
+        :param node: `dict` of node object
+
+        :returns: `str` of IRI or blank node
+        """
+
+        for key in ['@id', 'dataseturi']:
+            if node.get(key):
+                return self.format_iri(node[key])
+
+        return f'_:b{next(self.blank_nodes)}'
+
+    def format_iri(self, iri: str) -> str:
+        """
+        Format an IRI as an N-Triples IRI reference, percent-encoding
+        spaces, control characters and other characters not allowed in
+        IRI references (see `IRI_ESCAPES`)
+
+        :param iri: `str` of IRI
+
+        :returns: `str` of IRI reference
+        """
+
+        return f'<{str(iri).translate(IRI_ESCAPES)}>'
+
+    def format_triple(self, subject: str, predicate: str,
+                      object_: str) -> bytes:
+        """
+        Format a triple as an N-Triples line
+
+        :param subject: `str` of subject IRI or blank node
+        :param predicate: `str` of predicate IRI
+        :param object_: `str` of object IRI, blank node or literal
+
+        :returns: `bytes` of N-Triples line
+        """
+
+        predicate = self.format_iri(predicate)
+
+        return f'{subject} {predicate} {object_} .\n'.encode('utf-8')
+
+    def format_literal(self, value, language: str = None) -> str:
+        """
+        Format a value as an N-Triples literal
+
+        :param value: literal value
+        :param language: language tag of string literals
+
+        :returns: `str` of literal
+        """
+
+        datatype = None
+
+        if isinstance(value, bool):
+            value, datatype = str(value).lower(), 'boolean'
+        elif isinstance(value, int):
+            datatype = 'integer'
+        elif isinstance(value, float):
+            datatype = 'double'
+        elif isinstance(value, datetime):
+            value, datatype = value.isoformat(), 'dateTime'
+        elif isinstance(value, date):
+            value, datatype = value.isoformat(), 'date'
+
+        value = (str(value).replace('\\', '\\\\').replace('"', '\\"')
+                 .replace('\n', '\\n').replace('\r', '\\r'))
+
+        if datatype is not None:
+            return f'"{value}"^^<{XSD}{datatype}>'
+        if language is not None:
+            return f'"{value}"@{language}'
+        return f'"{value}"'
+
+    def emit(self, node: dict, subject: str) -> Iterator[bytes]:
+        """
+        Emit the triples of a node object, and of its nested node objects
+
+        Keys which are not terms of the DCAT JSON-LD context are ignored,
+        as in JSON-LD expansion.
+
+        :param node: `dict` of node object
+        :param subject: `str` of node subject IRI or blank node
+
+        :returns: iterator of `bytes` of N-Triples lines
+        """
+
+        for key, values in node.items():
+            if key == '@type':
+                yield self.format_triple(
+                    subject, RDF_TYPE, self.format_iri(_expand_iri(values)))
+                continue
+            if key not in TERMS or TERMS[key][0] is None:
+                continue
+
+            predicate, language = TERMS[key]
+
+            if not isinstance(values, list):
+                values = [values]
+
+            for value in values:
+                if value is None:
+                    continue
+                if isinstance(value, dict):
+                    object_ = self.get_subject(value)
+                    yield self.format_triple(subject, predicate, object_)
+                    yield from self.emit(value, object_)
+                else:
+                    yield self.format_triple(
+                        subject, predicate,
+                        self.format_literal(value, language))
@@ -46,6 +46,8 @@
 import ast
 import logging
 import os
+import re
+from typing import IO, Iterator, Union
 
 from lxml import etree
 from owslib.iso import CI_OnlineResource, CI_ResponsibleParty, MD_Metadata
@@ -55,6 +57,19 @@ from pygeometa.schemas.base import BaseOutputSchema
 LOGGER = logging.getLogger(__name__)
 THISDIR = os.path.dirname(os.path.realpath(__file__))
 
+NAMESPACES = {
+    'gco': 'http://www.isotc211.org/2005/gco',
+    'gmd': 'http://www.isotc211.org/2005/gmd',
+    'gmi': 'http://www.isotc211.org/2005/gmi',
+    'gml': 'http://www.opengis.net/gml',
+    'gml32': 'http://www.opengis.net/gml/3.2',
+    'gmx': 'http://www.isotc211.org/2005/gmx',
+    'srv': 'http://www.isotc211.org/2005/srv',
+    'xlink': 'http://www.w3.org/1999/xlink'
+}
+
+IMPORT_ENGINES = ['owslib', 'xpath']
+
 
 class ISO19139OutputSchema(BaseOutputSchema):
     """ISO 19139 output schema"""
@@ -70,135 +85,208 @@ class ISO19139OutputSchema(BaseOutputSchema):
 
         super().__init__('iso19139', description, 'xml', THISDIR)
 
-    def import_(self, metadata: str) -> dict:
+    def import_(self, metadata: str, engine: str = 'owslib') -> dict:
         """
         Import metadata into MCF
 
         :param metadata: string of metadata content
+        :param engine: import engine (`owslib` or `xpath`)
 
         :returns: `dict` of MCF content
         """
 
-        mcf = {
-            'mcf': {
-                'version': '1.0',
-            },
-            'metadata': {},
-            'spatial': {},
-            'identification': {},
-            'contact': {},
-            'distribution': {}
-        }
-
         LOGGER.debug('Parsing ISO metadata')
         try:
-            m = MD_Metadata(etree.fromstring(metadata))
+            exml = etree.fromstring(metadata)
         except ValueError:
-            m = MD_Metadata(etree.fromstring(bytes(metadata, 'utf-8')))
-
-        LOGGER.debug('Setting metadata')
-        mcf['metadata']['identifier'] = m.identifier
-
-        mcf['metadata']['hierarchylevel'] = m.hierarchy
-        mcf['metadata']['datestamp'] = m.datestamp
-
-        LOGGER.debug('Setting language')
-        if m.language:
-            mcf['metadata']['language'] = m.language
-        elif m.languagecode:
-            mcf['metadata']['language'] = m.languagecode
-
-        identification = next(iter(m.identification), {})
-
-        LOGGER.debug('Setting identification')
-        mcf['identification']['title'] = identification.title
-        mcf['identification']['abstract'] = identification.abstract
-
-        if identification.date:
-            mcf['identification']['dates'] = {}
-            for date_ in identification.date:
-                mcf['identification']['dates'][date_.type] = date_.date
-
-        if identification.keywords:
-            mcf['identification']['keywords'] = {}
-            for count, value in enumerate(identification.keywords):
-                key = f'keywords-{count}'
-                mcf['identification']['keywords'][key] = {
-                    'keywords_type': value.type,
-                    'keywords': [k.name for k in value.keywords]
+            exml = etree.fromstring(bytes(metadata, 'utf-8'))
+
+        return element_to_mcf(exml, engine)
+
+    def import_iter(self, fh: IO, engine: str = 'owslib') -> Iterator[dict]:
+        """
+        Import one or more metadata records into MCF
+
+        Records are streamed from any document containing
+        `gmd:MD_Metadata` (or `gmi:MI_Metadata`) elements (such as
+        CSW GetRecords responses or OAI-PMH ListRecords responses)
+        or from concatenated ISO documents.  Processed elements are
+        cleared as the document is parsed so that memory use stays
+        bounded to a single record.
+
+        :param fh: file-like object of metadata content
+        :param engine: import engine (`owslib` or `xpath`)
+
+        :returns: iterator of `dict` of MCF content
+        """
+
+        tags = [f"{{{NAMESPACES['gmd']}}}MD_Metadata",
+                f"{{{NAMESPACES['gmi']}}}MI_Metadata"]
+
+        LOGGER.debug('Streaming ISO metadata')
+        context = etree.iterparse(XMLRecordStream(fh), events=('end',),
+                                  tag=tags, huge_tree=True)
+
+        for count, (event, element) in enumerate(context):
+            LOGGER.debug(f'Parsing ISO metadata record {count}')
+            try:
+                mcf = element_to_mcf(element, engine)
+            except Exception as err:
+                LOGGER.warning(f'Skipping record {count}: {err}')
+                mcf = None
+
+            # free the record, earlier records and their wrappers (e.g.
+            # OAI-PMH record/header/metadata elements)
+            element.clear()
+            for node in [element, *element.iterancestors()]:
+                while node.getprevious() is not None:
+                    del node.getparent()[0]
+
+            if mcf is not None:
+                yield mcf
+
+
+def element_to_mcf(element: etree._Element, engine: str = 'owslib') -> dict:
+    """
+    Generates an MCF from an ISO metadata element
+
+    :param element: `gmd:MD_Metadata` (or `gmi:MI_Metadata`) element
+    :param engine: import engine (`owslib` or `xpath`)
+
+    :returns: `dict` of MCF content
+    """
+
+    if engine == 'owslib':
+        return md_metadata_to_mcf(MD_Metadata(element))
+    elif engine == 'xpath':
+        return xpath_to_mcf(element)
+
+    raise ValueError(f'Unknown import engine: {engine}')
+
+
+def md_metadata_to_mcf(m: MD_Metadata) -> dict:
+    """
+    Generates an MCF from an OWSLib metadata object
+
+    :param m: OWSLib `MD_Metadata` object
+
+    :returns: `dict` of MCF content
+    """
+
+    mcf = {
+        'mcf': {
+            'version': '1.0',
+        },
+        'metadata': {},
+        'spatial': {},
+        'identification': {},
+        'contact': {},
+        'distribution': {}
+    }
+
+    LOGGER.debug('Setting metadata')
+    mcf['metadata']['identifier'] = m.identifier
+
+    mcf['metadata']['hierarchylevel'] = m.hierarchy
+    mcf['metadata']['datestamp'] = m.datestamp
+
+    LOGGER.debug('Setting language')
+    if m.language:
+        mcf['metadata']['language'] = m.language
+    elif m.languagecode:
+        mcf['metadata']['language'] = m.languagecode
+
+    identification = next(iter(m.identification), {})
+
+    LOGGER.debug('Setting identification')
+    mcf['identification']['title'] = identification.title
+    mcf['identification']['abstract'] = identification.abstract
+
+    if identification.date:
+        mcf['identification']['dates'] = {}
+        for date_ in identification.date:
+            mcf['identification']['dates'][date_.type] = date_.date
+
+    if identification.keywords:
+        mcf['identification']['keywords'] = {}
+        for count, value in enumerate(identification.keywords):
+            key = f'keywords-{count}'
+            mcf['identification']['keywords'][key] = {
+                'keywords_type': value.type,
+                'keywords': [k.name for k in value.keywords]
+            }
+            if value.thesaurus is not None:
+                mcf['identification']['keywords'][key]['vocabulary'] = {
+                    'name': value.thesaurus['title'],
+                    'url': value.thesaurus['url']
                 }
-                if value.thesaurus is not None:
-                    mcf['identification']['keywords'][key]['vocabulary'] = {
-                        'name': value.thesaurus['title'],
-                        'url': value.thesaurus['url']
-                    }
-
-        if hasattr(identification, 'graphicoverview'):
-            mcf['identification']['browsegraphic'] = next(iter(identification.graphicoverview), None)  # noqa
-
-        mcf['identification']['topiccategory'] = identification.topiccategory  # noqa
-
-        mcf['identification']['extents'] = {
-            'spatial': [{
-                'bbox': []
-            }],
-            'temporal': []
-        }
-        try:
-            mcf['identification']['extents']['spatial'][0]['bbox'] = [
-                    ast.literal_eval(identification.extent.boundingBox.minx),
-                    ast.literal_eval(identification.extent.boundingBox.miny),
-                    ast.literal_eval(identification.extent.boundingBox.maxx),
-                    ast.literal_eval(identification.extent.boundingBox.maxy)
-                ]
-        except ValueError as err:
-            LOGGER.info(f'boundingBox empty: {err}')
-        except AttributeError as err:
-            LOGGER.info(f'boundingBox missing: {err}')
 
-        temp_extent = {
-            'begin': None,
-            'end': None
-        }
+    if hasattr(identification, 'graphicoverview'):
+        mcf['identification']['browsegraphic'] = next(iter(identification.graphicoverview), None)  # noqa
+
+    mcf['identification']['topiccategory'] = identification.topiccategory  # noqa
+
+    mcf['identification']['extents'] = {
+        'spatial': [{
+            'bbox': []
+        }],
+        'temporal': []
+    }
+    try:
+        mcf['identification']['extents']['spatial'][0]['bbox'] = [
+                ast.literal_eval(identification.extent.boundingBox.minx),
+                ast.literal_eval(identification.extent.boundingBox.miny),
+                ast.literal_eval(identification.extent.boundingBox.maxx),
+                ast.literal_eval(identification.extent.boundingBox.maxy)
+            ]
+    except ValueError as err:
+        LOGGER.info(f'boundingBox empty: {err}')
+    except AttributeError as err:
+        LOGGER.info(f'boundingBox missing: {err}')
+
+    temp_extent = {
+        'begin': None,
+        'end': None
+    }
 
-        if identification.temporalextent_start:
-            temp_extent['begin'] = identification.temporalextent_start
-        if identification.temporalextent_end:
-            temp_extent['end'] = identification.temporalextent_end
+    if identification.temporalextent_start:
+        temp_extent['begin'] = identification.temporalextent_start
+    if identification.temporalextent_end:
+        temp_extent['end'] = identification.temporalextent_end
 
-        mcf['identification']['extents']['temporal'].append(temp_extent)
+    mcf['identification']['extents']['temporal'].append(temp_extent)
 
-        if hasattr(identification, 'denominators'):
-            mcf['spatial']['denominators'] = identification.denominators
+    if hasattr(identification, 'denominators'):
+        mcf['spatial']['denominators'] = identification.denominators
 
-        if hasattr(identification, 'distance'):
-            mcf['spatial']['resolution'] = []
-            for k, v in enumerate(identification.distance):
-                uom = ''
-                if hasattr(identification, 'uom') and len(identification.uom) > k: # noqa
-                    uom = identification.uom[k]
-                mcf['spatial']['resolution'].append({'distance': v,
-                                                     'uom': uom})
+    if hasattr(identification, 'distance'):
+        mcf['spatial']['resolution'] = []
+        for k, v in enumerate(identification.distance):
+            uom = ''
+            if hasattr(identification, 'uom') and len(identification.uom) > k: # noqa
+                uom = identification.uom[k]
+            mcf['spatial']['resolution'].append({'distance': v,
+                                                 'uom': uom})
 
-        if hasattr(identification, 'spatialrepresentationtype') and len(identification.spatialrepresentationtype) > 0:  # noqa
-            mcf['spatial']['datatype'] = next(iter(identification.spatialrepresentationtype), '') # noqa
+    if hasattr(identification, 'spatialrepresentationtype') and len(identification.spatialrepresentationtype) > 0:  # noqa
+        mcf['spatial']['datatype'] = next(iter(identification.spatialrepresentationtype), '') # noqa
 
-        if hasattr(identification, 'accessconstraints'):
-            mcf['identification']['accessconstraints'] = next(iter(identification.accessconstraints), '')  # noqa
+    if hasattr(identification, 'accessconstraints'):
+        mcf['identification']['accessconstraints'] = next(iter(identification.accessconstraints), '')  # noqa
 
-        mcf['identification']['status'] = identification.status
+    mcf['identification']['status'] = identification.status
 
-        LOGGER.debug('Setting contacts')
-        for contact in m.get_all_contacts():
-            mcf['contact'].update(get_contact(contact))
+    LOGGER.debug('Setting contacts')
+    for contact in m.get_all_contacts():
+        mcf['contact'].update(get_contact(contact))
 
-        LOGGER.debug('Setting distribution')
-        if m.distribution:
-            for count, value in enumerate(m.distribution.online):
-                key = f'link-{count}'
-                mcf['distribution'][key] = get_link(value)
+    LOGGER.debug('Setting distribution')
+    if m.distribution:
+        for count, value in enumerate(m.distribution.online):
+            key = f'link-{count}'
+            mcf['distribution'][key] = get_link(value)
 
-        return mcf
+    return mcf
 
 
 def get_contact(contact: CI_ResponsibleParty) -> dict:
@@ -254,3 +342,510 @@ def get_link(link: CI_OnlineResource) -> dict:
     }
 
     return mcf_link
+
+
+def _xpath(path: str) -> etree.XPath:
+    """
+    Helper function to compile an XPath expression with ISO namespaces
+
+    :param path: XPath expression
+
+    :returns: `lxml.etree.XPath` object
+    """
+
+    return etree.XPath(path, namespaces=NAMESPACES)
+
+
+def _xpath_char_or_anchor(path: str) -> tuple:
+    """
+    Helper function to compile XPath expressions of a property encoded
+    as either `gco:CharacterString` or `gmx:Anchor`
+
+    :param path: XPath expression of property element
+
+    :returns: `tuple` of `lxml.etree.XPath` objects
+    """
+
+    return _xpath(f'{path}/gco:CharacterString'), _xpath(f'{path}/gmx:Anchor')
+
+
+# precompiled XPath expressions of the `xpath` import engine, mirroring
+# the OWSLib object model for the elements copied into MCF
+XP_IDENTIFIER = _xpath('gmd:fileIdentifier/gco:CharacterString')
+XP_LANGUAGE = _xpath('gmd:language/gco:CharacterString')
+XP_LANGUAGECODE = _xpath('gmd:language/gmd:LanguageCode')
+XP_DATESTAMP = _xpath('gmd:dateStamp/gco:Date')
+XP_DATETIMESTAMP = _xpath('gmd:dateStamp/gco:DateTime')
+XP_HIERARCHY = _xpath('gmd:hierarchyLevel/gmd:MD_ScopeCode')
+XP_IDENTIFICATION = _xpath(
+    'gmd:identificationInfo/*[self::gmd:MD_DataIdentification or '
+    'self::gmd:MD_ServiceIdentification or '
+    'self::srv:SV_ServiceIdentification]')
+XP_DISTRIBUTION = _xpath(
+    'gmd:distributionInfo/gmd:MD_Distribution[1]/gmd:transferOptions/'
+    'gmd:MD_DigitalTransferOptions/gmd:onLine/gmd:CI_OnlineResource')
+
+XP_TITLE = _xpath('gmd:citation/gmd:CI_Citation/gmd:title/'
+                  'gco:CharacterString')
+XP_ABSTRACT = _xpath('gmd:abstract/gco:CharacterString')
+XP_ABSTRACT_ANCHOR = _xpath('gmd:abstract/gmx:Anchor')
+XP_DATES = _xpath('gmd:citation/gmd:CI_Citation/gmd:date/gmd:CI_Date')
+XP_DATE_DATE = _xpath('gmd:date/gco:Date')
+XP_DATE_DATETIME = _xpath('gmd:date/gco:DateTime')
+XP_DATE_TYPE = _xpath('gmd:dateType/gmd:CI_DateTypeCode')
+XP_KEYWORDS = _xpath('gmd:descriptiveKeywords/gmd:MD_Keywords')
+XP_KEYWORD = _xpath('gmd:keyword/gco:CharacterString')
+XP_KEYWORD_ANCHOR = _xpath('gmd:keyword/gmx:Anchor')
+XP_KEYWORD_TYPE = _xpath('gmd:type/gmd:MD_KeywordTypeCode')
+XP_THESAURUS = _xpath('gmd:thesaurusName/gmd:CI_Citation')
+XP_THESAURUS_TITLE = _xpath('gmd:title/gco:CharacterString')
+XP_THESAURUS_ANCHOR = _xpath('gmd:title/gmx:Anchor')
+XP_BROWSEGRAPHIC = _xpath('gmd:graphicOverview/gmd:MD_BrowseGraphic/'
+                          'gmd:fileName/gco:CharacterString')
+XP_TOPICCATEGORY = _xpath('gmd:topicCategory/gmd:MD_TopicCategoryCode')
+XP_GEOGRAPHIC_ELEMENT = _xpath(
+    '(gmd:extent|srv:extent)/gmd:EX_Extent/gmd:geographicElement['
+    'gmd:EX_GeographicBoundingBox or gmd:EX_BoundingPolygon]')
+XP_BBOX = _xpath(
+    'gmd:EX_GeographicBoundingBox/gmd:westBoundLongitude/gco:Decimal|'
+    'gmd:EX_GeographicBoundingBox/gmd:southBoundLatitude/gco:Decimal|'
+    'gmd:EX_GeographicBoundingBox/gmd:eastBoundLongitude/gco:Decimal|'
+    'gmd:EX_GeographicBoundingBox/gmd:northBoundLatitude/gco:Decimal')
+XP_BEGIN = _xpath(
+    '(gmd:extent|srv:extent)/gmd:EX_Extent/gmd:temporalElement/'
+    'gmd:EX_TemporalExtent/gmd:extent/gml:TimePeriod/gml:beginPosition|'
+    '(gmd:extent|srv:extent)/gmd:EX_Extent/gmd:temporalElement/'
+    'gmd:EX_TemporalExtent/gmd:extent/gml32:TimePeriod/gml32:beginPosition')
+XP_END = _xpath(
+    '(gmd:extent|srv:extent)/gmd:EX_Extent/gmd:temporalElement/'
+    'gmd:EX_TemporalExtent/gmd:extent/gml:TimePeriod/gml:endPosition|'
+    '(gmd:extent|srv:extent)/gmd:EX_Extent/gmd:temporalElement/'
+    'gmd:EX_TemporalExtent/gmd:extent/gml32:TimePeriod/gml32:endPosition')
+XP_DENOMINATOR = _xpath(
+    'gmd:spatialResolution/gmd:MD_Resolution/gmd:equivalentScale/'
+    'gmd:MD_RepresentativeFraction/gmd:denominator/gco:Integer')
+XP_DISTANCE = _xpath(
+    'gmd:spatialResolution/gmd:MD_Resolution/gmd:distance/gco:Distance')
+XP_SPATIALREPRESENTATIONTYPE = _xpath(
+    'gmd:spatialRepresentationType/gmd:MD_SpatialRepresentationTypeCode')
+XP_ACCESSCONSTRAINTS = _xpath(
+    'gmd:resourceConstraints/gmd:MD_LegalConstraints/'
+    'gmd:accessConstraints/gmd:MD_RestrictionCode')
+XP_STATUS = _xpath('gmd:status/gmd:MD_ProgressCode')
+XP_CONTACTS = _xpath('gmd:pointOfContact/gmd:CI_ResponsibleParty')
+
+XP_CONTACT_ROLE = _xpath('gmd:role/gmd:CI_RoleCode')
+XP_CONTACT_ONLINERESOURCE = _xpath(
+    'gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/'
+    'gmd:CI_OnlineResource')
+XP_CONTACT_LOOKUP = [
+    ('name', None, _xpath_char_or_anchor('gmd:individualName')),
+    ('organization', None, _xpath_char_or_anchor('gmd:organisationName')),
+    ('positionname', _xpath('gmd:positionName/gco:CharacterString'), None),
+    ('phone', _xpath('gmd:contactInfo/gmd:CI_Contact/gmd:phone/'
+                     'gmd:CI_Telephone/gmd:voice/gco:CharacterString'), None),
+    ('fax', _xpath('gmd:contactInfo/gmd:CI_Contact/gmd:phone/'
+                   'gmd:CI_Telephone/gmd:facsimile/gco:CharacterString'),
+     None),
+    ('address', _xpath('gmd:contactInfo/gmd:CI_Contact/gmd:address/'
+                       'gmd:CI_Address/gmd:deliveryPoint/gco:CharacterString'),
+     None),
+    ('city', _xpath('gmd:contactInfo/gmd:CI_Contact/gmd:address/'
+                    'gmd:CI_Address/gmd:city/gco:CharacterString'), None),
+    ('administrativearea', _xpath(
+        'gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/'
+        'gmd:administrativeArea/gco:CharacterString'), None),
+    ('postalcode', _xpath('gmd:contactInfo/gmd:CI_Contact/gmd:address/'
+                          'gmd:CI_Address/gmd:postalCode/gco:CharacterString'),
+     None),
+    ('country', _xpath('gmd:contactInfo/gmd:CI_Contact/gmd:address/'
+                       'gmd:CI_Address/gmd:country/gco:CharacterString'),
+     None),
+    ('email', _xpath('gmd:contactInfo/gmd:CI_Contact/gmd:address/'
+                     'gmd:CI_Address/gmd:electronicMailAddress/'
+                     'gco:CharacterString'), None)
+]
+
+XP_LINK_URL = _xpath('gmd:linkage/gmd:URL')
+XP_LINK_PROTOCOL = _xpath_char_or_anchor('gmd:protocol')
+XP_LINK_NAME = _xpath_char_or_anchor('gmd:name')
+XP_LINK_DESCRIPTION = _xpath('gmd:description/gco:CharacterString')
+XP_LINK_FUNCTION = _xpath('gmd:function/gmd:CI_OnLineFunctionCode')
+
+XLINK_HREF = f"{{{NAMESPACES['xlink']}}}href"
+
+
+def _text(elements: list) -> Union[str, None]:
+    """
+    Helper function to return the stripped text of the first element
+
+    :param elements: `list` of elements
+
+    :returns: `str` of element text or `None`
+    """
+
+    if elements and elements[0].text:
+        return elements[0].text.strip()
+
+    return None
+
+
+def _texts(elements: list) -> list:
+    """
+    Helper function to return the stripped text of all elements with text
+
+    :param elements: `list` of elements
+
+    :returns: `list` of element texts
+    """
+
+    return [e.text.strip() for e in elements if e.text]
+
+
+def _codelist(elements: list) -> Union[str, None]:
+    """
+    Helper function to return a codelist value (`@codeListValue`,
+    else element text) of the first element
+
+    :param elements: `list` of elements
+
+    :returns: `str` of codelist value or `None`
+    """
+
+    if not elements:
+        return None
+
+    value = elements[0].get('codeListValue')
+    if value is not None:
+        return value.strip()
+
+    return _text(elements)
+
+
+def _char_or_anchor(element: etree._Element,
+                    xpaths: tuple) -> Union[str, None]:
+    """
+    Helper function to return the value of a property encoded as
+    either `gco:CharacterString` or `gmx:Anchor`
+
+    :param element: context element
+    :param xpaths: `tuple` of `lxml.etree.XPath` (CharacterString, Anchor)
+
+    :returns: `str` of value or `None`
+    """
+
+    value = _text(xpaths[0](element))
+
+    if value in [None, '']:
+        anchor = xpaths[1](element)
+        if anchor:
+            value = _text(anchor)
+
+    return value
+
+
+def _number(value: str) -> Union[float, int]:
+    """
+    Helper function to derive a number from a decimal string
+
+    :param value: `str` of number
+
+    :returns: `int` or `float` of value
+    """
+
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def xpath_to_mcf(md: etree._Element) -> dict:
+    """
+    Generates an MCF from an ISO metadata element using precompiled
+    XPath expressions
+
+    :param md: `gmd:MD_Metadata` (or `gmi:MI_Metadata`) element
+
+    :returns: `dict` of MCF content
+    """
+
+    mcf = {
+        'mcf': {
+            'version': '1.0',
+        },
+        'metadata': {},
+        'spatial': {},
+        'identification': {},
+        'contact': {},
+        'distribution': {}
+    }
+
+    LOGGER.debug('Setting metadata')
+    mcf['metadata']['identifier'] = _text(XP_IDENTIFIER(md))
+
+    mcf['metadata']['hierarchylevel'] = _codelist(XP_HIERARCHY(md))
+    mcf['metadata']['datestamp'] = (_text(XP_DATESTAMP(md)) or
+                                    _text(XP_DATETIMESTAMP(md)))
+
+    LOGGER.debug('Setting language')
+    language = _text(XP_LANGUAGE(md))
+    languagecode = XP_LANGUAGECODE(md)
+    if language:
+        mcf['metadata']['language'] = language
+    elif languagecode and languagecode[0].get('codeListValue'):
+        mcf['metadata']['language'] = languagecode[0].get('codeListValue')
+
+    identifications = XP_IDENTIFICATION(md)
+
+    if identifications:
+        ident = identifications[0]
+    else:
+        LOGGER.debug('No identification found')
+        ident = etree.Element('identificationInfo')
+
+    LOGGER.debug('Setting identification')
+    mcf['identification']['title'] = _text(XP_TITLE(ident))
+
+    abstract_anchor = XP_ABSTRACT_ANCHOR(ident)
+    if abstract_anchor:
+        mcf['identification']['abstract'] = _text(abstract_anchor)
+    else:
+        mcf['identification']['abstract'] = _text(XP_ABSTRACT(ident))
+
+    dates = XP_DATES(ident)
+    if dates:
+        mcf['identification']['dates'] = {}
+        for date_ in dates:
+            type_ = _codelist(XP_DATE_TYPE(date_))
+            value = XP_DATE_DATE(date_) or XP_DATE_DATETIME(date_)
+            mcf['identification']['dates'][type_] = _text(value)
+
+    keywords = XP_KEYWORDS(ident)
+    if keywords:
+        mcf['identification']['keywords'] = {}
+        for count, value in enumerate(keywords):
+            key = f'keywords-{count}'
+            words = XP_KEYWORD(value) or XP_KEYWORD_ANCHOR(value)
+            type_ = XP_KEYWORD_TYPE(value)
+
+            mcf['identification']['keywords'][key] = {
+                'keywords_type': type_[0].get('codeListValue') if type_ else None,  # noqa
+                'keywords': [_text([w]) for w in words]
+            }
+
+            thesaurus = XP_THESAURUS(value)
+            if thesaurus:
+                name = _text(XP_THESAURUS_TITLE(thesaurus[0]))
+                url = None
+                if name is None:
+                    anchor = XP_THESAURUS_ANCHOR(thesaurus[0])
+                    if anchor:
+                        name = _text(anchor)
+                        url = anchor[0].get(XLINK_HREF)
+
+                mcf['identification']['keywords'][key]['vocabulary'] = {
+                    'name': name,
+                    'url': url
+                }
+
+    mcf['identification']['browsegraphic'] = next(
+        iter(_texts(XP_BROWSEGRAPHIC(ident))), None)
+
+    mcf['identification']['topiccategory'] = _texts(
+        XP_TOPICCATEGORY(ident))
+
+    mcf['identification']['extents'] = {
+        'spatial': [{
+            'bbox': []
+        }],
+        'temporal': []
+    }
+
+    geographic_element = XP_GEOGRAPHIC_ELEMENT(ident)
+    if geographic_element:
+        bbox = XP_BBOX(geographic_element[0])
+        bbox = {e.getparent().tag.split('}')[-1]: _text([e]) for e in bbox}
+        try:
+            mcf['identification']['extents']['spatial'][0]['bbox'] = [
+                _number(bbox.get('westBoundLongitude')),
+                _number(bbox.get('southBoundLatitude')),
+                _number(bbox.get('eastBoundLongitude')),
+                _number(bbox.get('northBoundLatitude'))
+            ]
+        except (TypeError, ValueError) as err:
+            LOGGER.info(f'boundingBox empty: {err}')
+    else:
+        LOGGER.info('boundingBox missing')
+
+    mcf['identification']['extents']['temporal'].append({
+        'begin': _text(XP_BEGIN(ident)) or None,
+        'end': _text(XP_END(ident)) or None
+    })
+
+    mcf['spatial']['denominators'] = _texts(XP_DENOMINATOR(ident))
+
+    mcf['spatial']['resolution'] = []
+    for distance in XP_DISTANCE(ident):
+        if distance.text:
+            mcf['spatial']['resolution'].append({
+                'distance': distance.text.strip(),
+                'uom': distance.get('uom')
+            })
+
+    spatialrepresentationtypes = [
+        e.get('codeListValue') for e in XP_SPATIALREPRESENTATIONTYPE(ident)
+        if e.get('codeListValue')
+    ]
+    if spatialrepresentationtypes:
+        mcf['spatial']['datatype'] = spatialrepresentationtypes[0]
+
+    accessconstraints = [_codelist([e]) for e in XP_ACCESSCONSTRAINTS(ident)]
+    mcf['identification']['accessconstraints'] = next(
+        (a for a in accessconstraints if a is not None), '')
+
+    mcf['identification']['status'] = _codelist(XP_STATUS(ident))
+
+    LOGGER.debug('Setting contacts')
+    for identification in identifications:
+        for contact in XP_CONTACTS(identification):
+            role = _codelist(XP_CONTACT_ROLE(contact))
+            mcf_contact = {}
+
+            for key, xpath, xpath_char_or_anchor in XP_CONTACT_LOOKUP:
+                if xpath_char_or_anchor is not None:
+                    value = _char_or_anchor(contact, xpath_char_or_anchor)
+                else:
+                    value = _text(xpath(contact))
+
+                if value is not None:
+                    mcf_contact[key] = value
+
+            onlineresource = XP_CONTACT_ONLINERESOURCE(contact)
+            if onlineresource:
+                mcf_contact['url'] = _text(XP_LINK_URL(onlineresource[0]))
+
+            mcf['contact'][role] = mcf_contact
+
+    LOGGER.debug('Setting distribution')
+    for count, link in enumerate(XP_DISTRIBUTION(md)):
+        mcf['distribution'][f'link-{count}'] = {
+            'url': _text(XP_LINK_URL(link)),
+            'type': _char_or_anchor(link, XP_LINK_PROTOCOL),
+            'name': _char_or_anchor(link, XP_LINK_NAME),
+            'description': _text(XP_LINK_DESCRIPTION(link)),
+            'function': _codelist(XP_LINK_FUNCTION(link))
+        }
+
+    return mcf
+
+
+class XMLRecordStream:
+    """
+    Read-only stream wrapping one or more XML documents under a single
+    synthetic root element, so that CSW/OAI-PMH responses as well as
+    concatenated documents can be fed to `lxml.etree.iterparse`
+    """
+
+    XML_DECLARATION = re.compile(rb'<\?xml[^>]*\?>')
+    ENCODING = re.compile(rb'encoding=["\']([A-Za-z0-9._-]+)["\']')
+
+    def __init__(self, fh: IO, chunk_size: int = 65536):
+        """
+        Initialize object
+
+        :param fh: file-like object (text or binary) of XML content
+        :param chunk_size: number of bytes/characters per read
+
+        :returns: pygeometa.schemas.iso19139.XMLRecordStream
+        """
+
+        self.fh = fh
+        self.chunk_size = chunk_size
+        self.started = False
+        self.finished = False
+        self.text = False
+        self.carry = b''
+
+    def _read(self) -> bytes:
+        """
+        Read raw content, encoding text as UTF-8
+
+        :returns: `bytes` of content
+        """
+
+        data = self.fh.read(self.chunk_size)
+
+        if isinstance(data, str):
+            self.text = True
+            data = data.encode('utf-8')
+
+        return data
+
+    def _next_chunk(self) -> bytes:
+        """
+        Read the next chunk of content, stripping XML declarations
+
+        :returns: `bytes` of XML content
+        """
+
+        while True:
+            data = self._read()
+
+            if not data:
+                chunk, self.carry = self.carry, b''
+                return self.XML_DECLARATION.sub(b'', chunk)
+
+            chunk = self.carry + data
+
+            # hold back a trailing, possibly incomplete, markup construct
+            index = chunk.rfind(b'<')
+            if index != -1 and chunk.find(b'>', index) == -1:
+                chunk, self.carry = chunk[:index], chunk[index:]
+            else:
+                self.carry = b''
+
+            chunk = self.XML_DECLARATION.sub(b'', chunk)
+            if chunk:
+                return chunk
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read content for the XML parser
+
+        :param size: size hint (ignored)
+
+        :returns: `bytes` of XML content
+        """
+
+        if not self.started:
+            self.started = True
+            prolog = b''
+            data = self._read()
+            # read on until a leading XML declaration is complete
+            while True:
+                head = data.lstrip()
+                if not b'<?xml'.startswith(head[:5]) or b'>' in head:
+                    break
+                more = self._read()
+                if not more:
+                    break
+                data += more
+            if not self.text:
+                match = self.XML_DECLARATION.match(data.lstrip())
+                if match is not None:
+                    encoding = self.ENCODING.search(match.group(0))
+                    if encoding is not None:
+                        prolog = (b'<?xml version="1.0" encoding="' +
+                                  encoding.group(1) + b'"?>')
+            self.carry = data
+            return prolog + b'<pygeometa-records>'
+
+        if self.finished:
+            return b''
+
+        chunk = self._next_chunk()
+        if not chunk:
+            self.finished = True
+            return b'</pygeometa-records>'
+
+        return chunk
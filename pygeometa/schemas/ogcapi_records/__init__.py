@@ -43,13 +43,15 @@
 #
 # =================================================================
 
+from concurrent.futures import ProcessPoolExecutor
 import logging
 import os
-from typing import Union
+from typing import IO, Iterable, Union
 
 from pygeometa import __version__
-from pygeometa.core import get_charstring
-from pygeometa.helpers import generate_datetime, json_dumps
+from pygeometa.core import get_charstring, read_mcf
+from pygeometa.helpers import (bounded_imap, generate_datetime, group_contacts,
+                               json_dumps, json_encode)
 from pygeometa.schemas.base import BaseOutputSchema
 
 THISDIR = os.path.dirname(os.path.realpath(__file__))
@@ -266,6 +268,83 @@ class OGCAPIRecordOutputSchema(BaseOutputSchema):
 
         return record
 
+    def write_collection(self, mcfs: Iterable, fh: IO, ndjson: bool = False,
+                         jobs: int = 1) -> dict:
+        """
+        Write many MCFs as a FeatureCollection of records (or as
+        newline-delimited records), streamed to a binary file handle
+
+        Records are generated by `jobs` worker processes with at most a
+        bounded number in flight, and written in input order.  The
+        collection extent and counts are computed incrementally.  Records
+        failing to generate are logged and skipped.
+
+        :param mcfs: iterable of MCFs (`dict`, or filepath or string of
+                     MCF data)
+        :param fh: binary file-like object
+        :param ndjson: whether to write newline-delimited records rather
+                       than a FeatureCollection
+        :param jobs: number of worker processes
+
+        :returns: `dict` of number of records written (`numberReturned`),
+                  number of records failed (`numberFailed`) and collection
+                  extent (`extent`, as OGC API collection extent)
+        """
+
+        extent = CollectionExtent()
+        returned = 0
+        failed = 0
+
+        tasks = ((self, mcf) for mcf in mcfs)
+
+        def run() -> Iterable[dict]:
+            if jobs == 1:
+                yield from map(_encode_record, tasks)
+                return
+
+            from pygeometa.batch import get_process_options, init_process
+
+            LOGGER.debug(f'Writing collection with {jobs} workers')
+            with ProcessPoolExecutor(max_workers=jobs,
+                                     initializer=init_process,
+                                     initargs=(get_process_options(),)
+                                     ) as executor:
+                yield from bounded_imap(executor, _encode_record, tasks)
+
+        if not ndjson:
+            fh.write(b'{"type":"FeatureCollection","features":[')
+
+        for result in run():
+            if result['error'] is not None:
+                LOGGER.warning(f"Skipping record: {result['error']}")
+                failed += 1
+                continue
+
+            if ndjson:
+                fh.write(result['record'] + b'\n')
+            else:
+                fh.write(b',\n' if returned else b'\n')
+                fh.write(result['record'])
+
+            extent.update(result['bbox'], result['interval'])
+            returned += 1
+
+        if not ndjson:
+            trailer = {
+                'numberMatched': returned,
+                'numberReturned': returned
+            }
+            if extent.bbox is not None:
+                trailer['bbox'] = extent.bbox
+
+            fh.write(b'\n],' + json_encode(trailer, compact=True)[1:])
+
+        return {
+            'numberReturned': returned,
+            'numberFailed': failed,
+            'extent': extent.to_dict()
+        }
+
     def generate_party(self, contact: dict,
                        lang1: str, lang2: str, roles: list) -> dict:
         """
@@ -349,8 +428,7 @@ class OGCAPIRecordOutputSchema(BaseOutputSchema):
         if rp['addresses'][0] == {}:
             rp.pop('addresses')
 
-        for r in set(roles):
-            rp['roles'].append(r)
+        rp['roles'].extend(dict.fromkeys(roles))
 
         if 'url' in contact:
             rp['links'] = [{
@@ -371,33 +449,11 @@ class OGCAPIRecordOutputSchema(BaseOutputSchema):
         :returns: `list` of contacts
         """
 
-        contacts = []
-        contacts2 = []
-
-        for key, value in contact.items():
-            if contacts:
-                for c in contacts:
-                    if value == c['contact']:
-                        LOGGER.debug('Found matching contact; adding role')
-                        c['roles'].append(key)
-                    else:
-                        LOGGER.debug('Adding contact')
-                        contacts.append({
-                            'contact': value,
-                            'roles': [key]
-                        })
-            else:
-                contacts.append({
-                    'contact': value,
-                    'roles': [key]
-                })
-
-        LOGGER.debug(f'Contacts: {contacts}')
-        for c in contacts:
-            contacts2.append(self.generate_party(c['contact'], self.lang1,
-                             self.lang2, c['roles']))
+        groups = group_contacts(contact)
 
-        return contacts2
+        LOGGER.debug(f'Contacts: {groups}')
+        return [self.generate_party(group['contact'], self.lang1, self.lang2,
+                                    group['roles']) for group in groups]
 
     def generate_link(self, distribution: dict) -> dict:
         """
@@ -436,3 +492,143 @@ class OGCAPIRecordOutputSchema(BaseOutputSchema):
             link['channel'] = distribution['channel']
 
         return link
+
+
+class CollectionExtent:
+    """Incrementally aggregated spatial and temporal collection extent"""
+
+    def __init__(self):
+        """
+        Initialize object
+
+        :returns: pygeometa.schemas.ogcapi_records.CollectionExtent
+        """
+
+        self.bbox = None
+        self.interval = None
+
+    def update(self, bbox: list = None, interval: list = None) -> None:
+        """
+        Extend the extent with a record's extent
+
+        :param bbox: `list` of minx, miny, maxx, maxy (or `None`)
+        :param interval: `list` of begin and end (`..` if open), or `None`
+
+        :returns: `None`
+        """
+
+        if bbox is not None:
+            if self.bbox is None:
+                self.bbox = list(bbox)
+            else:
+                self.bbox = [min(self.bbox[0], bbox[0]),
+                             min(self.bbox[1], bbox[1]),
+                             max(self.bbox[2], bbox[2]),
+                             max(self.bbox[3], bbox[3])]
+
+        if interval is not None:
+            if self.interval is None:
+                self.interval = list(interval)
+            else:
+                begin, end = self.interval
+                if '..' in [begin, interval[0]]:
+                    begin = '..'
+                else:
+                    begin = min(begin, interval[0])
+                if '..' in [end, interval[1]]:
+                    end = '..'
+                else:
+                    end = max(end, interval[1])
+                self.interval = [begin, end]
+
+    def to_dict(self) -> dict:
+        """
+        Get the extent as an OGC API collection extent
+
+        :returns: `dict` of spatial and/or temporal extent
+        """
+
+        extent = {}
+
+        if self.bbox is not None:
+            extent['spatial'] = {
+                'bbox': [self.bbox],
+                'crs': 'http://www.opengis.net/def/crs/OGC/1.3/CRS84'
+            }
+        if self.interval is not None:
+            extent['temporal'] = {
+                'interval': [self.interval]
+            }
+
+        return extent
+
+
+def _get_bbox(geometry: dict) -> Union[list, None]:
+    """
+    Derive the bounding box of a GeoJSON geometry
+
+    :param geometry: `dict` of GeoJSON geometry (or `None`)
+
+    :returns: `list` of minx, miny, maxx, maxy (or `None`)
+    """
+
+    if not geometry:
+        return None
+
+    xs = []
+    ys = []
+
+    def add(coordinates):
+        if coordinates and isinstance(coordinates[0], (int, float)):
+            xs.append(coordinates[0])
+            ys.append(coordinates[1])
+        else:
+            for coordinates_ in coordinates:
+                add(coordinates_)
+
+    add(geometry.get('coordinates', []))
+
+    if not xs:
+        return None
+
+    return [min(xs), min(ys), max(xs), max(ys)]
+
+
+def _encode_record(task: tuple) -> dict:
+    """
+    Generate and encode a single record of a collection, in a worker
+    process
+
+    :param task: `tuple` of output schema object and MCF
+
+    :returns: `dict` of compact JSON record (`record`), record bounding
+              box (`bbox`) and time interval (`interval`), and error (if
+              any)
+    """
+
+    schema_object, mcf = task
+
+    result = {
+        'record': None,
+        'bbox': None,
+        'interval': None,
+        'error': None
+    }
+
+    try:
+        if not isinstance(mcf, dict):
+            mcf = read_mcf(mcf)
+
+        record = schema_object.write(mcf, stringify=False)
+
+        result['record'] = json_encode(record, compact=True)
+        result['bbox'] = _get_bbox(record.get('geometry'))
+
+        interval = (record.get('time') or {}).get('interval')
+        if interval is not None:
+            result['interval'] = [str(value) if value else '..'
+                                  for value in interval]
+    except Exception as err:
+        result['error'] = f'{type(err).__name__}: {err}'
+
+    return result
@@ -45,12 +45,15 @@
 #
 # =================================================================
 
+import hashlib
 import json
 import logging
 import os
+import re
 import uuid
-from typing import Union
+from typing import IO, Iterator, Union
 
+from pygeometa.helpers import json_iter
 from pygeometa.schemas.base import BaseOutputSchema
 
 THISDIR = os.path.dirname(os.path.realpath(__file__))
@@ -81,16 +84,6 @@ class OpenAireOutputSchema(BaseOutputSchema):
         :returns: `dict` of MCF content
         """
 
-        # Initialized mcf
-        mcf = {
-            'mcf': {
-                'version': '1.0',
-            },
-            'metadata': {},
-            'identification': {},
-            'contact': {}
-        }
-
         md = json.loads(metadata)
 
         if md is None:
@@ -102,127 +95,33 @@ class OpenAireOutputSchema(BaseOutputSchema):
             if md is None:
                 raise ValueError('No openaire metadata in results')
 
-        metadata_ = md
+        return openaire_to_mcf(md)
+
+    def import_iter(self, fh: IO) -> Iterator[dict]:
+        """
+        Import one or more metadata records into MCF
 
-        # mcf: metadata
-        pids_ = metadata_.get('pids', [])
-        originIds_ = metadata_.get('originalIds', [])
-        id_ = metadata_.get('id')
+        Records of a `results` array (e.g. OpenAIRE Graph API responses
+        or dumps) are parsed incrementally so that memory use stays
+        bounded to a single record.
 
-        children_instances_ = metadata_.get('instances')
-        main_id_, altIds_, main_instance_ = process_id_and_instance(
-            pids_, originIds_, id_, children_instances_)
+        Keyword groups are keyed as in `import_`, independent of the
+        order of records.
 
-        if main_id_:
-            mcf['metadata']['identifier'] = main_id_
-        else:
-            raise ValueError('No identification on record')
-
-        if altIds_:
-            mcf['metadata']['additional_identifiers'] = altIds_
-
-        project_ = metadata_.get('projects')
-        if project_ is not None and isinstance(project_, list):
-            rel_project = []
-            for p in project_:
-                pids = p.get('pids', [])
-                if pids is None or len(pids) == 0:
-                    continue
-                pid = pids[0]
-                pro_dict = {
-                    'identifier': pid.get('value'),
-                    'scheme': pid.get('scheme'),
-                    'type': 'project'
-                }
-                rel_project.append(pro_dict)
-            if len(rel_project) > 0:
-                mcf['metadata']['relations'] = rel_project
-
-        if main_instance_:
-            instance_type_ = main_instance_.get('type')
-            if instance_type_:
-                mcf['metadata']['hierarchylevel'] = instance_type_
-
-        date_of_collection = metadata_.get('dateOfCollection')
-        if date_of_collection is not None:
-            mcf['metadata']['datestamp'] = metadata_.get('dateOfCollection')
-
-        if main_instance_ is not None:
-            urls = main_instance_.get('urls')
-            if urls:
-                mcf['metadata']['dataseturi'] = next(iter(urls), '')
-
-        # mcf: identification
-        language_ = metadata_.get('language', {}).get('code')
-        if language_ is not None:
-            mcf['identification']['language'] = language_
-
-        main_title = metadata_.get('mainTitle')
-        # subtitle also exists
-        if main_title is not None:
-            mcf['identification']['title'] = main_title
-
-        description_ = metadata_.get('descriptions')
-        if description_ is not None:
-            mcf['identification']['abstract'] = next(iter(description_), '')
-
-        version_ = metadata_.get('version')
-        if version_ is not None:
-            mcf['identification']['edition'] = version_
-
-        # topiccategory
-        right_ = metadata_.get('bestAccessRight', {}).get('label')
-        instance_right_ = None
-        if main_instance_:
-            instance_right_ = main_instance_.get(
-                'accessRight', {}).get('label')
-        if right_ is not None and right_ != 'unspecified':
-            mcf['identification']['rights'] = right_
-        elif instance_right_ is not None and instance_right_ != 'unspecified':
-            mcf['identification']['rights'] = instance_right_
-
-        if main_instance_ is not None:
-            license_ = main_instance_.get('license')
-            if license_:
-                mcf['identification']['license'] = {
-                    'name': license_,
-                    'url': ''
-                }
-
-        # url
-        dates_dict = {}
-        p_date = metadata_.get('publicationDate')
-        e_date = metadata_.get('embargoEndDate')
-        if p_date:
-            dates_dict['publication'] = p_date
-            mcf['identification']['datestamp'] = [p_date]
-        if e_date:
-            dates_dict['embargoend'] = e_date
-        if dates_dict:
-            mcf['identification']['dates'] = dates_dict
-
-        subjects_ = metadata_.get('subjects')
-        if isinstance(subjects_, dict):
-            mcf['identification']['keywords'] = process_keywords([subjects_])
-        elif isinstance(subjects_, list):
-            mcf['identification']['keywords'] = process_keywords(subjects_)
-
-        # contact point
-        authors_ = metadata_.get('authors', [])
-        orgs_ = metadata_.get('organizations', [])
-        authors_ = authors_ or []
-        orgs_ = orgs_ or []
-        contact_ = authors_ + orgs_
-        if len(contact_) > 0:
-            mcf['contact'] = process_contact(contact_)
-
-        # distribution
-        if isinstance(children_instances_, list) and children_instances_:
-            dist_ = process_dist(children_instances_)
-            if dist_ is not None:
-                mcf['distribution'] = dist_
-
-        return mcf
+        :param fh: file-like object of metadata content
+
+        :returns: iterator of `dict` of MCF content
+        """
+
+        for count, md in enumerate(json_iter(fh, 'results')):
+            LOGGER.debug(f'Parsing OpenAIRE record {count}')
+            try:
+                mcf = openaire_to_mcf(md)
+            except Exception as err:
+                LOGGER.warning(f'Skipping record {count}: {err}')
+                continue
+
+            yield mcf
 
     def write(self, mcf: dict, stringify: str = True) -> Union[dict, str]:
         """
@@ -239,6 +138,151 @@ class OpenAireOutputSchema(BaseOutputSchema):
         return ''
 
 
+def openaire_to_mcf(metadata_: dict) -> dict:
+    """
+    Generates an MCF from an OpenAIRE research product
+
+    Keyword, contact and distribution keys are derived from content,
+    so that importing an unchanged record yields an identical MCF.
+
+    :param metadata_: `dict` of OpenAIRE research product
+
+    :returns: `dict` of MCF content
+    """
+
+    # Initialized mcf
+    mcf = {
+        'mcf': {
+            'version': '1.0',
+        },
+        'metadata': {},
+        'identification': {},
+        'contact': {}
+    }
+
+    # mcf: metadata
+    pids_ = metadata_.get('pids', [])
+    originIds_ = metadata_.get('originalIds', [])
+    id_ = metadata_.get('id')
+
+    children_instances_ = metadata_.get('instances')
+    main_id_, altIds_, main_instance_ = process_id_and_instance(
+        pids_, originIds_, id_, children_instances_)
+
+    if main_id_:
+        mcf['metadata']['identifier'] = main_id_
+    else:
+        raise ValueError('No identification on record')
+
+    if altIds_:
+        mcf['metadata']['additional_identifiers'] = altIds_
+
+    project_ = metadata_.get('projects')
+    if project_ is not None and isinstance(project_, list):
+        rel_project = []
+        for p in project_:
+            pids = p.get('pids', [])
+            if pids is None or len(pids) == 0:
+                continue
+            pid = pids[0]
+            pro_dict = {
+                'identifier': pid.get('value'),
+                'scheme': pid.get('scheme'),
+                'type': 'project'
+            }
+            rel_project.append(pro_dict)
+        if len(rel_project) > 0:
+            mcf['metadata']['relations'] = rel_project
+
+    if main_instance_:
+        instance_type_ = main_instance_.get('type')
+        if instance_type_:
+            mcf['metadata']['hierarchylevel'] = instance_type_
+
+    date_of_collection = metadata_.get('dateOfCollection')
+    if date_of_collection is not None:
+        mcf['metadata']['datestamp'] = metadata_.get('dateOfCollection')
+
+    if main_instance_ is not None:
+        urls = main_instance_.get('urls')
+        if urls:
+            mcf['metadata']['dataseturi'] = next(iter(urls), '')
+
+    # mcf: identification
+    language_ = metadata_.get('language', {}).get('code')
+    if language_ is not None:
+        mcf['identification']['language'] = language_
+
+    main_title = metadata_.get('mainTitle')
+    # subtitle also exists
+    if main_title is not None:
+        mcf['identification']['title'] = main_title
+
+    description_ = metadata_.get('descriptions')
+    if description_ is not None:
+        mcf['identification']['abstract'] = next(iter(description_), '')
+
+    version_ = metadata_.get('version')
+    if version_ is not None:
+        mcf['identification']['edition'] = version_
+
+    # topiccategory
+    right_ = metadata_.get('bestAccessRight', {}).get('label')
+    instance_right_ = None
+    if main_instance_:
+        instance_right_ = main_instance_.get(
+            'accessRight', {}).get('label')
+    if right_ is not None and right_ != 'unspecified':
+        mcf['identification']['rights'] = right_
+    elif instance_right_ is not None and instance_right_ != 'unspecified':
+        mcf['identification']['rights'] = instance_right_
+
+    if main_instance_ is not None:
+        license_ = main_instance_.get('license')
+        if license_:
+            mcf['identification']['license'] = {
+                'name': license_,
+                'url': ''
+            }
+
+    # url
+    dates_dict = {}
+    p_date = metadata_.get('publicationDate')
+    e_date = metadata_.get('embargoEndDate')
+    if p_date:
+        dates_dict['publication'] = p_date
+        mcf['identification']['datestamp'] = [p_date]
+    if e_date:
+        dates_dict['embargoend'] = e_date
+    if dates_dict:
+        mcf['identification']['dates'] = dates_dict
+
+    subjects_ = metadata_.get('subjects')
+    if isinstance(subjects_, dict):
+        mcf['identification']['keywords'] = process_keywords(
+            [subjects_], deterministic=True)
+    elif isinstance(subjects_, list):
+        mcf['identification']['keywords'] = process_keywords(
+            subjects_, deterministic=True)
+
+    # contact point
+    authors_ = metadata_.get('authors', [])
+    orgs_ = metadata_.get('organizations', [])
+    authors_ = authors_ or []
+    orgs_ = orgs_ or []
+    contact_ = authors_ + orgs_
+    if len(contact_) > 0:
+        mcf['contact'] = process_contact(contact_, deterministic=True)
+
+    # distribution
+    if isinstance(children_instances_, list) and children_instances_:
+        dist_ = process_dist(children_instances_, deterministic=True)
+        if dist_ is not None:
+            mcf['distribution'] = dist_
+
+    return mcf
+
+
 def process_id_and_instance(
         pids: list, originIds: list,
         id: str, instances: list) -> tuple[str, list, dict]:
@@ -337,20 +381,71 @@ def process_id_and_instance(
     return main_id, pids_schemevalue, main_instance
 
 
-def process_keywords(subjects: list) -> dict:
+def stable_key(value: Union[dict, str]) -> str:
+    """
+    Derive a stable key from content
+
+    :param value: `dict` or `str` of content
+
+    :returns: `str` of hexadecimal digest
+    """
+
+    if not isinstance(value, str):
+        value = json.dumps(value, sort_keys=True, ensure_ascii=False)
+
+    return hashlib.sha1(value.encode('utf-8')).hexdigest()[:12]
+
+
+def get_scheme_key(scheme: str) -> str:
+    """
+    Get keyword group key of a subject scheme
+
+    Keys are derived from the scheme name alone, so that they do not
+    depend on the order schemes are seen in.  Scheme names that are not
+    already a clean slug (e.g. `FOS`, `ddc 23`) get a short stable hash
+    suffix, so that distinct names never share a key.
+
+    :param scheme: subject scheme name
+
+    :returns: `str` keyword group key
+    """
+
+    if scheme is None:
+        key = 'default'
+    else:
+        scheme = str(scheme)
+        key = re.sub(r'[^a-z0-9]+', '-', scheme.lower()).strip('-')
+        if not key:
+            key = stable_key(scheme)
+        elif key != scheme or key == 'default':
+            key = f'{key}-{stable_key(scheme)[:8]}'
+
+    return key
+
+
+def process_keywords(subjects: list, deterministic: bool = False) -> dict:
     """
     convert openaire keywords to mcf keywords
 
     group keywords by scheme
 
     :param subjects: list
+    :param deterministic: whether to key keyword groups by their scheme
+                          name (see `get_scheme_key`) instead of a random
+                          UUID
 
     :returns: `dict` grouped keywords
     """
-    unique_scheme = list(set([s.get('subject', {}).get('scheme')
-                              for s in subjects]))
 
-    scheme_uuid_dict = {scheme: str(uuid.uuid4()) for scheme in unique_scheme}
+    unique_scheme = dict.fromkeys([s.get('subject', {}).get('scheme')
+                                   for s in subjects])
+
+    if deterministic:
+        scheme_key_dict = {scheme: get_scheme_key(scheme)
+                           for scheme in unique_scheme}
+    else:
+        scheme_key_dict = {scheme: str(uuid.uuid4())
+                           for scheme in unique_scheme}
 
     keywords_dict = {
         value: {
@@ -359,7 +454,7 @@ def process_keywords(subjects: list) -> dict:
                 'name': key
             }
         }
-        for key, value in scheme_uuid_dict.items()
+        for key, value in scheme_key_dict.items()
     }
 
     for s in subjects:
@@ -371,19 +466,20 @@ def process_keywords(subjects: list) -> dict:
     return keywords_dict
 
 
-def process_contact(contact_list: list) -> dict:
+def process_contact(contact_list: list, deterministic: bool = False) -> dict:
     """
     Process authors and organizations into MCF contact format
 
-    :param authors: list of author objects
-    :param orgs: list of organization objects
+    :param contact_list: list of author and organization objects
+    :param deterministic: whether to key contacts by a stable hash of
+                          their content (identical contacts are merged)
+                          instead of a random UUID
 
     :returns: dict with UUID keys and contact point values
     """
     contact_dict = {}
 
     for contact in contact_list:
-        contact_uuid = str(uuid.uuid4())
         # Initialize contact point structure
         contactpoint_dict = {
             'individualname': '',
@@ -416,7 +512,11 @@ def process_contact(contact_list: list) -> dict:
         # Add to contactpoint dict
         if (contactpoint_dict['individualname'] or
                 contactpoint_dict['organization']):
-            contact_dict[contact_uuid] = contactpoint_dict
+            if deterministic:
+                contact_key = stable_key(contactpoint_dict)
+            else:
+                contact_key = str(uuid.uuid4())
+            contact_dict[contact_key] = contactpoint_dict
 
     return contact_dict
 
@@ -444,11 +544,14 @@ def id2url(scheme: str, id_: str) -> str:
     return None
 
 
-def process_dist(instances_: list) -> dict | None:
+def process_dist(instances_: list,
+                 deterministic: bool = False) -> dict | None:
     """
     Extract instances with PDF URLs
 
     :param instances_: list of instance dictionaries
+    :param deterministic: whether to key instances by a stable hash of
+                          their URL instead of a random UUID
 
     :returns: `dict` with UUID keys and instance info, or None if no PDFs found
     """
@@ -473,8 +576,11 @@ def process_dist(instances_: list) -> dict | None:
         # If we found a PDF URL and haven't seen it before, add to result
         if pdf_url and pdf_url not in seen_urls:
             seen_urls.add(pdf_url)
-            instance_uuid = str(uuid.uuid4())
-            result_dict[instance_uuid] = {
+            if deterministic:
+                instance_key = stable_key(pdf_url)
+            else:
+                instance_key = str(uuid.uuid4())
+            result_dict[instance_key] = {
                 'type': type_,
                 'url': pdf_url
             }
@@ -43,19 +43,27 @@
 #
 # =================================================================
 
+from array import array
 import json
 import logging
 import os
 from typing import Union
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from pygeometa.core import get_charstring
-from pygeometa.helpers import generate_datetime, json_dumps
+from pygeometa.helpers import generate_datetime, group_contacts, json_dumps
 from pygeometa.schemas.base import BaseOutputSchema
 
 THISDIR = os.path.dirname(os.path.realpath(__file__))
 
 LOGGER = logging.getLogger(__name__)
 
+GEOSHAPE_COORDS = ['box', 'line', 'polygon']
+
 CONTACTS = [
     'accountablePerson',
     'author',
@@ -145,6 +153,11 @@ class SchemaOrgOutputSchema(BaseOutputSchema):
                 })
             elif isinstance(sc, dict) and 'geo' in sc:
                 geo = _get_list_or_dict(sc['geo'])
+                if isinstance(sc['geo'], list):
+                    shapes = [geo_ for geo_ in sc['geo']
+                              if geo_.get('@type') == 'GeoShape']
+                else:
+                    shapes = geo
 
                 if geo['@type'] == 'GeoCoordinates':
                     mcf['spatial']['datatype'] = 'vector'
@@ -154,7 +167,7 @@ class SchemaOrgOutputSchema(BaseOutputSchema):
                 elif geo['@type'] == 'GeoShape':
                     mcf['spatial']['datatype'] = 'vector'
                     mcf['spatial']['geomtype'] = 'polygon'
-                    bbox = _get_box_from_coords(geo)
+                    bbox = _get_box_from_coords(shapes)
                 else:
                     bbox = [-180, -90, 180, 90]
 
@@ -348,8 +361,11 @@ class SchemaOrgOutputSchema(BaseOutputSchema):
 
         LOGGER.debug('Checking for contacts')
 
+        contact_groups = group_contacts(mcf['contact'])
+
         for ct in CONTACTS:
-            contacts = self.generate_contacts(mcf['contact'], ct)
+            contacts = self.generate_contacts(mcf['contact'], ct,
+                                              contact_groups)
             if contacts and len(contacts) > 0:
                 record[ct] = contacts
 
@@ -517,13 +533,17 @@ class SchemaOrgOutputSchema(BaseOutputSchema):
 
         return dict2
 
-    def generate_contacts(self, contact: dict, role: str) -> list:
+    def generate_contacts(self, contact: dict, role: str,
+                          groups: list = None) -> list:
         """
         Generates 1..n contacts, streamlining identical
         contacts with multiple roles
 
         :param contact: `dict` of contacts
         :param role: `str` of role
+        :param groups: `list` of contacts grouped by
+                       `pygeometa.helpers.group_contacts` (default is to
+                       group `contact`)
 
         :returns: `list` of contacts
         """
@@ -545,11 +565,17 @@ class SchemaOrgOutputSchema(BaseOutputSchema):
             'sponsor': []
         }
 
-        for key, value in contact.items():
-            if any([value.get('role', key) == role,
-                    value.get('role', key) in role_mcf_schema_map[role]]):
-                contacts.append(
-                    self.generate_party(value, self.lang1, self.lang2))
+        if groups is None:
+            groups = group_contacts(contact)
+
+        for group in groups:
+            value = group['contact']
+            for key in group['roles']:
+                if any([value.get('role', key) == role,
+                        value.get('role', key) in role_mcf_schema_map[role]]):
+                    contacts.append(
+                        self.generate_party(value, self.lang1, self.lang2))
+                    break
 
         return contacts
 
@@ -587,35 +613,55 @@ class SchemaOrgOutputSchema(BaseOutputSchema):
         return link
 
 
-def _get_box_from_coords(geo: dict) -> list:
+def _get_box_from_coords(geo: Union[dict, list]) -> list:
     """
-    Helper function to retrieve box from GeoCoordinates
+    Helper function to retrieve box from GeoShape
+
+    Coordinates of `box`, `line` and `polygon` (strings, or lists of
+    strings) are "lat lon" pairs, separated by spaces or commas.  The box
+    envelops all coordinates, of all GeoShapes of a list.
 
-    :param geo: a schema-org geometry object
+    :param geo: a schema-org geometry object, or `list` of objects
 
     :returns: `list` bbox or None
     """
-    if 'box' in geo:
-        bt = geo['box'].split()
-        if bt and len(bt) == 4:
-            return [float(bt[1]), float(bt[0]), float(bt[3]), float(bt[2])]
-    elif 'polygon' in geo:
-        # polygon string is space or comma separated
-        if ',' in geo['polygon']:
-            coords = geo['polygon'].split(",")
-            latlon_points = [
-                tuple(map(float, p.strip().split()))
-                for p in coords
-            ]
+
+    if isinstance(geo, dict):
+        geo = [geo]
+
+    tokens = []
+
+    for geo_ in geo:
+        for key in GEOSHAPE_COORDS:
+            values = geo_.get(key)
+            if values is None:
+                continue
+            if isinstance(values, str):
+                values = [values]
+
+            for value in values:
+                # coordinate string is space or comma separated
+                value_tokens = value.replace(',', ' ').split()
+                if len(value_tokens) % 2 != 0:
+                    LOGGER.warning(f'Invalid {key} coordinates: {value}')
+                    return None
+                tokens.extend(value_tokens)
+
+    if not tokens:
+        return None
+
+    try:
+        if numpy is not None:
+            coords = numpy.array(tokens, dtype=float)
+            lats, lons = coords[0::2], coords[1::2]
+            bbox = [lons.min(), lats.min(), lons.max(), lats.max()]
+            return [float(value) for value in bbox]
         else:
-            coords = list(map(float, geo['polygon'].split()))
-            latlon_points = list(zip(coords[0::2], coords[1::2]))
-        # flip (lat, lon) → (lon, lat) for bbox calculation
-        lonlat_points = [(lon, lat) for lat, lon in latlon_points]
-        lats = [lat for lat, lon in lonlat_points]
-        lons = [lon for lat, lon in lonlat_points]
-        return [min(lats), min(lons), max(lats), max(lons)]
-    else:
+            coords = array('d', map(float, tokens))
+            lats, lons = coords[0::2], coords[1::2]
+            return [min(lons), min(lats), max(lons), max(lats)]
+    except ValueError as err:
+        LOGGER.warning(f'Invalid coordinates: {err}')
         return None
 
 
@@ -43,15 +43,29 @@
 #
 # =================================================================
 
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import logging
 import os
-from typing import Union
+import re
+import shutil
+import tempfile
+from typing import Iterable, Union
 
-from pygeometa.core import get_charstring
-from pygeometa.helpers import json_dumps
+from pygeometa.core import get_charstring, read_mcf
+from pygeometa.helpers import (bounded_imap, generate_datetime, json_dump,
+                               json_dumps, json_encode)
 from pygeometa.schemas.base import BaseOutputSchema
+from pygeometa.schemas.ogcapi_records import CollectionExtent
 
 THISDIR = os.path.dirname(os.path.realpath(__file__))
 
+LOGGER = logging.getLogger(__name__)
+
+STAC_VERSION = '1.0.0'
+
+OPEN_DATES = [None, '', '..', 'now', 'None']
+
 
 class STACItemOutputSchema(BaseOutputSchema):
     """STAC Item output schema"""
@@ -90,7 +104,7 @@ class STACItemOutputSchema(BaseOutputSchema):
                                      lang1, lang2)
 
         stac_item = {
-            'stac-version': '1.0.0-beta.2',
+            'stac_version': STAC_VERSION,
             'id': mcf['metadata']['identifier'],
             'type': 'Feature',
             'bbox': [minx, miny, maxx, maxy],
@@ -105,6 +119,7 @@ class STACItemOutputSchema(BaseOutputSchema):
                 ]]
             },
             'properties': {
+                'datetime': None,
                 'title': title[0],
                 'description': description[0],
                 'providers': []
@@ -118,6 +133,9 @@ class STACItemOutputSchema(BaseOutputSchema):
 
             stac_item['properties']['start_datetime'] = begin
             stac_item['properties']['end_datetime'] = end
+        else:
+            # an Item without an interval requires a datetime
+            stac_item['properties']['datetime'] = get_item_datetime(mcf)
 
         if 'creation' in mcf['identification']['dates']:
             stac_item['properties']['created'] = mcf['identification']['dates']['creation']  # noqa
@@ -141,3 +159,292 @@ class STACItemOutputSchema(BaseOutputSchema):
             return json_dumps(stac_item)
 
         return stac_item
+
+    def write_catalog(self, mcfs: Iterable, directory: str,
+                      collection_id: str = 'collection',
+                      title: str = None, description: str = None,
+                      jobs: int = 1) -> dict:
+        """
+        Write many MCFs as a static STAC catalog
+
+        The catalog is laid out as::
+
+            directory/catalog.json
+            directory/<collection_id>/collection.json
+            directory/<collection_id>/<item id>/<item id>.json
+
+        with relative links between catalog, collection and items.  Items
+        are written to disk as they are generated (by `jobs` worker
+        processes, in input order), and the collection extent is aggregated
+        incrementally, so that Items are never all held in memory.  Records
+        failing to generate, or repeating an Item identifier, are logged
+        and skipped.  Identifiers mapping to the path of an earlier Item
+        (e.g. `a/b` and `a_b`) get a hash suffix.
+
+        :param mcfs: iterable of MCFs (`dict`, or filepath or string of
+                     MCF data)
+        :param directory: directory to write the catalog to
+        :param collection_id: identifier of the collection
+        :param title: title of the catalog and collection
+        :param description: description of the catalog and collection
+        :param jobs: number of worker processes
+
+        :returns: `dict` of number of items written (`numberReturned`),
+                  number of records failed (`numberFailed`) and collection
+                  extent (`extent`)
+        """
+
+        collection_dir = os.path.join(directory, get_path_id(collection_id))
+        os.makedirs(collection_dir, exist_ok=True)
+
+        extent = CollectionExtent()
+        returned = 0
+        failed = 0
+
+        tasks = ((self, mcf, collection_id) for mcf in mcfs)
+
+        def run() -> Iterable[dict]:
+            if jobs == 1:
+                yield from map(_encode_item, tasks)
+                return
+
+            from pygeometa.batch import get_process_options, init_process
+
+            LOGGER.debug(f'Writing catalog with {jobs} workers')
+            with ProcessPoolExecutor(max_workers=jobs,
+                                     initializer=init_process,
+                                     initargs=(get_process_options(),)
+                                     ) as executor:
+                yield from bounded_imap(executor, _encode_item, tasks)
+
+        # item paths in use, to disambiguate identifiers sharing a path
+        path_ids = {}
+
+        # item links are spooled to disk, and appended to the collection
+        # once its extent is known
+        with tempfile.TemporaryFile() as links:
+            for result in run():
+                if result['error'] is not None:
+                    LOGGER.warning(f"Skipping record: {result['error']}")
+                    failed += 1
+                    continue
+
+                identifier = result['id']
+                path_id = get_path_id(identifier)
+                if path_ids.get(path_id, identifier) != identifier:
+                    digest = hashlib.sha1(identifier.encode('utf-8'))
+                    path_id = f'{path_id}-{digest.hexdigest()[:8]}'
+                    LOGGER.debug(f'Writing Item {identifier} to {path_id}')
+                if path_id in path_ids:
+                    LOGGER.warning('Skipping record: duplicate Item '
+                                   f'identifier {identifier}')
+                    failed += 1
+                    continue
+                path_ids[path_id] = identifier
+
+                os.makedirs(os.path.join(collection_dir, path_id),
+                            exist_ok=True)
+                with open(os.path.join(collection_dir, path_id,
+                                       f'{path_id}.json'), 'wb') as fh:
+                    fh.write(result['item'])
+
+                link = {
+                    'rel': 'item',
+                    'href': f'./{path_id}/{path_id}.json',
+                    'type': 'application/geo+json'
+                }
+                links.write(b',\n' + json_encode(link, compact=True))
+
+                extent.update(result['bbox'], result['interval'])
+                returned += 1
+
+            collection = {
+                'type': 'Collection',
+                'stac_version': STAC_VERSION,
+                'id': collection_id,
+                'title': title or collection_id,
+                'description': description or title or collection_id,
+                'license': 'other',
+                'extent': {
+                    'spatial': {
+                        'bbox': [extent.bbox or [-180, -90, 180, 90]]
+                    },
+                    'temporal': {
+                        'interval': [[
+                            None if value == '..' else value
+                            for value in extent.interval or ['..', '..']
+                        ]]
+                    }
+                }
+            }
+            collection_links = [{
+                'rel': 'root',
+                'href': '../catalog.json',
+                'type': 'application/json'
+            }, {
+                'rel': 'parent',
+                'href': '../catalog.json',
+                'type': 'application/json'
+            }]
+
+            collection_file = os.path.join(collection_dir, 'collection.json')
+            LOGGER.debug(f'Writing collection to {collection_file}')
+            with open(collection_file, 'wb') as fh:
+                fh.write(b'{')
+                for key, value in collection.items():
+                    fh.write(json_encode(key) + b':' +
+                             json_encode(value, compact=True) + b',')
+                fh.write(b'"links":[')
+                fh.write(b','.join(json_encode(link, compact=True)
+                                   for link in collection_links))
+                links.seek(0)
+                shutil.copyfileobj(links, fh)
+                fh.write(b']}')
+
+        catalog = {
+            'type': 'Catalog',
+            'stac_version': STAC_VERSION,
+            'id': f'{collection_id}-catalog',
+            'description': description or title or collection_id,
+            'links': [{
+                'rel': 'root',
+                'href': './catalog.json',
+                'type': 'application/json'
+            }, {
+                'rel': 'child',
+                'href': f'./{get_path_id(collection_id)}/collection.json',
+                'type': 'application/json'
+            }]
+        }
+        if title is not None:
+            catalog['title'] = title
+
+        with open(os.path.join(directory, 'catalog.json'), 'wb') as fh:
+            json_dump(catalog, fh)
+
+        return {
+            'numberReturned': returned,
+            'numberFailed': failed,
+            'extent': extent.to_dict()
+        }
+
+
+def get_path_id(identifier: str) -> str:
+    """
+    Helper function to derive a filesystem safe name from an identifier
+
+    :param identifier: `str` of identifier
+
+    :returns: `str` of identifier, with characters other than letters,
+              digits, `.`, `-` and `_` replaced by `_`
+    """
+
+    return re.sub(r'[^\w.-]', '_', identifier).lstrip('.') or '_'
+
+
+def _get_datetime(value) -> str:
+    """
+    Helper function to derive an RFC3339 date-time from an MCF date,
+    with `..` for open dates
+
+    :param value: MCF date value
+
+    :returns: `str` of date-time value
+    """
+
+    if value in OPEN_DATES:
+        return '..'
+
+    try:
+        return generate_datetime(value)
+    except Exception:
+        return str(value)
+
+
+def get_item_datetime(mcf: dict) -> str:
+    """
+    Helper function to derive the RFC3339 datetime of a STAC Item
+    without a temporal extent, from the resource creation, publication
+    or revision date, or else from the metadata datestamp
+
+    :param mcf: dict of MCF content model
+
+    :returns: `str` of date-time value
+    """
+
+    dates = mcf['identification'].get('dates') or {}
+
+    for date_type in ['creation', 'publication', 'revision']:
+        if dates.get(date_type) not in OPEN_DATES:
+            return generate_datetime(dates[date_type])
+
+    datestamp = mcf['metadata'].get('datestamp')
+    if datestamp in OPEN_DATES:
+        msg = 'No datetime, temporal extent or datestamp for STAC Item'
+        LOGGER.error(msg)
+        raise RuntimeError(msg)
+
+    return generate_datetime(datestamp)
+
+
+def _encode_item(task: tuple) -> dict:
+    """
+    Generate and encode a single STAC Item of a catalog, in a worker
+    process
+
+    :param task: `tuple` of output schema object, MCF and collection
+                 identifier
+
+    :returns: `dict` of Item identifier (`id`), encoded Item (`item`),
+              Item bounding box (`bbox`) and time interval (`interval`),
+              and error (if any)
+    """
+
+    schema_object, mcf, collection_id = task
+
+    result = {
+        'id': None,
+        'item': None,
+        'bbox': None,
+        'interval': None,
+        'error': None
+    }
+
+    try:
+        if not isinstance(mcf, dict):
+            mcf = read_mcf(mcf)
+
+        item = schema_object.write(mcf, stringify=False)
+
+        item['collection'] = collection_id
+        item['links'].extend([{
+            'rel': 'root',
+            'href': '../../catalog.json',
+            'type': 'application/json'
+        }, {
+            'rel': 'collection',
+            'href': '../collection.json',
+            'type': 'application/json'
+        }, {
+            'rel': 'parent',
+            'href': '../collection.json',
+            'type': 'application/json'
+        }])
+
+        properties = item['properties']
+        if 'start_datetime' in properties:
+            interval = [properties['start_datetime'],
+                        properties['end_datetime']]
+        else:
+            interval = [properties['datetime']] * 2
+
+        result['id'] = str(item['id'])
+        result['item'] = json_encode(item)
+        result['bbox'] = item['bbox']
+        interval = [_get_datetime(value) for value in interval]
+        if interval != ['..', '..']:
+            result['interval'] = interval
+    except Exception as err:
+        result['error'] = f'{type(err).__name__}: {err}'
+
+    return result
@@ -43,12 +43,11 @@
 #
 # =================================================================
 
-from datetime import datetime
 import logging
 import os
 from typing import Union
 
-from pygeometa.helpers import json_dumps
+from pygeometa.helpers import get_now, json_dumps
 from pygeometa.schemas.ogcapi_records import OGCAPIRecordOutputSchema
 
 THISDIR = os.path.dirname(os.path.realpath(__file__))
@@ -106,7 +105,7 @@ class WMOWCMP2OutputSchema(OGCAPIRecordOutputSchema):
                 LOGGER.warning('Missing wmo:dataPolicy')
 
         if record['properties'].get('created') is None:
-            record['properties']['created'] = datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ')  # noqa
+            record['properties']['created'] = get_now().strftime('%Y-%m-%dT%H:%M:%SZ')  # noqa
 
         if stringify:
             return json_dumps(record)
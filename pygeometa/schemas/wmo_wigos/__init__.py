@@ -43,12 +43,40 @@
 #
 # =================================================================
 
+import copy
+import logging
 import os
+from typing import IO
 
+from lxml import etree
+
+from pygeometa import __version__
+from pygeometa.core import get_template_environment
 from pygeometa.schemas.base import BaseOutputSchema
 
 THISDIR = os.path.dirname(os.path.realpath(__file__))
 
+LOGGER = logging.getLogger(__name__)
+
+NAMESPACES = {
+    'gco': 'http://www.isotc211.org/2005/gco',
+    'gmd': 'http://www.isotc211.org/2005/gmd',
+    'gml': 'http://www.opengis.net/gml/3.2',
+    'om': 'http://www.opengis.net/om/2.0',
+    'wmdr': 'http://def.wmo.int/wmdr/2017',
+    'xlink': 'http://www.w3.org/1999/xlink',
+    'xsi': 'http://www.w3.org/2001/XMLSchema-instance'
+}
+
+SCHEMA_LOCATION = ('http://def.wmo.int/wmdr/2017 '
+                   'http://schemas.wmo.int/wmdr/1.0RC9/wmdr.xsd')
+
+# wrapper declaring all namespaces of rendered record parts
+FRAGMENT_START = '<fragment {}>'.format(' '.join(
+    f'xmlns:{prefix}="{uri}"' for prefix, uri in NAMESPACES.items()))
+
+PARSER = etree.XMLParser(remove_blank_text=True)
+
 
 class WMOWIGOSOutputSchema(BaseOutputSchema):
     """WMO WIGOS output schema"""
@@ -63,3 +91,108 @@ class WMOWIGOSOutputSchema(BaseOutputSchema):
         description = 'WMO WIGOS Metadata Standard'
 
         super().__init__('wmo-wigos', description, 'xml', THISDIR)
+
+    def write_stream(self, mcf: dict, fh: IO) -> None:
+        """
+        Write MCF to WMO WIGOS XML, streamed to a binary file handle
+
+        The record is written incrementally with `lxml.etree.xmlfile`,
+        one facility and observation subtree at a time, rendered from the
+        same templates as `write`, so that memory use is proportional to a
+        single facility.  The output is equivalent to that of `write`,
+        though not pretty-printed.
+
+        :param mcf: dict of MCF content model
+        :param fh: binary file-like object
+
+        :returns: `None`
+        """
+
+        def wmdr(name: str) -> str:
+            return f"{{{NAMESPACES['wmdr']}}}{name}"
+
+        gml_id = f"{{{NAMESPACES['gml']}}}id"
+
+        root_attrib = {
+            gml_id: f"id_{mcf['metadata']['identifier']}",
+            f"{{{NAMESPACES['xsi']}}}schemaLocation": SCHEMA_LOCATION
+        }
+
+        comment = (f' This metadata record was generated by pygeometa-'
+                   f'{__version__} (https://github.com/geopython/pygeometa) ')
+
+        with etree.xmlfile(fh, encoding='UTF-8') as xf:
+            xf.write_declaration(standalone=False)
+            xf.write(etree.Comment(comment))
+
+            with xf.element(wmdr('WIGOSMetadataRecord'), root_attrib,
+                            nsmap=NAMESPACES):
+                self._write_fragment(xf, 'header.j2', record=mcf)
+
+                for facility in mcf['facility'].values():
+                    LOGGER.debug(f"Writing facility {facility['identifier']}")  # noqa
+                    with xf.element(wmdr('facility')):
+                        attrib = {gml_id: f"_{facility['identifier']}"}
+                        with xf.element(wmdr('ObservingFacility'), attrib):
+                            self._write_fragment(xf, 'facility.j2',
+                                                 record=mcf, v=facility)
+
+                            observations = facility.get('observations') or []  # noqa
+                            for i, obs in enumerate(observations, 1):
+                                self._write_fragment(
+                                    xf, 'observation.j2', record=mcf,
+                                    v=facility, obs=obs, obs_index=i)
+
+                    xf.flush()
+
+    def _write_fragment(self, xf: etree.xmlfile, template: str,
+                        **kwargs) -> None:
+        """
+        Render a template of a part of a WIGOS record and write it
+
+        :param xf: `lxml.etree.xmlfile` writer
+        :param template: `str` of template name
+        :param kwargs: template variables
+
+        :returns: `None`
+        """
+
+        env = get_template_environment(self.template_dir)
+        content = env.get_template(template).render(
+            pygeometa_version=__version__, **kwargs)
+
+        fragment = f'{FRAGMENT_START}{content}</fragment>'
+
+        for element in etree.fromstring(fragment.encode('utf-8'), PARSER):
+            write_element(xf, element)
+
+
+def write_element(xf: etree.xmlfile, element: etree._Element) -> None:
+    """
+    Write a parsed element through an incremental XML writer
+
+    Elements are written through `xf.element` rather than `xf.write`,
+    which would redeclare all namespaces in scope on every subtree;
+    namespaces declared by the enclosing root are reused.
+
+    :param xf: `lxml.etree.xmlfile` writer
+    :param element: `lxml.etree.Element` object
+
+    :returns: `None`
+    """
+
+    tail = element.tail
+
+    if isinstance(element.tag, str):
+        with xf.element(element.tag, element.attrib):
+            if element.text:
+                xf.write(element.text)
+            for child in element:
+                write_element(xf, child)
+    else:  # comments and processing instructions
+        element = copy.copy(element)
+        element.tail = None
+        xf.write(element)
+
+    if tail:
+        xf.write(tail)
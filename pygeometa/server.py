@@ -0,0 +1,285 @@
+# =================================================================
+#
+# Terms and Conditions of Use
+#
+# Unless otherwise noted, computer program source code of this
+# distribution # is covered under Crown Copyright, Government of
+# Canada, and is distributed under the MIT License.
+#
+# The Canada wordmark and related graphics associated with this
+# distribution are protected under trademark law and copyright law.
+# No permission is granted to use them outside the parameters of
+# the Government of Canada's corporate identity program. For
+# more information, see
+# http://www.tbs-sct.gc.ca/fip-pcim/index-eng.asp
+#
+# Copyright title to all 3rd party software distributed with this
+# software is held by the respective copyright holders as noted in
+# those files. Users are asked to read the 3rd Party Licenses
+# referenced with those assets.
+#
+# Copyright (c) 2026 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+from datetime import datetime
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+import time
+
+from pygeometa.core import (import_metadata, read_mcf, render_j2_template,
+                            validate_mcf, warm_up as core_warm_up)
+from pygeometa.helpers import json_dumps, now_snapshot
+from pygeometa.schemas import get_supported_schemas, load_schema
+
+LOGGER = logging.getLogger(__name__)
+
+# default client timeout (seconds) waiting for a server response
+REQUEST_TIMEOUT = 60
+
+# loaded schema plugins, by name
+_SCHEMAS = {}
+
+
+def get_schema(schema: str):
+    """
+    Get a loaded schema plugin
+
+    :param schema: schema name
+
+    :returns: plugin object
+    """
+
+    if schema not in _SCHEMAS:
+        _SCHEMAS[schema] = load_schema(schema)
+
+    return _SCHEMAS[schema]
+
+
+def warm_up() -> None:
+    """
+    Load all schemas, compile their templates and build the MCF validator
+
+    :returns: `None`
+    """
+
+    core_warm_up()
+
+    for schema in get_supported_schemas():
+        get_schema(schema)
+
+
+def handle_request(request: dict) -> dict:
+    """
+    Process a request
+
+    Requests are objects with an `action` (`generate`, `validate`,
+    `import`, `transform` or `ping`), action parameters, an optional
+    `id`, which is echoed in the response, and an optional `now`
+    (ISO 8601 date-time snapshot of the client, see
+    `pygeometa.helpers.now_snapshot`):
+
+    - generate: `mcf` (filepath, MCF string or object) and `schema` or
+      `schema_local`
+    - validate: `mcf`
+    - import: `metadata` (string) and `schema` (default autodetect)
+    - transform: `metadata`, `input_schema` (default autodetect) and
+      `output_schema`
+
+    :param request: `dict` of request
+
+    :returns: `dict` of response, with `status` (`ok` or `error`) and
+              either `result` or `error`
+    """
+
+    response = {
+        'id': request.get('id'),
+        'status': 'ok'
+    }
+
+    try:
+        action = request['action']
+        LOGGER.debug(f'Processing {action} request')
+
+        now = request.get('now')
+        if now is not None:
+            now = datetime.fromisoformat(now)
+
+        with now_snapshot(now):
+            if action == 'generate':
+                mcf_dict = read_mcf(request['mcf'])
+                if request.get('schema') is not None:
+                    result = get_schema(request['schema']).write(mcf_dict)
+                else:
+                    result = render_j2_template(
+                        mcf_dict, template_dir=request['schema_local'])
+            elif action == 'validate':
+                instance = json.loads(json_dumps(read_mcf(request['mcf'])))
+                result = validate_mcf(instance)
+            elif action == 'import':
+                result = import_metadata(request.get('schema', 'autodetect'),
+                                         request['metadata'])
+                if result is None:
+                    raise ValueError(
+                        'No supported input schema detected/found')
+                result = json.loads(json_dumps(result))
+            elif action == 'transform':
+                result = import_metadata(
+                    request.get('input_schema', 'autodetect'),
+                    request['metadata'])
+                if result is None:
+                    raise ValueError(
+                        'No supported input schema detected/found')
+                result = get_schema(request['output_schema']).write(result)
+            elif action == 'ping':
+                result = 'pong'
+            else:
+                raise ValueError(f'Unknown action {action}')
+
+        response['result'] = result
+    except Exception as err:
+        LOGGER.debug(f'Request failed: {err}')
+        response['status'] = 'error'
+        response['error'] = str(err)
+        response['type'] = type(err).__name__
+
+    return response
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Newline-delimited JSON request handler"""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+
+            start = time.perf_counter()
+
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError('Request must be a JSON object')
+            except ValueError as err:
+                response = {
+                    'id': None,
+                    'status': 'error',
+                    'error': f'Invalid request: {err}',
+                    'type': type(err).__name__
+                }
+            else:
+                response = handle_request(request)
+
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+            elapsed = (time.perf_counter() - start) * 1000
+            LOGGER.debug(f'Request processed in {elapsed:.2f} ms')
+
+
+class Server(socketserver.ThreadingUnixStreamServer):
+    """pygeometa Unix socket server"""
+
+    daemon_threads = True
+
+
+def serve(socket_path: str) -> None:
+    """
+    Serve requests over a Unix socket until interrupted
+
+    :param socket_path: filepath of Unix socket
+
+    :returns: `None`
+    """
+
+    try:
+        mode = os.lstat(socket_path).st_mode
+    except FileNotFoundError:
+        mode = None
+
+    if mode is not None:
+        if not stat.S_ISSOCK(mode):
+            raise RuntimeError(f'{socket_path} exists and is not a socket')
+        if is_running(socket_path):
+            raise RuntimeError(f'Server already running on {socket_path}')
+        LOGGER.debug(f'Removing stale socket {socket_path}')
+        os.remove(socket_path)
+
+    LOGGER.info('Warming up')
+    warm_up()
+
+    with Server(socket_path, RequestHandler) as server:
+        os.chmod(socket_path, 0o600)
+        LOGGER.info(f'Serving on {socket_path}')
+        try:
+            server.serve_forever()
+        finally:
+            os.remove(socket_path)
+
+
+def send_request(socket_path: str, request: dict,
+                 timeout: float = REQUEST_TIMEOUT) -> dict:
+    """
+    Send a request to a running server
+
+    :param socket_path: filepath of Unix socket
+    :param request: `dict` of request (see `handle_request`)
+    :param timeout: socket timeout in seconds (`None` to wait
+                    indefinitely)
+
+    :returns: `dict` of response
+    """
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+
+        with sock.makefile('rb') as fh:
+            line = fh.readline()
+
+    if not line:
+        raise ConnectionError('No response from server')
+
+    return json.loads(line)
+
+
+def is_running(socket_path: str) -> bool:
+    """
+    Check whether a server is running on a Unix socket
+
+    :param socket_path: filepath of Unix socket
+
+    :returns: `bool` of whether a server is running
+    """
+
+    try:
+        return send_request(socket_path, {'action': 'ping'},
+                            timeout=1)['result'] == 'pong'
+    except (OSError, ValueError, KeyError):
+        return False
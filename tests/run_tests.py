@@ -45,26 +45,55 @@
 #
 # =================================================================
 
+import copy
 import datetime
+from decimal import Decimal
+import io
 import json
 import os
+import pathlib
+import shutil
+import sys
+import tarfile
+import tempfile
+import threading
+import types
 import unittest
+from unittest.mock import ANY, patch
+import zipfile
 
 from jsonschema.protocols import Validator
+from lxml import etree
 import yaml
 
+from pygeometa.batch import (ArchiveWriter, expand_inputs, generate_batch,
+                             get_process_options, transform_ndjson)
+from pygeometa.cache import (DiskStorage, get_cache, get_cache_key,
+                             MemoryStorage, ResponseCache)
+from pygeometa import core, helpers, profiling
 from pygeometa.core import (read_mcf, pretty_print, render_j2_template,
-                            get_charstring, import_metadata,
+                            get_charstring, get_mcf_validator,
+                            get_template_environment, import_metadata,
                             normalize_datestring, prune_distribution_formats,
                             prune_transfer_option, MCFReadError,
                             MCFValidationError, SCHEMAS, transform_metadata,
-                            validate_mcf)
-from pygeometa.helpers import json_dumps
+                            validate_mcf, warm_up)
+from pygeometa.helpers import (generate_datetime, get_json_options,
+                               get_now, group_contacts, json_dump,
+                               json_dumps, json_encode, json_iter,
+                               now_snapshot, set_json_options)
 from pygeometa.schemas import (get_supported_schemas, InvalidSchemaError,
                                load_schema)
+from pygeometa.schemas.dcat import (CONTEXT, DCATOutputSchema,
+                                    NTriplesEmitter)
 from pygeometa.schemas.iso19139 import ISO19139OutputSchema
 from pygeometa.schemas.ogcapi_records import OGCAPIRecordOutputSchema
+from pygeometa.schemas.openaire import get_scheme_key, process_keywords
+from pygeometa.schemas import schema_org
 from pygeometa.schemas.schema_org import _get_box_from_coords
+from pygeometa.schemas.stac import get_item_datetime, STACItemOutputSchema
+from pygeometa.server import (handle_request, is_running, RequestHandler,
+                              send_request, serve, Server)
 
 from sample_schema import SampleOutputSchema
 
@@ -175,6 +204,75 @@ class PygeometaTest(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             self.assertIsInstance(normalize_datestring(None), str)
 
+        with self.assertRaises(RuntimeError):
+            normalize_datestring(['2000'])
+
+        self.assertEqual(normalize_datestring(datetime.date(2000, 1, 2)),
+                         '2000-01-02')
+
+        dt = datetime.datetime(2001, 2, 3, 4, 5, 6,
+                               tzinfo=datetime.timezone.utc)
+        dt2 = dt.astimezone(datetime.timezone(datetime.timedelta(hours=1)))
+        self.assertEqual(normalize_datestring(dt), '2001-02-03T04:05:06Z')
+        self.assertEqual(normalize_datestring(dt2),
+                         dt2.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                         'Expected no memoized value of an equal instant')
+        self.assertEqual(normalize_datestring(datetime.date(1800, 1, 2)),
+                         '02.01.1800')
+        self.assertEqual(
+            normalize_datestring(datetime.datetime(2000, 1, 2, 3, 4, 5)),
+            '2000-01-02T03:04:05Z')
+        self.assertEqual(
+            normalize_datestring('$Date: 2000-01-02 03:04:05 $'),
+            '2000-01-02T03:04:05')
+        self.assertEqual(
+            normalize_datestring('© $Date: 2000-01-02 03:04:05 $ ACME',
+                                 'year'), '© 2000 ACME')
+
+        self.assertEqual(generate_datetime('2000'), '2000-01-01T00:00:00Z')
+        self.assertEqual(generate_datetime('2000-02'),
+                         '2000-02-01T00:00:00Z')
+        self.assertEqual(generate_datetime('2000-02-03T04:05:06+02:00'),
+                         '2000-02-03T02:05:06Z', 'Expected UTC')
+        with self.assertRaises(RuntimeError):
+            generate_datetime('not a date')
+
+    def test_now_snapshot(self):
+        """Test single current date-time per render or batch"""
+
+        now = datetime.datetime(2001, 2, 3, 4, 5, 6,
+                                tzinfo=datetime.timezone.utc)
+
+        with now_snapshot(now) as now2:
+            self.assertIs(now2, now, 'Expected snapshot')
+            self.assertEqual(normalize_datestring('$datetime$'),
+                             '2001-02-03T04:05:06Z')
+            self.assertEqual(normalize_datestring('© $year$'), '© 2001')
+            self.assertEqual(generate_datetime(None), '2001-02-03T04:05:06Z')
+
+            with now_snapshot() as now3:
+                self.assertIs(now3, now, 'Expected outermost snapshot')
+
+            mcf = read_mcf(get_abspath('nil-identification-language.mcf.yml'))
+            iso_os = ISO19139OutputSchema()
+            self.assertIn('2001-02-03', iso_os.write(mcf),
+                          'Expected snapshot date in record')
+
+            options = get_process_options()
+            self.assertIs(options['now'], now, 'Expected snapshot option')
+
+        self.assertNotEqual(get_now(), now, 'Expected current date-time')
+
+        with now_snapshot(now):
+            for jobs in [1, 2]:
+                with tempfile.TemporaryDirectory() as tmpdir:
+                    results = list(generate_batch(
+                        [get_abspath('nil-identification-language.mcf.yml')],
+                        schema='iso19139', outdir=tmpdir, jobs=jobs))
+                    with open(results[0]['output']) as fh:
+                        self.assertIn('2001-02-03', fh.read(),
+                                      'Expected batch snapshot date')
+
     def test_prune_distribution_formats(self):
         """Test deriving unique distribution formats"""
 
@@ -200,6 +298,16 @@ class PygeometaTest(unittest.TestCase):
 
         self.assertEqual(len(new_formats), 2,
                          'Expected 2 unique distribution formats')
+        self.assertEqual(new_formats[1], formats['wfs'],
+                         'Expected first occurrence order')
+
+        formats['wcs']['format'] = {'en': 'GRIB2', 'fr': 'GRIB2'}
+        formats['wps'] = dict(reversed(formats['wcs'].items()))
+
+        new_formats = prune_distribution_formats(formats)
+
+        self.assertEqual(len(new_formats), 3,
+                         'Expected 3 unique distribution formats')
 
     def test_prune_transfer_option(self):
         """Test deriving unique trasnfer options"""
@@ -343,6 +451,29 @@ class PygeometaTest(unittest.TestCase):
         self.assertEqual(
             len(mcf['facility']['first_station']['spatiotemporal']), 1)
 
+        mcf['facility']['second_station'] = dict(
+            mcf['facility']['first_station'], identifier='0-20000-0-456')
+
+        schema = load_schema('wmo-wigos')
+        fh = io.BytesIO()
+        schema.write_stream(mcf, fh)
+
+        def c14n(xml):
+            parser = etree.XMLParser(remove_blank_text=True)
+            return etree.tostring(etree.fromstring(xml, parser),
+                                  method='c14n', exclusive=True)
+
+        self.assertEqual(c14n(fh.getvalue()),
+                         c14n(schema.write(mcf).encode('utf-8')),
+                         'Expected streamed output equivalent to template')
+
+        root = etree.fromstring(fh.getvalue())
+        self.assertEqual(fh.getvalue().count(b'xmlns:'), len(root.nsmap),
+                         'Expected namespaces declared once')
+        for element in root.iterdescendants():
+            self.assertEqual(element.nsmap, root.nsmap,
+                             'Expected no namespace declarations below root')
+
     def test_19139_2(self):
         """test ISO 19139-2 Metadata support"""
 
@@ -363,6 +494,320 @@ class PygeometaTest(unittest.TestCase):
         record = OGCAPIRecordOutputSchema().write(mcf, stringify=False)
         self.assertIsInstance(record, dict)
 
+    def test_contact_consolidation(self):
+        """test consolidation of identical contacts with many roles"""
+
+        mcf = read_mcf(get_abspath('../sample.mcf.yml'))
+        poc = mcf['contact']['pointOfContact']
+
+        mcf['contact'] = {}
+        for i in range(200):
+            # equal (but not identical) contacts, with differing key order
+            contact = dict(reversed(poc.items())) if i % 2 else dict(poc)
+            contact['organization'] = f'Organization {i % 10}'
+            mcf['contact'][f'role{i}'] = contact
+
+        self.assertEqual(len(group_contacts(mcf['contact'])), 10,
+                         'Expected 10 distinct contacts')
+
+        record = OGCAPIRecordOutputSchema().write(mcf, stringify=False)
+        contacts = record['properties']['contacts']
+        self.assertEqual(len(contacts), 10, 'Expected 10 contacts')
+        self.assertEqual(contacts[0]['organization'], 'Organization 0',
+                         'Expected first occurrence order')
+        self.assertEqual(contacts[0]['roles'],
+                         [f'role{i}' for i in range(0, 200, 10)],
+                         'Expected roles in order')
+
+        record = load_schema('wmo-wcmp2').write(mcf, stringify=False)
+        self.assertEqual(len(record['properties']['contacts']), 10,
+                         'Expected 10 contacts')
+
+        for contact in mcf['contact'].values():
+            contact['role'] = 'pointOfContact'
+
+        record = load_schema('schema-org').write(mcf, stringify=False)
+        self.assertEqual(len(record['publisher']), 10,
+                         'Expected 10 publishers')
+
+    def test_json_serialization(self):
+        """test JSON serialization formats and backends"""
+
+        obj = {
+            'date': datetime.date(2000, 1, 1),
+            'datetime': datetime.datetime(2000, 1, 1, 12, 0, 0),
+            'decimal': Decimal('1.5'),
+            'bytes': b'\xff\xfe',
+            'text': 'température'
+        }
+
+        expected = {
+            'date': '2000-01-01',
+            'datetime': '2000-01-01T12:00:00',
+            'decimal': 1.5,
+            'bytes': '//4=',
+            'text': 'température'
+        }
+
+        pretty = json_dumps(obj)
+        self.assertIn('\n    "date"', pretty, 'Expected indentation')
+        self.assertEqual(json.loads(pretty), expected, 'Expected values')
+
+        compact = json_dumps(obj, compact=True)
+        self.assertNotIn(' ', compact.replace('température', ''),
+                         'Expected no whitespace')
+        self.assertEqual(json.loads(compact), expected, 'Expected values')
+
+        self.assertEqual(json_encode(obj, compact=True),
+                         compact.encode('utf-8'), 'Expected UTF-8 JSON')
+
+        fh = io.BytesIO()
+        json_dump(obj, fh, compact=True)
+        self.assertEqual(fh.getvalue(), compact.encode('utf-8'),
+                         'Expected UTF-8 JSON')
+
+        if helpers.orjson is None:
+            with self.assertRaises(RuntimeError):
+                json_dumps(obj, backend='orjson')
+        else:
+            self.assertEqual(json.loads(json_dumps(obj, backend='orjson')),
+                             expected, 'Expected values')
+            self.assertEqual(json_dumps(obj, compact=True, backend='auto'),
+                             compact, 'Expected identical compact JSON')
+
+        with self.assertRaises(ValueError):
+            json_dumps(obj, backend='foo')
+
+        options = get_json_options()
+        try:
+            set_json_options(compact=True)
+            mcf = read_mcf(get_abspath('../sample.mcf.yml'))
+            record = OGCAPIRecordOutputSchema().write(mcf)
+            self.assertNotIn('\n', record, 'Expected compact record')
+        finally:
+            set_json_options(**options)
+
+    def test_collection_writer(self):
+        """test streaming OARec collection writer"""
+
+        mcfs = []
+        for i in range(6):
+            mcf = read_mcf(get_abspath('../sample.mcf.yml'))
+            mcf['metadata']['identifier'] = f'record-{i}'
+            mcf['identification']['extents']['spatial'][0]['bbox'] = [
+                -10 - i, -5, 10 + i, 5 + i]
+            mcf['identification']['extents']['temporal'][0].update(
+                begin=f'200{i}-01-01', end=f'200{i}-12-31')
+            mcfs.append(mcf)
+
+        mcfs.insert(3, get_abspath('missing-version.mcf.yml'))
+
+        ids = [f'record-{i}' for i in range(6)]
+        schema = OGCAPIRecordOutputSchema()
+
+        for jobs in [1, 2]:
+            fh = io.BytesIO()
+            result = schema.write_collection(iter(mcfs), fh, jobs=jobs)
+            collection = json.loads(fh.getvalue())
+
+            self.assertEqual(collection['type'], 'FeatureCollection',
+                             'Expected FeatureCollection')
+            self.assertEqual([f['id'] for f in collection['features']], ids,
+                             'Expected records in input order')
+            self.assertEqual(collection['numberReturned'], 6,
+                             'Expected 6 records')
+            self.assertEqual(collection['bbox'], [-15, -5, 15, 10],
+                             'Expected collection bbox')
+            self.assertEqual(result['numberReturned'], 6,
+                             'Expected 6 records')
+            self.assertEqual(result['numberFailed'], 1,
+                             'Expected 1 failed record')
+            self.assertEqual(result['extent']['spatial']['bbox'],
+                             [[-15, -5, 15, 10]], 'Expected spatial extent')
+            self.assertEqual(result['extent']['temporal']['interval'],
+                             [['2000-01-01', '2005-12-31']],
+                             'Expected temporal extent')
+
+        fh = io.BytesIO()
+        result = schema.write_collection(mcfs, fh, ndjson=True)
+        lines = fh.getvalue().decode('utf-8').splitlines()
+        self.assertEqual([json.loads(line)['id'] for line in lines], ids,
+                         'Expected one record per line in input order')
+
+        fh = io.BytesIO()
+        result = schema.write_collection([], fh)
+        self.assertEqual(json.loads(fh.getvalue())['features'], [],
+                         'Expected empty FeatureCollection')
+        self.assertEqual(result['extent'], {}, 'Expected empty extent')
+
+    def test_stac_catalog(self):
+        """test static STAC catalog writer"""
+
+        mcfs = []
+        for i in range(4):
+            mcf = read_mcf(get_abspath('../sample.mcf.yml'))
+            mcf['metadata']['identifier'] = f'urn:x-test:{i}'
+            mcf['identification']['extents']['spatial'][0]['bbox'] = [
+                -10, -5 - i, 10 + i, 5]
+            mcfs.append(mcf)
+
+        item = STACItemOutputSchema().write(mcfs[0], stringify=False)
+        self.assertEqual(item['stac_version'], '1.0.0',
+                         'Expected STAC version')
+
+        ids = [f'urn_x-test_{i}' for i in range(4)]
+
+        for jobs in [1, 2]:
+            with tempfile.TemporaryDirectory() as directory:
+                result = STACItemOutputSchema().write_catalog(
+                    iter(mcfs), directory, 'sample', title='Sample',
+                    jobs=jobs)
+
+                self.assertEqual(result['numberReturned'], 4,
+                                 'Expected 4 items')
+
+                with open(os.path.join(directory, 'catalog.json')) as fh:
+                    catalog = json.load(fh)
+                self.assertEqual(catalog['links'][1]['href'],
+                                 './sample/collection.json',
+                                 'Expected child collection link')
+
+                collection_dir = os.path.join(directory, 'sample')
+                with open(os.path.join(collection_dir,
+                                       'collection.json')) as fh:
+                    collection = json.load(fh)
+
+                self.assertEqual(collection['type'], 'Collection',
+                                 'Expected Collection')
+                self.assertEqual(collection['extent']['spatial']['bbox'],
+                                 [[-10, -8, 13, 5]], 'Expected bbox')
+                self.assertEqual(
+                    collection['extent']['temporal']['interval'],
+                    [['1950-07-31T00:00:00Z', None]], 'Expected interval')
+
+                hrefs = [link['href'] for link in collection['links']
+                         if link['rel'] == 'item']
+                self.assertEqual(hrefs, [f'./{id_}/{id_}.json'
+                                         for id_ in ids],
+                                 'Expected item links in input order')
+
+                with open(os.path.join(collection_dir, hrefs[1])) as fh:
+                    item = json.load(fh)
+                self.assertEqual(item['id'], 'urn:x-test:1',
+                                 'Expected item identifier')
+                self.assertEqual(item['collection'], 'sample',
+                                 'Expected item collection')
+
+        # identifiers sharing a path, duplicates and records without a
+        # temporal extent
+        mcf = copy.deepcopy(mcfs[1])
+        mcf['metadata']['identifier'] = 'urn_x-test_1'
+        mcf['identification']['extents'].pop('temporal')
+        mcf['identification']['dates'] = {}
+        mcfs.extend([mcf, mcfs[2]])
+
+        with tempfile.TemporaryDirectory() as directory:
+            result = STACItemOutputSchema().write_catalog(
+                mcfs, directory, 'sample')
+
+            self.assertEqual(result['numberReturned'], 5, 'Expected 5 items')
+            self.assertEqual(result['numberFailed'], 1,
+                             'Expected duplicate skipped')
+
+            collection_dir = os.path.join(directory, 'sample')
+            with open(os.path.join(collection_dir, 'collection.json')) as fh:
+                collection = json.load(fh)
+
+            hrefs = [link['href'] for link in collection['links']
+                     if link['rel'] == 'item']
+            self.assertEqual(len(set(hrefs)), 5, 'Expected distinct paths')
+            self.assertTrue(hrefs[4].startswith('./urn_x-test_1-'),
+                            'Expected disambiguated path')
+
+            with open(os.path.join(collection_dir, hrefs[4])) as fh:
+                item = json.load(fh)
+            self.assertEqual(item['id'], 'urn_x-test_1',
+                             'Expected item identifier')
+            self.assertEqual(item['properties']['datetime'],
+                             '2014-11-11T00:00:00Z',
+                             'Expected datestamp as RFC3339 datetime')
+
+    def test_stac_item_datetime(self):
+        """test STAC Item datetime without a temporal extent"""
+
+        mcf = {
+            'metadata': {'datestamp': datetime.date(2014, 11, 11)},
+            'identification': {'dates': {'creation': '2014-11-11',
+                                         'revision': None}}
+        }
+        self.assertEqual(get_item_datetime(mcf), '2014-11-11T00:00:00Z',
+                         'Expected date-only value as RFC3339 datetime')
+
+        mcf['identification']['dates'] = {}
+        self.assertEqual(get_item_datetime(mcf), '2014-11-11T00:00:00Z',
+                         'Expected datestamp as RFC3339 datetime')
+
+    def test_dcat_catalog(self):
+        """test streaming DCAT catalog writer"""
+
+        mcfs = []
+        for i in range(3):
+            mcf = read_mcf(get_abspath('../sample.mcf.yml'))
+            mcf['metadata']['dataseturi'] = f'https://example.org/ds/{i}'
+            mcfs.append(mcf)
+
+        schema = DCATOutputSchema()
+        context = schema.write(mcfs[0], stringify=False)['@context']
+        self.assertEqual(context, CONTEXT, 'Expected context')
+        context['title_en']['@language'] = 'de'
+        self.assertEqual(
+            schema.write(mcfs[0], stringify=False)['@context']['title_en'],
+            {'@id': 'dct:title', '@language': 'en'},
+            'Expected context unchanged by caller')
+        self.assertEqual(json.loads(schema.write(mcfs[0]))['@context'],
+                         CONTEXT, 'Expected shared context serialized')
+
+        fh = io.BytesIO()
+        result = schema.write_catalog(
+            iter(mcfs), fh, catalog_uri='https://example.org/catalog',
+            title='Catalog')
+        catalog = json.loads(fh.getvalue())
+
+        self.assertEqual(result['numberReturned'], 3, 'Expected 3 datasets')
+        self.assertEqual(catalog['@context'], CONTEXT, 'Expected context')
+        self.assertEqual(catalog['@type'], 'dcat:Catalog',
+                         'Expected catalog')
+        self.assertEqual([ds['dataseturi'] for ds in catalog['dcat:dataset']],
+                         [f'https://example.org/ds/{i}' for i in range(3)],
+                         'Expected datasets in order')
+        self.assertNotIn('@context', catalog['dcat:dataset'][0],
+                         'Expected context once')
+
+        fh = io.BytesIO()
+        result = schema.write_catalog(
+            mcfs[:1], fh, catalog_uri='https://example.org/catalog',
+            rdf_format='ntriples')
+        triples = fh.getvalue().decode('utf-8').splitlines()
+
+        self.assertTrue(all(triple.endswith(' .') for triple in triples),
+                        'Expected N-Triples')
+        self.assertIn('<https://example.org/catalog> '
+                      '<http://www.w3.org/ns/dcat#dataset> '
+                      '<https://example.org/ds/0> .', triples,
+                      'Expected catalog dataset triple')
+        self.assertIn('<https://example.org/ds/0> '
+                      '<http://purl.org/dc/terms/accessRights> '
+                      '"otherRestrictions" .', triples,
+                      'Expected dataset literal triple')
+
+        self.assertEqual(
+            NTriplesEmitter().format_iri('https://example.org/a b<"c">'),
+            '<https://example.org/a%20b%3C%22c%22%3E>',
+            'Expected escaped IRI')
+
+        with self.assertRaises(ValueError):
+            schema.write_catalog(mcfs, io.BytesIO(), rdf_format='rdfxml')
+
     def test_output_schema(self):
         """test output schema"""
 
@@ -442,6 +887,104 @@ class PygeometaTest(unittest.TestCase):
             self.assertEqual(expected_bbox, result_bbox,
                              'Expected specific BBOX')
 
+    def test_schema_import_xpath(self):
+        """test XPath engine metadata schema import"""
+
+        schema = ISO19139OutputSchema()
+
+        with self.assertRaises(ValueError):
+            with open(get_abspath('md-SMJP01RJTD-gmd.xml')) as fh:
+                schema.import_(fh.read(), engine='404')
+
+        for filename in ['707a02ac-9240-4a2d-afbd-395b69756534.xml',
+                         'iso19139-no-bbox.xml',
+                         'md-SMJP01RJTD-gmd.xml',
+                         'x-wmo-md-int.wmo.wis.ISMD01EDZW.xml']:
+            with open(get_abspath(filename)) as fh:
+                metadata = fh.read()
+
+            self.assertEqual(schema.import_(metadata, engine='xpath'),
+                             schema.import_(metadata, engine='owslib'),
+                             'Expected identical MCF from both engines')
+
+        metadata = schema.write(read_mcf(get_abspath('../sample.mcf.yml')))
+
+        self.assertEqual(schema.import_(metadata, engine='xpath'),
+                         schema.import_(metadata, engine='owslib'),
+                         'Expected identical MCF from both engines')
+
+    def test_schema_import_iter(self):
+        """test streaming multi-record metadata schema import"""
+
+        schema = ISO19139OutputSchema()
+
+        records = []
+        for filename in ['md-SMJP01RJTD-gmd.xml',
+                         'x-wmo-md-int.wmo.wis.ISMD01EDZW.xml']:
+            with open(get_abspath(filename), 'rb') as fh:
+                records.append(fh.read())
+
+        # concatenated documents
+        with io.BytesIO(b'\n'.join(records)) as fh:
+            mcfs = list(schema.import_iter(fh))
+
+        self.assertEqual(len(mcfs), 2, 'Expected specific number of records')
+        self.assertEqual(
+            mcfs[0]['identification']['title'],
+            'WIS/GTS bulletin SMJP01 RJTD in FM12 SYNOP',
+            'Expected specific title')
+        self.assertEqual(mcfs[0], schema.import_(records[0].decode('utf-8')),
+                         'Expected identical MCF to single record import')
+
+        # CSW GetRecords response
+        csw_response = b''.join([
+            b'<?xml version="1.0" encoding="UTF-8"?>',
+            b'<csw:GetRecordsResponse xmlns:csw="http://www.opengis.net/cat/csw/2.0.2">',  # noqa
+            b'<csw:SearchResults>',
+            b''.join(r.split(b'?>', 1)[1] for r in records),
+            b'</csw:SearchResults>',
+            b'</csw:GetRecordsResponse>'
+        ])
+
+        with io.BytesIO(csw_response) as fh:
+            mcfs = list(schema.import_iter(fh))
+
+        self.assertEqual(len(mcfs), 2, 'Expected specific number of records')
+        self.assertEqual(
+            mcfs[1]['identification']['title'],
+            'GTS Bulletin: ISMD01 EDZW - Observational data (Binary coded) - BUFR (details are described in the abstract)',  # noqa
+            'Expected specific title')
+
+        # OAI-PMH ListRecords response, read a few bytes at a time so that
+        # declarations and tags are split across reads
+        class TrickleIO(io.BytesIO):
+            def read(self, size=-1):
+                return super().read(7)
+
+        oai_response = b''.join([
+            b'<?xml version="1.0" encoding="ISO-8859-1"?>',
+            b'<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">',
+            b'<ListRecords>',
+            b''.join(b'<record><header><identifier>' + str(i).encode() +
+                     b'</identifier></header><metadata>' +
+                     r.split(b'?>', 1)[1].replace(
+                         b'SMJP01', 'SMJP01 \xe9'.encode('utf-8')
+                     ).decode('utf-8').encode('iso-8859-1') +
+                     b'</metadata></record>'
+                     for i, r in enumerate(records)),
+            b'</ListRecords>',
+            b'</OAI-PMH>'
+        ])
+
+        with TrickleIO(oai_response) as fh:
+            mcfs = list(schema.import_iter(fh))
+
+        self.assertEqual(len(mcfs), 2, 'Expected specific number of records')
+        self.assertEqual(
+            mcfs[0]['identification']['title'],
+            'WIS/GTS bulletin SMJP01 \xe9 RJTD in FM12 SYNOP',
+            'Expected declared encoding')
+
     def test_import_metadata(self):
         """test metadata import"""
 
@@ -480,6 +1023,660 @@ class PygeometaTest(unittest.TestCase):
                 'title in English',
                 'Expected specific title')
 
+    def test_openaire_import_iter(self):
+        """test streaming multi-record openaire import"""
+
+        schema = load_schema('openaire')
+
+        with open(get_abspath('openaire.json')) as fh:
+            response = json.load(fh)
+
+        record = response['results'][0]
+        response['results'] = [record, record]
+
+        for chunk_size in [7, 65536]:
+            content = json.dumps(response, ensure_ascii=False)
+            with io.StringIO(content) as fh:
+                results = list(json_iter(fh, chunk_size=chunk_size))
+            self.assertEqual(results, response['results'],
+                             'Expected identical results')
+
+            with io.BytesIO(content.encode('utf-8')) as fh:
+                results = list(json_iter(fh, chunk_size=chunk_size))
+            self.assertEqual(results, response['results'],
+                             'Expected identical results')
+
+        # a record spanning many reads, with escapes and brackets in strings
+        class CountingIO(io.StringIO):
+            reads = 0
+
+            def read(self, size=-1):
+                self.reads += 1
+                return super().read(size)
+
+        record = {'values': [{'text': f'\\"[{i}]{{\\'} for i in range(5000)]}
+        with CountingIO(json.dumps({'results': [record, 1, 'a']})) as fh:
+            self.assertEqual(list(json_iter(fh, chunk_size=64)),
+                             [record, 1, 'a'], 'Expected large record')
+        self.assertLess(fh.reads, 50, 'Expected growing reads')
+
+        with io.StringIO('\n'.join(json.dumps(r) for r in [1, 2.5, {}])) as fh:  # noqa
+            self.assertEqual(list(json_iter(fh)), [1, 2.5, {}],
+                             'Expected JSON Lines results')
+
+        with io.StringIO(json.dumps(response)) as fh:
+            mcfs = list(schema.import_iter(fh))
+
+        self.assertEqual(len(mcfs), 2, 'Expected specific number of records')
+        self.assertEqual(
+            mcfs[1]['identification']['title'],
+            'Dataset to: Foundation for an Austrian NIR Soil Spectral Library for Soil Health Assessments',  # noqa
+            'Expected specific title')
+        self.assertEqual(mcfs[0], mcfs[1], 'Expected identical MCFs')
+
+        with open(get_abspath('openaire.json')) as fh:
+            content = fh.read()
+
+        mcf = import_metadata('openaire', content)
+        self.assertEqual(list(mcf['identification']['keywords']), ['keyword'],
+                         'Expected keyword group key from scheme name')
+        self.assertEqual(yaml.dump(mcf),
+                         yaml.dump(import_metadata('openaire', content)),
+                         'Expected identical MCF on re-import')
+
+        keywords = process_keywords([
+            {'subject': {'scheme': 'FOS', 'value': 'soil'}},
+            {'subject': {'scheme': 'fos', 'value': 'spectroscopy'}},
+            {'subject': {'scheme': None, 'value': 'NIR'}}
+        ], deterministic=True)
+        self.assertEqual(get_scheme_key('fos'), 'fos',
+                         'Expected key from scheme name')
+        self.assertTrue(get_scheme_key('FOS').startswith('fos-'),
+                        'Expected disambiguated key')
+        self.assertEqual(get_scheme_key(None), 'default',
+                         'Expected default key')
+        self.assertNotEqual(get_scheme_key('default'), 'default',
+                            'Expected reserved key disambiguated')
+        self.assertEqual(list(keywords),
+                         [get_scheme_key('FOS'), 'fos', 'default'],
+                         'Expected keys from scheme names')
+        self.assertEqual(keywords[get_scheme_key('FOS')]['keywords'],
+                         ['soil'], 'Expected specific keywords')
+
+    def test_csvw_import(self):
+        """test CSVW import type inference"""
+
+        rows = ['station,value,count,date,name,empty']
+        rows.extend(f'00{i},{i}.5,{i},2024-01-0{i % 9 + 1},n{i},'
+                    for i in range(100))
+        # mixed column types after the first chunk
+        rows.append('x,1,2e3,2024-01-01T00:00:00Z,1,')
+        content = '\n'.join(rows)
+
+        mcf = import_metadata('csvw', content)
+
+        types = {a['name']: a['type']
+                 for a in mcf['content_info']['attributes']}
+        self.assertEqual(types, {
+            'station': 'string',
+            'value': 'number',
+            'count': 'number',
+            'date': 'datetime',
+            'name': 'string',
+            'empty': 'string'
+        }, 'Expected specific types')
+
+        schema = load_schema('csvw')
+
+        with io.BytesIO(content.encode('utf-8')) as fh:
+            records = schema.import_iter(fh, sample_rows=50)
+            mcf = next(records)
+            del records
+            self.assertFalse(fh.closed, 'Expected caller file open')
+
+        types = {a['name']: a['type']
+                 for a in mcf['content_info']['attributes']}
+        self.assertEqual(types['count'], 'integer', 'Expected integer')
+        self.assertEqual(types['date'], 'date', 'Expected date')
+        self.assertEqual(types['station'], 'string',
+                         'Expected codes with leading zeros as strings')
+
+        with self.assertRaises(ValueError):
+            schema.import_('<?xml version="1.0"?><a/>')
+
+        with io.BytesIO(b'<a/>') as fh:
+            with self.assertRaises(ValueError):
+                next(schema.import_iter(fh))
+            self.assertFalse(fh.closed, 'Expected caller file open')
+
+    def test_generate_batch(self):
+        """test batch metadata generation"""
+
+        inputs = [get_abspath('../sample.mcf.yml'),
+                  get_abspath('unilingual.mcf.yml'),
+                  get_abspath('broken-yaml.mcf.yml')]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filelist = os.path.join(tmpdir, 'mcfs.txt')
+            with open(filelist, 'w') as fh:
+                fh.write('\n'.join(inputs[1:]))
+
+            paths = list(expand_inputs([inputs[0], f'@{filelist}',
+                                        get_abspath('unilingual.*')]))
+            self.assertEqual(paths, [pathlib.Path(i) for i in inputs],
+                             'Expected specific inputs')
+
+            paths = list(expand_inputs([THISDIR]))
+            self.assertIn(pathlib.Path(get_abspath('child.mcf.yml')), paths,
+                          'Expected MCF in directory')
+            self.assertNotIn(pathlib.Path(get_abspath('openaire.json')),
+                             paths, 'Expected only MCFs')
+
+            for jobs in [1, 2]:
+                outdir = os.path.join(tmpdir, f'jobs{jobs}')
+                results = list(generate_batch(
+                    inputs, schema='iso19139', outdir=outdir, jobs=jobs))
+
+                self.assertEqual([r['mcf'] for r in results], inputs,
+                                 'Expected results in input order')
+                self.assertEqual(
+                    results[0]['output'],
+                    os.path.join(outdir, '3f342f64-9348-11df-ba6a-0014c2c00eab.iso19139.xml'),  # noqa
+                    'Expected specific output filepath')
+                self.assertIsNone(results[0]['error'], 'Expected success')
+                self.assertIsNone(results[2]['output'], 'Expected failure')
+                self.assertIn('MCFReadError', results[2]['error'],
+                              'Expected specific error')
+
+                with open(results[0]['output']) as fh:
+                    self.assertIn('3f342f64-9348-11df-ba6a-0014c2c00eab',
+                                  fh.read(), 'Expected identifier')
+
+    def test_generate_batch_collision(self):
+        """test batch metadata generation of MCFs sharing an identifier"""
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            inputs = []
+            for name in ['a', 'b']:
+                inputs.append(os.path.join(tmpdir, f'{name}.mcf.yml'))
+                shutil.copy(get_abspath('../sample.mcf.yml'), inputs[-1])
+
+            for jobs in [1, 2]:
+                outdir = os.path.join(tmpdir, f'jobs{jobs}')
+                results = list(generate_batch(
+                    inputs, schema='iso19139', outdir=outdir, jobs=jobs))
+
+                self.assertEqual([r['status'] for r in results],
+                                 ['generated', 'generated'],
+                                 'Expected both generated')
+                self.assertEqual(
+                    [os.path.basename(r['output']) for r in results],
+                    ['3f342f64-9348-11df-ba6a-0014c2c00eab.iso19139.xml',
+                     '3f342f64-9348-11df-ba6a-0014c2c00eab.iso19139-2.xml'],
+                    'Expected unique output filepaths')
+                self.assertEqual(len(os.listdir(outdir)), 2,
+                                 'Expected one file per MCF')
+
+    def test_generate_batch_incremental(self):
+        """test incremental batch metadata generation"""
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for filename in ['deep-nest-child.mcf.yml',
+                             'deep-nest-parent.mcf.yml', 'contact.mcf.yml']:
+                shutil.copy(get_abspath(filename), tmpdir)
+
+            mcf = os.path.join(tmpdir, 'deep-nest-child.mcf.yml')
+            manifest = os.path.join(tmpdir, 'manifest.json')
+            outdir = os.path.join(tmpdir, 'output')
+
+            def generate():
+                results = list(generate_batch(
+                    [mcf], schema='iso19139', outdir=outdir,
+                    manifest=manifest))
+                self.assertEqual(len(results), 1, 'Expected one result')
+                return results[0]['status']
+
+            self.assertEqual(generate(), 'generated', 'Expected generated')
+            self.assertEqual(generate(), 'skipped', 'Expected skipped')
+
+            with open(manifest) as fh:
+                dependencies = json.load(fh)['records'][mcf]['dependencies']
+            self.assertEqual(len(dependencies), 3,
+                             'Expected MCF and base_mcf ancestors')
+
+            # changes to a grandparent MCF
+            with open(os.path.join(tmpdir, 'contact.mcf.yml'), 'a') as fh:
+                fh.write('\n# comment\n')
+            self.assertEqual(generate(), 'unchanged', 'Expected unchanged')
+
+            contact = os.path.join(tmpdir, 'contact.mcf.yml')
+            with open(contact) as fh:
+                content = fh.read().replace('Tom Kralidis', 'Jane Doe')
+            with open(contact, 'w') as fh:
+                fh.write(content)
+            self.assertEqual(generate(), 'generated', 'Expected generated')
+
+            os.remove(manifest)
+            self.assertEqual(generate(), 'unchanged', 'Expected unchanged')
+
+            # output overwritten since the manifest was written
+            with open(manifest) as fh:
+                output = json.load(fh)['records'][mcf]['output']
+            with open(output, 'w') as fh:
+                fh.write('<overwritten/>')
+            self.assertEqual(generate(), 'generated', 'Expected generated')
+            self.assertEqual(generate(), 'skipped', 'Expected skipped')
+
+    def test_warm_up(self):
+        """test warm-up of schemas, templates and validator"""
+
+        core._WARMED_SCHEMAS.clear()
+        get_template_environment.cache_clear()
+        get_mcf_validator.cache_clear()
+
+        warm_up(['iso19139', 'oarec-record'])
+
+        self.assertEqual(get_template_environment.cache_info().currsize, 1,
+                         'Expected one compiled template environment')
+        self.assertEqual(get_mcf_validator.cache_info().currsize, 1,
+                         'Expected validator to be built')
+
+        warm_up(['iso19139'])
+        self.assertEqual(get_template_environment.cache_info().hits, 0,
+                         'Expected schema to be warmed up once')
+
+        with self.assertRaises(InvalidSchemaError):
+            warm_up(['foo'])
+
+    def test_profiling(self):
+        """test stage profiling"""
+
+        with profiling.Profiler() as profiler:
+            mcf = read_mcf(get_abspath('../sample.mcf.yml'))
+            iso_os = ISO19139OutputSchema()
+            xml = iso_os.write(mcf)
+            load_schema('wmo-wcmp2').write(mcf)
+
+            with profiling.stage('custom', foo='bar') as stage:
+                stage.bytes = 10
+
+        self.assertFalse(profiling.is_enabled(), 'Expected no hooks')
+
+        stages = [record['stage'] for record in profiler.records]
+        for stage_ in ['yaml_load', 'merge_mcf', 'read_mcf',
+                       'render_j2_template', 'pretty_print', 'write',
+                       'json_dumps']:
+            self.assertIn(stage_, stages, 'Expected stage')
+
+        self.assertEqual(stages.count('write'), 2,
+                         'Expected nested writes to be accounted once')
+
+        summary = {stage_['stage']: stage_
+                   for stage_ in profiler.summary()}
+        self.assertEqual(summary['write[iso19139]']['bytes'],
+                         len(xml.encode('utf-8')), 'Expected output size')
+        self.assertIsNone(summary['read_mcf']['bytes'],
+                          'Expected no output size')
+        self.assertEqual(profiler.records[-1],
+                         {'stage': 'custom', 'wall': ANY, 'cpu': ANY,
+                          'bytes': 10, 'error': None, 'foo': 'bar'},
+                         'Expected custom stage record')
+
+        with profiling.Profiler() as profiler:
+            with self.assertRaises(MCFReadError):
+                read_mcf(get_abspath('missing-version.mcf.yml'))
+
+        self.assertEqual(profiler.records[-1]['error'], 'MCFReadError',
+                         'Expected error type')
+
+        jsonl = io.StringIO()
+        profiler.write_jsonl(jsonl)
+        records = [json.loads(line) for line in jsonl.getvalue().splitlines()]
+        self.assertEqual(records, profiler.records, 'Expected JSON lines')
+
+        table = io.StringIO()
+        profiler.write_summary(table)
+        self.assertTrue(table.getvalue().startswith('stage '),
+                        'Expected summary table header')
+
+        with profiling.stage('disabled') as stage:
+            stage.bytes = 10
+
+    def test_server(self):
+        """test metadata processing server"""
+
+        mcf = get_abspath('../sample.mcf.yml')
+
+        response = handle_request({'id': 1, 'action': 'validate',
+                                   'mcf': mcf})
+        self.assertEqual(response, {'id': 1, 'status': 'ok', 'result': True},
+                         'Expected valid MCF')
+
+        response = handle_request({'action': 'validate',
+                                   'mcf': get_abspath('bad-version.mcf.yml')})
+        self.assertEqual(response['status'], 'error', 'Expected error')
+        self.assertEqual(response['type'], 'MCFReadError',
+                         'Expected specific error type')
+
+        response = handle_request({'action': 'foo'})
+        self.assertEqual(response['error'], 'Unknown action foo',
+                         'Expected specific error')
+
+        response = handle_request({
+            'action': 'generate',
+            'mcf': get_abspath('nil-identification-language.mcf.yml'),
+            'schema': 'iso19139',
+            'now': '2001-02-03T04:05:06+00:00'
+        })
+        self.assertIn('2001-02-03', response['result'],
+                      'Expected client snapshot date in record')
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            socket_path = os.path.join(tmpdir, 'pygeometa.sock')
+            self.assertFalse(is_running(socket_path),
+                             'Expected no server running')
+
+            with open(socket_path, 'w') as fh:
+                fh.write('not a socket')
+            with self.assertRaises(RuntimeError):
+                serve(socket_path)
+            self.assertTrue(os.path.isfile(socket_path),
+                            'Expected regular file kept')
+            os.remove(socket_path)
+
+            with Server(socket_path, RequestHandler) as server:
+                thread = threading.Thread(target=server.serve_forever)
+                thread.start()
+
+                try:
+                    self.assertTrue(is_running(socket_path),
+                                    'Expected server running')
+
+                    response = send_request(socket_path, {
+                        'action': 'generate',
+                        'mcf': mcf,
+                        'schema': 'oarec-record'
+                    })
+                    self.assertEqual(response['status'], 'ok',
+                                     'Expected success')
+                    record = json.loads(response['result'])
+                    self.assertEqual(
+                        record['id'], '3f342f64-9348-11df-ba6a-0014c2c00eab',
+                        'Expected specific identifier')
+
+                    with open(get_abspath('md-SMJP01RJTD-gmd.xml')) as fh:
+                        response = send_request(socket_path, {
+                            'action': 'import',
+                            'metadata': fh.read()
+                        })
+                    self.assertEqual(
+                        response['result']['identification']['title'],
+                        'WIS/GTS bulletin SMJP01 RJTD in FM12 SYNOP',
+                        'Expected specific title')
+                finally:
+                    server.shutdown()
+                    thread.join()
+
+    def test_generate_batch_archive(self):
+        """test batch metadata generation into archives"""
+
+        inputs = [get_abspath('deep-nest-child.mcf.yml'),
+                  get_abspath('../sample.mcf.yml')]
+        expected = ['MYID.iso19139.xml',
+                    '3f342f64-9348-11df-ba6a-0014c2c00eab.iso19139.xml',
+                    'index.json']
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for filename in ['catalogue.zip', 'catalogue.tar.gz']:
+                archive = os.path.join(tmpdir, filename)
+                contents = []
+
+                for jobs in [1, 2]:
+                    results = list(generate_batch(
+                        inputs, schema='iso19139', jobs=jobs,
+                        output_archive=archive, archive_index=True))
+
+                    self.assertEqual(results[0]['output'], expected[0],
+                                     'Expected specific entry name')
+
+                    with open(archive, 'rb') as fh:
+                        contents.append(fh.read())
+
+                self.assertEqual(contents[0], contents[1],
+                                 'Expected deterministic archive')
+
+                if filename.endswith('.zip'):
+                    with zipfile.ZipFile(archive) as zf:
+                        names = zf.namelist()
+                        index = json.loads(zf.read('index.json'))
+                else:
+                    with tarfile.open(archive) as tf:
+                        names = tf.getnames()
+                        index = json.load(tf.extractfile('index.json'))
+
+                self.assertEqual(names, expected, 'Expected ordered entries')
+                self.assertEqual(index['MYID'], expected[0],
+                                 'Expected specific index entry')
+
+            with ArchiveWriter(os.path.join(tmpdir, 'a.tgz')) as archive:
+                archive.add('a.xml', '<a/>')
+                with self.assertRaises(ValueError):
+                    archive.add('a.xml', '<a/>')
+
+            with self.assertRaises(ValueError):
+                ArchiveWriter(os.path.join(tmpdir, 'a.rar'))
+
+            with open(get_abspath('md-SMJP01RJTD-gmd.xml')) as fh:
+                lines = json.dumps(fh.read())
+
+            archive = os.path.join(tmpdir, 'catalogue.tar')
+            with io.StringIO(lines) as fh:
+                results = list(transform_ndjson(
+                    fh, 'iso19139', 'oarec-record', output_archive=archive))
+
+            self.assertIsNone(results[0]['error'], 'Expected success')
+
+            with tarfile.open(archive) as tf:
+                names = tf.getnames()
+                record = json.load(tf.extractfile(names[0]))
+
+            self.assertEqual(
+                names,
+                ['urn_x-wmo_md_int.wmo.wis_SMJP01RJTD.oarec-record.json'],
+                'Expected specific entries')
+            self.assertEqual(record['id'],
+                             'urn:x-wmo:md:int.wmo.wis::SMJP01RJTD',
+                             'Expected specific identifier')
+
+    def test_transform_ndjson(self):
+        """test NDJSON streaming metadata transformation"""
+
+        with open(get_abspath('md-SMJP01RJTD-gmd.xml')) as fh:
+            xml = fh.read()
+
+        with self.assertRaises(RuntimeError):
+            transform_metadata('iso19139', 'oarec-record', 'foo',
+                               raise_errors=True)
+
+        lines = [json.dumps(xml), 'foo', '', json.dumps(xml)]
+
+        for jobs in [1, 2]:
+            with io.StringIO('\n'.join(lines)) as fh:
+                results = list(transform_ndjson(
+                    fh, 'iso19139', 'oarec-record', jobs=jobs))
+
+            self.assertEqual([r['line'] for r in results], [1, 2, 4],
+                             'Expected results in input order')
+            self.assertIsNone(results[0]['error'], 'Expected success')
+            self.assertEqual(json.loads(results[2]['output'])['id'],
+                             'urn:x-wmo:md:int.wmo.wis::SMJP01RJTD',
+                             'Expected specific identifier')
+            self.assertNotIn('\n', results[2]['output'],
+                             'Expected single line output')
+            self.assertIsNone(results[1]['output'], 'Expected failure')
+            self.assertEqual(results[1]['type'], 'JSONDecodeError',
+                             'Expected specific error type')
+
+        with io.StringIO(json.dumps(xml)) as fh:
+            results = list(transform_ndjson(fh, 'iso19139', 'iso19139'))
+
+        self.assertTrue(json.loads(results[0]['output']).startswith('<?xml'),
+                        'Expected XML output as JSON string')
+
+    def test_response_cache(self):
+        """test response cache"""
+
+        key = get_cache_key('generate', {'b': 1, 'a': 2}, 'iso19139')
+        self.assertEqual(
+            key, get_cache_key('generate', {'a': 2, 'b': 1}, 'iso19139'),
+            'Expected canonical key')
+        self.assertNotEqual(
+            key, get_cache_key('generate', {'a': 2, 'b': 1}, 'dcat'),
+            'Expected different key')
+
+        calls = []
+
+        def func(value):
+            calls.append(value)
+            return ['application/json', {'value': value}]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for storage in [None, DiskStorage(tmpdir)]:
+                calls.clear()
+                cache = ResponseCache(maxsize=2, storage=storage)
+
+                for value in ['a', 'b', 'a', 'c', 'b']:
+                    result = cache.get_or_set(value, lambda: func(value))
+                    self.assertEqual(result[1], {'value': value},
+                                     'Expected specific value')
+
+                # b evicted as least recently used when c was added
+                self.assertEqual(calls, ['a', 'b', 'c', 'b'],
+                                 'Expected LRU eviction')
+                self.assertEqual(cache.stats(), {
+                    'hits': 1, 'misses': 4, 'evictions': 2, 'size': 2,
+                    'maxsize': 2
+                }, 'Expected specific statistics')
+
+            # entries persist on disk across cache instances
+            self.assertEqual(
+                sorted(p.name for p in pathlib.Path(tmpdir).iterdir()),
+                ['b.json', 'c.json'], 'Expected entry files only')
+            cache = ResponseCache(maxsize=2, storage=DiskStorage(tmpdir))
+            self.assertEqual(cache.get('c'), func('c'),
+                             'Expected persisted entry')
+
+            # non-JSON types are serialized rather than failing
+            cache.set('d', {'date': datetime.date(2000, 1, 2)})
+            self.assertEqual(cache.get('d'), {'date': '2000-01-02'},
+                             'Expected serialized date')
+            cache.set('e', {'value': object()})
+            self.assertIsNone(cache.get('e'), 'Expected skipped entry')
+            self.assertFalse(any(p.name.startswith('.')
+                                 for p in pathlib.Path(tmpdir).iterdir()),
+                             'Expected no temporary files')
+
+        # cached values are not shared with callers
+        cache = ResponseCache()
+        value = {'value': 'a'}
+        cache.set('a', value)
+        value['value'] = 'b'
+        cache.get('a')['value'] = 'c'
+        self.assertEqual(cache.get('a'), {'value': 'a'},
+                         'Expected unchanged value')
+
+        cache = ResponseCache(ttl=0)
+        cache.set('a', 1)
+        self.assertIsNone(cache.get('a'), 'Expected expired entry')
+
+        self.assertIsNone(get_cache(None), 'Expected no cache')
+        self.assertIs(get_cache({'maxsize': 10}), get_cache({'maxsize': 10}),
+                      'Expected shared cache')
+
+        cache = get_cache(True)
+        self.assertIsInstance(cache.storage, MemoryStorage,
+                              'Expected default in-memory cache')
+        self.assertEqual(cache.maxsize, 128, 'Expected default maxsize')
+        self.assertIsNone(get_cache(False), 'Expected no cache')
+        for config in ['yes', {'max_size': 10}]:
+            with self.assertRaises(ValueError):
+                get_cache(config)
+
+    def test_pygeoapi_batch(self):
+        """test pygeoapi plugin batch generation"""
+
+        # pygeoapi is optional, so stand in a minimal process base
+        class BaseProcessor:
+            def __init__(self, processor_def, metadata):
+                self.processor_def = processor_def
+                self.metadata = metadata
+
+        base = types.ModuleType('pygeoapi.process.base')
+        base.BaseProcessor = BaseProcessor
+        base.ProcessorExecuteError = type('ProcessorExecuteError',
+                                          (Exception,), {})
+
+        with patch.dict(sys.modules, {'pygeoapi.process.base': base}):
+            sys.modules.pop('pygeometa.pygeoapi_plugin', None)
+            from pygeometa.pygeoapi_plugin import (
+                PygeometaMetadataGenerateProcessor)
+
+            processor = PygeometaMetadataGenerateProcessor({
+                'name': 'pygeometa-metadata-generate', 'max_workers': 3})
+
+            mcf = read_mcf(get_abspath('nil-identification-language.mcf.yml'))
+            mcfs = []
+            for i in range(8):
+                mcf_ = copy.deepcopy(mcf)
+                mcf_['metadata']['identifier'] = f'record-{i}'
+                mcfs.append(mcf_)
+            mcfs.insert(4, {'mcf': {'version': '1.0'}})
+            mcfs.append({'mcf': {'version': '1.0'},
+                         'metadata': {'identifier': 'broken'}})
+
+            now = datetime.datetime(2001, 2, 3, 4, 5, 6,
+                                    tzinfo=datetime.timezone.utc)
+            with now_snapshot(now):
+                mimetype, response = processor.execute({
+                    'mcfs': mcfs, 'schemas': ['iso19139', 'dcat']
+                })
+
+            self.assertEqual(mimetype, 'application/json')
+            self.assertEqual(list(response), [
+                'record-0', 'record-1', 'record-2', 'record-3', 'mcf-4',
+                'record-4', 'record-5', 'record-6', 'record-7', 'broken'
+            ], 'Expected results in input order')
+
+            self.assertIn('Invalid MCF', response['mcf-4']['error'],
+                          'Expected record error')
+            for identifier in ['record-0', 'record-7']:
+                result = response[identifier]
+                self.assertIn('2001-02-03', result['iso19139']['value'],
+                              'Expected snapshot date in worker thread')
+                self.assertEqual(result['dcat']['mimetype'],
+                                 'application/json')
+            self.assertIn('Generation error',
+                          response['broken']['iso19139']['error'],
+                          'Expected schema error')
+
+            mcfs = []
+            for identifier in ['mcf-2', 'x', 'x', 'mcf-2-2']:
+                mcf_ = copy.deepcopy(mcf)
+                mcf_['metadata']['identifier'] = identifier
+                mcfs.append(mcf_)
+
+            _, response = processor.execute({
+                'mcfs': mcfs, 'schemas': ['iso19139']
+            })
+            self.assertEqual(list(response), ['mcf-2', 'x', 'mcf-2-2',
+                                              'mcf-3'],
+                             'Expected unique keys of duplicates')
+
+            with self.assertRaises(base.ProcessorExecuteError):
+                processor.execute({'mcfs': mcfs, 'schemas': ['foo']})
+
+        sys.modules.pop('pygeometa.pygeoapi_plugin', None)
+
     def test_empty_extents(self):
         # do not fail on empty elements
         schema = ISO19139OutputSchema()
@@ -548,6 +1745,26 @@ class PygeometaTest(unittest.TestCase):
             "polygon": "2 1 4 1 2 3 4 3 2 1"
         }
         self.assertEqual(_get_box_from_coords(geo3), [1, 2, 3, 4])
+        geo4 = {
+            "@type": "GeoShape",
+            "line": "2 1, 4 5"
+        }
+        self.assertEqual(_get_box_from_coords(geo4), [1, 2, 5, 4])
+        geo5 = [geo2, {
+            "@type": "GeoShape",
+            "polygon": ["-2 1,4 1,2 3,-2 1", "10 -1 11 -1 10 0 10 -1"]
+        }]
+        self.assertEqual(_get_box_from_coords(geo5), [-1, -2, 3, 11])
+        self.assertIsNone(_get_box_from_coords({"polygon": "2 1,4"}))
+        self.assertIsNone(_get_box_from_coords({"polygon": "2 a"}))
+        self.assertIsNone(_get_box_from_coords({"@type": "GeoShape"}))
+
+        numpy = schema_org.numpy
+        try:
+            schema_org.numpy = None
+            self.assertEqual(_get_box_from_coords(geo5), [-1, -2, 3, 11])
+        finally:
+            schema_org.numpy = numpy
 
 
 def get_abspath(filepath):